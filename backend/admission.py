@@ -0,0 +1,112 @@
+"""Queue-depth admission control for synthesis submissions.
+
+Without a bound, a burst grows the queue indefinitely and every job's
+latency degrades together.  Before a job is accepted, its lane's live
+backlog and measured throughput are compared with the limits in
+``AdmissionConfig``:
+
+* backlog at or above ``<lane>_max_queue_depth`` → **503** (the lane is
+  saturated);
+* predicted wait above ``<lane>_max_wait_seconds`` → **429** (accepting
+  would break the lane's latency target).
+
+Rejections carry a ``Retry-After`` estimated from the throughput.
+Accepted jobs get an estimated completion time.  Throughput comes from
+the per-lane completion counters written by the workers (see
+``backend.metrics``).  Until any have been recorded, it is approximated
+as one worker running ``LimitsConfig.max_concurrent_jobs`` jobs of the
+submitted job's estimated cost.
+
+The backlog counts the lane's shared queue and the workers' personal
+queues for it (see ``backend.workers.affinity``).  The personal queues
+are those known at the previous read, so that one pipeline suffices; a
+new worker's queue is counted from the next submission on.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from backend import metrics
+from backend.config import AdmissionConfig, get_config
+from backend.redis_client import get_async_redis
+from backend.workers import affinity
+from backend.workers.routing import INTERACTIVE_QUEUE, Route, priority_queue_keys
+
+# Personal queues seen by the previous read.
+_personal_queues: set[str] = set()
+
+
+@dataclass(frozen=True)
+class LaneLoad:
+    """Live backlog and recent throughput of one latency lane."""
+
+    queue: str
+    depth: int
+    throughput: float  # completions per second; 0 when nothing was measured
+
+
+@dataclass(frozen=True)
+class Admission:
+    """Outcome of an admission check."""
+
+    accepted: bool
+    estimated_wait_seconds: float
+    status_code: int | None = None
+    retry_after_seconds: int | None = None
+
+
+async def read_lane_load(queue: str) -> LaneLoad:
+    """Read *queue*'s depth (all priority lists, one pipeline) and throughput."""
+    global _personal_queues
+    cfg = get_config().admission
+    queues = [queue] + sorted(q for q in _personal_queues if q.startswith(queue + "."))
+    pipe = get_async_redis().pipeline(transaction=False)
+    pipe.smembers(affinity.PERSONAL_QUEUES_KEY)
+    for key in (k for q in queues for k in priority_queue_keys(q)):
+        pipe.llen(key)
+    personal, *lengths = await pipe.execute()
+    _personal_queues = set(personal)
+    depth = sum(lengths)
+    throughput = await metrics.read_throughput([queue], cfg.throughput_window_seconds)
+    return LaneLoad(queue=queue, depth=depth, throughput=throughput[queue])
+
+
+def assess(load: LaneLoad, route: Route) -> Admission:
+    """Decide whether a job routed as *route* may join *load*'s lane."""
+    cfg = get_config().admission
+    max_depth, max_wait = _lane_limits(cfg, route.lane)
+
+    throughput = load.throughput
+    if throughput <= 0:
+        concurrency = max(1, get_config().limits.max_concurrent_jobs)
+        throughput = concurrency / max(route.estimated_cost_seconds, 1e-3)
+    wait = load.depth / throughput
+
+    if load.depth >= max_depth:
+        drain = (load.depth - max_depth + 1) / throughput
+        return Admission(
+            accepted=False,
+            estimated_wait_seconds=wait,
+            status_code=503,
+            retry_after_seconds=_clamp_retry_after(drain, cfg),
+        )
+    if wait > max_wait:
+        return Admission(
+            accepted=False,
+            estimated_wait_seconds=wait,
+            status_code=429,
+            retry_after_seconds=_clamp_retry_after(wait - max_wait, cfg),
+        )
+    return Admission(accepted=True, estimated_wait_seconds=wait)
+
+
+def _lane_limits(cfg: AdmissionConfig, queue: str) -> tuple[int, float]:
+    if queue == INTERACTIVE_QUEUE:
+        return cfg.interactive_max_queue_depth, cfg.interactive_max_wait_seconds
+    return cfg.bulk_max_queue_depth, cfg.bulk_max_wait_seconds
+
+
+def _clamp_retry_after(seconds: float, cfg: AdmissionConfig) -> int:
+    return max(1, min(cfg.max_retry_after_seconds, math.ceil(seconds)))
@@ -0,0 +1,93 @@
+"""Cooperative cancellation of synthesis jobs.
+
+``DELETE /jobs/{id}`` marks the job ``CANCELLED``, revokes its Celery
+task (a worker that receives a revoked task drops it unstarted) and sets
+the Redis flag ``awaaztwin:jobs:<id>:cancel``.  A task that is already
+running cannot be interrupted from outside.  Instead the worker checks
+the flag before starting, between segments, and whenever the engine
+adapter calls ``raise_if_cancelled()`` – adapters with a decoder loop
+should do so between steps.  A cancelled task stops with
+``JobCancelled`` and is never retried.
+
+Compute saved is estimated with the routing cost model: the whole job
+for one cancelled while queued, the unfinished share of it for one
+cancelled while running (see ``backend.metrics``).
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import time
+
+from redis.exceptions import RedisError
+
+from backend.config import get_config
+from backend.redis_client import KEY_PREFIX, get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+_FLAG_KEY = KEY_PREFIX + "jobs:{job_id}:cancel"
+
+# Job run by the current task, and when its flag was last read.
+_current: contextvars.ContextVar[tuple[str, list[float]] | None] = contextvars.ContextVar(
+    "cancellation_current", default=None
+)
+
+
+class JobCancelled(Exception):
+    """The running job was cancelled by its owner.
+
+    ``remaining_fraction`` is the share of the job's work that was not
+    done, for the compute-saved estimate.
+    """
+
+    def __init__(self, job_id: str, remaining_fraction: float = 1.0) -> None:
+        super().__init__(f"Job {job_id} was cancelled")
+        self.job_id = job_id
+        self.remaining_fraction = remaining_fraction
+
+
+async def request_cancel(job_id: str) -> None:
+    """Flag *job_id* so that a worker running it stops (API side)."""
+    await get_async_redis().set(
+        _FLAG_KEY.format(job_id=job_id), 1, ex=get_config().cancellation.flag_ttl_seconds
+    )
+
+
+def is_cancelled(job_id: str) -> bool:
+    """Whether *job_id* was cancelled; ``False`` if Redis is unavailable."""
+    try:
+        return bool(get_redis().exists(_FLAG_KEY.format(job_id=job_id)))
+    except RedisError:
+        logger.warning("Could not read cancellation flag of job %s", job_id, exc_info=True)
+        return False
+
+
+def watch(job_id: str) -> None:
+    """Make *job_id* the job checked by ``raise_if_cancelled`` (worker side).
+
+    Called when a task starts; the binding is per thread, so it holds for
+    the task body and the engine code it calls.
+    """
+    _current.set((job_id, [time.monotonic()]))
+
+
+def raise_if_cancelled(progress: float | None = None, *, force: bool = False) -> None:
+    """Raise ``JobCancelled`` if the current job was cancelled.
+
+    Cheap enough to call between decoder steps: the flag is read at most
+    once per ``check_interval_seconds`` unless *force* is set.  *progress*
+    (0–1) is the share of the job already done, if the caller knows it.
+    Before any ``watch()`` this does nothing.
+    """
+    current = _current.get()
+    if current is None:
+        return
+    job_id, last_check = current
+    now = time.monotonic()
+    if not force and now - last_check[0] < get_config().cancellation.check_interval_seconds:
+        return
+    last_check[0] = now
+    if is_cancelled(job_id):
+        raise JobCancelled(job_id, 1.0 - (progress or 0.0))
@@ -0,0 +1,117 @@
+"""Single-flight coalescing of identical synthesis submissions.
+
+Portal retries and bursts of users asking for the same prompt would
+otherwise each enqueue a task doing identical work.  Instead, the first
+submission *claims* a Redis marker keyed on everything that determines
+the output – engine, voice, normalised text and params – and stores its
+job ID there.  Identical submissions that arrive while the marker exists
+are attached to that job and get its result when it completes.
+
+The worker releases the marker once the job has finished (successfully
+or for good), so later submissions start a fresh job.  Markers carry a
+TTL so that a worker crash can never pin a key forever.
+
+A successful job also leaves a *result* entry under the same digest,
+pointing at its output object.  A job that expires before a worker gets
+to it is completed from that entry instead of being dropped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import unicodedata
+import uuid
+from typing import Any
+
+from backend.redis_client import KEY_PREFIX, get_async_redis, get_redis
+
+_MARKER_KEY = KEY_PREFIX + "inflight:{digest}"
+_RESULT_KEY = KEY_PREFIX + "result:{digest}"
+
+# Delete the marker only if it still names our job, so a late release
+# can never drop a marker that a newer job has taken over.
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalise_text(text: str) -> str:
+    """Canonicalise *text* so trivially different submissions coalesce.
+
+    Applies Unicode NFC (Devanagari in particular has several encodings
+    of the same glyphs) and collapses runs of whitespace.  Case and
+    punctuation are kept: both change the synthesised prosody.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def coalesce_key(
+    engine_name: str,
+    voice_profile_id: uuid.UUID | str,
+    text: str,
+    params: dict[str, Any] | None,
+) -> str:
+    """Return the Redis marker key for a synthesis request."""
+    canonical = json.dumps(
+        [engine_name, str(voice_profile_id), normalise_text(text), params or {}],
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        default=str,
+    )
+    digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    return _MARKER_KEY.format(digest=digest)
+
+
+async def claim(key: str, job_id: str, ttl_seconds: int) -> str | None:
+    """Try to make *job_id* the in-flight job for *key*.
+
+    Returns ``None`` if the claim succeeded, otherwise the ID of the job
+    already holding the marker.
+    """
+    redis = get_async_redis()
+    if await redis.set(key, job_id, nx=True, ex=ttl_seconds):
+        return None
+    holder = await redis.get(key)
+    if holder is None:
+        # The holder released between our SET and GET – try once more.
+        if await redis.set(key, job_id, nx=True, ex=ttl_seconds):
+            return None
+        holder = await redis.get(key)
+    return holder
+
+
+async def take_over(key: str, job_id: str, ttl_seconds: int) -> None:
+    """Unconditionally point *key* at *job_id* (the previous holder is dead)."""
+    await get_async_redis().set(key, job_id, ex=ttl_seconds)
+
+
+async def release_async(key: str, job_id: str) -> None:
+    """Release *key* if *job_id* still holds it (API side)."""
+    await get_async_redis().eval(_RELEASE_SCRIPT, 1, key, job_id)
+
+
+def release(key: str, job_id: str) -> None:
+    """Release *key* if *job_id* still holds it (worker side)."""
+    get_redis().eval(_RELEASE_SCRIPT, 1, key, job_id)
+
+
+def _result_key(key: str) -> str:
+    return _RESULT_KEY.format(digest=key.rpartition(":")[2])
+
+
+def remember_result(key: str, output_storage_key: str, ttl_seconds: int) -> None:
+    """Record the output of the finished job for *key* (worker side)."""
+    get_redis().set(_result_key(key), output_storage_key, ex=ttl_seconds)
+
+
+def lookup_result(key: str) -> str | None:
+    """Return the output storage key of an earlier identical job, if any."""
+    return get_redis().get(_result_key(key))
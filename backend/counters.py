@@ -0,0 +1,109 @@
+"""Row counts per status, maintained incrementally for ``/admin/metrics``.
+
+Each table keeps a Redis hash ``awaaztwin:counters:<table>`` of status
+-> row count.  Whoever inserts a row or changes its status reports the
+transition once the change is committed, so the dashboard reads two
+small hashes instead of running ``COUNT(*) ... GROUP BY status`` over
+tables with millions of rows.
+
+A lost report (Redis down, or a crash between commit and report) skews
+a count until the maintenance worker's ``reconcile_counters`` recounts
+the tables and overwrites the hashes.
+"""
+
+from __future__ import annotations
+
+import enum
+import logging
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from backend.redis_client import KEY_PREFIX, get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+_COUNTS_KEY = KEY_PREFIX + "counters:{table}"
+
+
+def _key(model: Any) -> str:
+    return _COUNTS_KEY.format(table=model.__tablename__)
+
+
+def _move(pipe, model: Any, old: enum.Enum | None, new: enum.Enum, n: int) -> None:  # noqa: ANN001
+    key = _key(model)
+    if old is not None:
+        pipe.hincrby(key, old.value, -n)
+    pipe.hincrby(key, new.value, n)
+
+
+def transition(model: Any, old: enum.Enum | None, new: enum.Enum, n: int = 1) -> None:
+    """Move *n* rows of *model* from status *old* to *new*.
+
+    Pass ``old=None`` for newly inserted rows.  The two increments run in
+    one ``MULTI`` so readers never see a row counted twice or not at all.
+    """
+    if old == new or n <= 0:
+        return
+    try:
+        pipe = get_redis().pipeline()
+        _move(pipe, model, old, new, n)
+        pipe.execute()
+    except RedisError:
+        logger.warning("Could not update %s counters", model.__tablename__, exc_info=True)
+
+
+async def transition_async(
+    model: Any, old: enum.Enum | None, new: enum.Enum, n: int = 1
+) -> None:
+    """``transition`` for the API."""
+    if old == new or n <= 0:
+        return
+    try:
+        pipe = get_async_redis().pipeline()
+        _move(pipe, model, old, new, n)
+        await pipe.execute()
+    except RedisError:
+        logger.warning("Could not update %s counters", model.__tablename__, exc_info=True)
+
+
+def discard(model: Any, counts: dict[str, int]) -> None:
+    """Remove rows of *model* deleted in bulk: status -> number of rows."""
+    counts = {status: n for status, n in counts.items() if n > 0}
+    if not counts:
+        return
+    try:
+        pipe = get_redis().pipeline()
+        for status, n in counts.items():
+            pipe.hincrby(_key(model), status, -n)
+        pipe.execute()
+    except RedisError:
+        logger.warning("Could not update %s counters", model.__tablename__, exc_info=True)
+
+
+async def read_counts(*models: Any) -> list[dict[str, int]]:
+    """Return status -> count for each of *models*, in one round trip."""
+    pipe = get_async_redis().pipeline(transaction=False)
+    for model in models:
+        pipe.hgetall(_key(model))
+    results = await pipe.execute()
+    # A lost increment can leave a count briefly negative until reconciled.
+    return [{status: max(0, int(n)) for status, n in counts.items()} for counts in results]
+
+
+def reset(model: Any, counts: dict[str, int]) -> dict[str, int]:
+    """Overwrite *model*'s counters with *counts* (from a recount).
+
+    Returns:
+        The drift that was corrected, per status (counted - stored).
+    """
+    key = _key(model)
+    pipe = get_redis().pipeline()
+    pipe.hgetall(key)
+    pipe.delete(key)
+    if counts:
+        pipe.hset(key, mapping=counts)
+    stored = pipe.execute()[0]
+    statuses = set(stored) | set(counts)
+    drift = {s: counts.get(s, 0) - int(stored.get(s, 0)) for s in statuses}
+    return {s: d for s, d in drift.items() if d}
@@ -1,21 +1,128 @@
-"""Async SQLAlchemy engine & session setup for AwaazTwin."""
+"""Async SQLAlchemy engine & session setup for AwaazTwin.
+
+The API's engine pools connections as configured under ``database``
+(see ``DatabaseConfig``) and records how long requests wait for one;
+``pool_stats()`` reports both for ``/admin/metrics``.
+
+Handlers that write use ``get_db``, which commits at the end of the
+request.  Handlers that only read use ``get_read_db``: its session runs
+in autocommit mode, so a request pays neither ``BEGIN`` nor ``COMMIT``.
+
+With ``database.replica_urls`` set, read-only sessions go to the
+replicas in turn.  Each replica is health-checked (``SELECT 1``) at most
+every ``replica_health_check_seconds``; one that fails is skipped until
+a later check passes, and reads fall back to the primary while none is
+healthy.  Lookups of a single job, batch or voice – which clients make
+right after creating one – use ``get_primary_read_db`` instead, so they
+never 404 on a replica that lags behind.  A request through ``get_db``
+also sets a cookie that pins a browser client to the primary for
+``read_your_writes_seconds``, which keeps its listings consistent too.
+"""
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import asyncio
+import dataclasses
+import functools
+import itertools
+import logging
+import math
+import threading
+import time
+import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any, TypeVar
 
+from fastapi import Response
+from sqlalchemy import exc, make_url, text
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from starlette.requests import HTTPConnection
+
+from backend.config import DatabaseConfig, get_config
+from backend.schemas import DatabasePoolStats
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+#: Cookie that pins a client that just wrote to the primary.
+PRIMARY_PIN_COOKIE = "awaaztwin_read_primary"
+
+
+def _connect_args(cfg: DatabaseConfig) -> dict[str, Any]:
+    """asyncpg connection arguments for the statement cache settings."""
+    if cfg.pgbouncer:
+        # PgBouncer in transaction mode hands each transaction to any server
+        # connection: a statement prepared on one is unknown on the next, and
+        # generated names would collide.
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return {
+        "statement_cache_size": cfg.statement_cache_size,
+        "prepared_statement_cache_size": cfg.statement_cache_size,
+    }
+
+
+class _PoolWaits:
+    """Checkout waits of this process's API pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += timed_out
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+
+_pool_waits = _PoolWaits()
+
+
+class _TimedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waits."""
+
+    def connect(self):  # noqa: ANN201 – PoolProxiedConnection
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            _pool_waits.record(time.perf_counter() - start, timed_out=True)
+            raise
+        _pool_waits.record(time.perf_counter() - start)
+        return connection
+
+
+def _engine_options(cfg: DatabaseConfig) -> dict[str, Any]:
+    return {
+        "poolclass": _TimedPool,
+        "pool_size": cfg.pool_size,
+        "max_overflow": cfg.max_overflow,
+        "pool_timeout": cfg.pool_timeout_seconds,
+        "pool_recycle": cfg.pool_recycle_seconds,
+        "pool_pre_ping": cfg.pool_pre_ping,
+        "connect_args": _connect_args(cfg),
+    }
 
-from backend.config import get_config
 
 _engine = create_async_engine(
     get_config().database.url,
     echo=False,
-    pool_pre_ping=True,
+    **_engine_options(get_config().database),
 )
 
 _session_factory = async_sessionmaker(
@@ -25,8 +132,91 @@ _session_factory = async_sessionmaker(
 )
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+def _read_sessions(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        engine.execution_options(isolation_level="AUTOCOMMIT"),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
+_read_session_factory = _read_sessions(_engine)
+
+
+# ---------------------------------------------------------------------------
+# Read replicas
+# ---------------------------------------------------------------------------
+
+@dataclasses.dataclass
+class _Replica:
+    name: str  # URL without the password, for logs
+    engine: AsyncEngine
+    sessions: async_sessionmaker[AsyncSession]
+    healthy: bool = True
+    checked_at: float = float("-inf")
+
+
+def _replica(url: str) -> _Replica:
+    # Only the primary's checkout waits are recorded (see ``pool_stats``).
+    options = {**_engine_options(get_config().database), "poolclass": AsyncAdaptedQueuePool}
+    engine = create_async_engine(url, echo=False, **options)
+    return _Replica(
+        name=make_url(url).render_as_string(hide_password=True),
+        engine=engine,
+        sessions=_read_sessions(engine),
+    )
+
+
+_replicas = [_replica(url) for url in get_config().database.replica_urls]
+_next_replica = itertools.count()
+
+
+async def _is_healthy(replica: _Replica) -> bool:
+    """Return whether *replica* is usable, checking it if it is due."""
+    cfg = get_config().database
+    now = time.monotonic()
+    if now - replica.checked_at < cfg.replica_health_check_seconds:
+        return replica.healthy
+    # Claimed before the check so that concurrent requests do not repeat it.
+    replica.checked_at = now
+
+    async def _ping() -> None:
+        async with replica.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.wait_for(_ping(), cfg.replica_health_check_timeout_seconds)
+    except (exc.DBAPIError, exc.TimeoutError, OSError, asyncio.TimeoutError):
+        if replica.healthy:
+            logger.warning("Read replica %s failed its health check", replica.name, exc_info=True)
+        replica.healthy = False
+    else:
+        if not replica.healthy:
+            logger.info("Read replica %s is healthy again", replica.name)
+        replica.healthy = True
+    return replica.healthy
+
+
+async def _pick_read_sessions() -> async_sessionmaker[AsyncSession]:
+    """Return the next healthy replica's session factory, or the primary's."""
+    for _ in range(len(_replicas)):
+        replica = _replicas[next(_next_replica) % len(_replicas)]
+        if await _is_healthy(replica):
+            return replica.sessions
+    return _read_session_factory
+
+
+# ---------------------------------------------------------------------------
+# FastAPI dependencies
+# ---------------------------------------------------------------------------
+
+async def get_db(response: Response) -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency that yields an async DB session."""
+    window = get_config().database.read_your_writes_seconds
+    if _replicas and window > 0:
+        response.set_cookie(
+            PRIMARY_PIN_COOKIE, "1", max_age=math.ceil(window), httponly=True, samesite="lax"
+        )
     async with _session_factory() as session:
         try:
             yield session
@@ -34,3 +224,81 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def get_primary_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency like ``get_read_db``, but always on the primary.
+
+    For by-id lookups of entities a client may have just written; not
+    every client sends the pin cookie back.
+    """
+    async with _read_session_factory() as session:
+        yield session
+
+
+async def get_read_db(connection: HTTPConnection) -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency that yields a session for read-only handlers.
+
+    Each statement runs in its own implicit transaction and nothing is
+    committed, so a handler must not write through this session.  The
+    session is a replica's unless the client is pinned to the primary.
+    """
+    if not _replicas or PRIMARY_PIN_COOKIE in connection.cookies:
+        sessions = _read_session_factory
+    else:
+        sessions = await _pick_read_sessions()
+    async with sessions() as session:
+        yield session
+
+
+def pool_stats() -> DatabasePoolStats:
+    """Return usage and checkout waits of this process's primary pool."""
+    pool = _engine.pool
+    return DatabasePoolStats(
+        size=pool.size(),
+        checked_out=pool.checkedout(),
+        idle=pool.checkedin(),
+        # ``overflow()`` counts from -size while the pool is not full.
+        overflow=max(0, pool.overflow()),
+        max_connections=pool.size() + get_config().database.max_overflow,
+        checkouts=_pool_waits.checkouts,
+        timeouts=_pool_waits.timeouts,
+        wait_seconds_total=round(_pool_waits.total_seconds, 6),
+        wait_seconds_max=round(_pool_waits.max_seconds, 6),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Synchronous (Celery worker) access
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=1)
+def _worker_session_factory() -> async_sessionmaker[AsyncSession]:
+    # Workers drive the async engine through ``asyncio.run`` – a new event
+    # loop per call – so pooled connections (which are bound to the loop
+    # that opened them) cannot be reused.  NullPool opens one per call.
+    cfg = get_config().database
+    engine = create_async_engine(
+        cfg.url, poolclass=NullPool, connect_args=_connect_args(cfg)
+    )
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def run_in_session(fn: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    """Run ``fn(session)`` to completion from synchronous worker code.
+
+    The session is committed when *fn* returns and rolled back if it
+    raises.
+    """
+
+    async def _run() -> T:
+        async with _worker_session_factory()() as session:
+            try:
+                result = await fn(session)
+                await session.commit()
+                return result
+            except Exception:
+                await session.rollback()
+                raise
+
+    return asyncio.run(_run())
@@ -0,0 +1,231 @@
+"""Worker-local, byte-bounded disk cache for object-storage reads.
+
+Voice-prep and synthesis workers repeatedly need the same samples,
+embeddings and model artefacts.  ``DiskCache`` keeps a read-through copy
+of each object under a configurable directory:
+
+* **Byte budget** – after every insert the least-recently-used entries
+  (by file mtime, refreshed on each hit) are evicted until the cache is
+  back under ``max_bytes``.  Entries used in the last
+  ``_EVICT_MIN_AGE_SECONDS`` are spared so that a path just handed to a
+  caller – by this thread, another one or another process – is not
+  deleted under it; the cache may briefly exceed its budget instead.
+  Objects larger than the whole budget are never cached.
+* **Integrity** – each entry has a JSON sidecar recording the object's
+  ETag, size and SHA-256.  Freshly downloaded files are checked against
+  the ETag when it is a plain MD5 digest, and hits are checked against
+  the recorded size (or the full SHA-256 when ``verify_on_hit`` is set).
+* **Single flight** – concurrent requests for the same key, from threads
+  or from other worker processes on the host, wait on one download via a
+  per-key lock file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows dev machines
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+#: ``fetch(storage_key, dest)`` downloads the object to *dest* and returns its ETag.
+Fetcher = Callable[[str, Path], str | None]
+
+_CHUNK = 1024 * 1024
+_EVICT_MIN_AGE_SECONDS = 60.0
+
+
+class CacheIntegrityError(IOError):
+    """Raised when a downloaded object does not match its ETag."""
+
+
+class DiskCache:
+    """Read-through LRU cache of object-storage keys on local disk."""
+
+    def __init__(self, root: Path, max_bytes: int, verify_on_hit: bool = False) -> None:
+        self._root = Path(root)
+        self._objects = self._root / "objects"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._verify_on_hit = verify_on_hit
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._key_locks_guard = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, storage_key: str, fetch: Fetcher, dest: Path | None = None) -> Path:
+        """Return a local path holding *storage_key*, downloading on a miss.
+
+        The returned path lives inside the cache and must be treated as
+        read-only; copy it if the caller needs to modify it.
+        An object larger than ``max_bytes`` is not cached: it is moved to
+        *dest* (by default ``uncached/<storage_key>`` under the cache
+        root) and that path is returned instead.
+        """
+        data_path = self._data_path(storage_key)
+        hit = self._check_hit(storage_key, data_path)
+        if hit is not None:
+            return hit
+
+        with self._key_lock(storage_key):
+            # Another thread / process may have filled it while we waited.
+            hit = self._check_hit(storage_key, data_path)
+            if hit is not None:
+                return hit
+            tmp_path = data_path.with_name(f"{data_path.name}.{os.getpid()}.part")
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                meta = self._download(storage_key, tmp_path, fetch)
+                if meta["size"] > self._max_bytes:
+                    dest = dest or self._root / "uncached" / storage_key
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.move(tmp_path, dest)
+                    logger.info(
+                        "[disk-cache] %s (%d bytes) exceeds the byte budget – not cached",
+                        storage_key,
+                        meta["size"],
+                    )
+                    return dest
+                os.replace(tmp_path, data_path)
+                self._meta_path(data_path).write_text(json.dumps(meta))
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            logger.info("[disk-cache] Cached %s (%d bytes)", storage_key, meta["size"])
+            # Still under the key lock, so no other caller can evict it first.
+            self._evict(keep=data_path)
+        return data_path
+
+    def invalidate(self, storage_key: str) -> None:
+        """Drop the cached copy of *storage_key* if present."""
+        data_path = self._data_path(storage_key)
+        with self._key_lock(storage_key):
+            self._remove(data_path)
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _data_path(self, storage_key: str) -> Path:
+        digest = hashlib.sha256(storage_key.encode()).hexdigest()
+        return self._objects / digest[:2] / digest
+
+    @staticmethod
+    def _meta_path(data_path: Path) -> Path:
+        return data_path.with_suffix(".meta")
+
+    def _check_hit(self, storage_key: str, data_path: Path) -> Path | None:
+        meta_path = self._meta_path(data_path)
+        try:
+            meta = json.loads(meta_path.read_text())
+            size = data_path.stat().st_size
+        except (FileNotFoundError, ValueError):
+            return None
+
+        if meta.get("key") != storage_key or meta.get("size") != size:
+            logger.warning("[disk-cache] Corrupt entry for %s – discarding", storage_key)
+            self._remove(data_path)
+            return None
+        if self._verify_on_hit and _sha256(data_path) != meta.get("sha256"):
+            logger.warning("[disk-cache] Checksum mismatch for %s – discarding", storage_key)
+            self._remove(data_path)
+            return None
+
+        # Refresh recency for LRU eviction.
+        now = time.time()
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(data_path, (now, now))
+        return data_path
+
+    @staticmethod
+    def _download(storage_key: str, tmp_path: Path, fetch: Fetcher) -> dict:
+        """Fetch *storage_key* to *tmp_path*, verify it and return its sidecar."""
+        etag = fetch(storage_key, tmp_path)
+        md5, sha256 = _digests(tmp_path)
+        plain_etag = (etag or "").strip('"')
+        if plain_etag and "-" not in plain_etag and plain_etag != md5:
+            raise CacheIntegrityError(
+                f"Downloaded {storage_key!r} does not match ETag "
+                f"{plain_etag} (got md5 {md5})"
+            )
+        return {
+            "key": storage_key,
+            "etag": plain_etag or None,
+            "size": tmp_path.stat().st_size,
+            "sha256": sha256,
+        }
+
+    def _remove(self, data_path: Path) -> None:
+        self._meta_path(data_path).unlink(missing_ok=True)
+        data_path.unlink(missing_ok=True)
+
+    def _entries(self) -> Iterator[tuple[float, int, Path]]:
+        for meta_path in self._objects.glob("*/*.meta"):
+            data_path = meta_path.with_suffix("")
+            try:
+                st = data_path.stat()
+            except FileNotFoundError:
+                continue
+            yield st.st_mtime, st.st_size, data_path
+
+    def _evict(self, keep: Path) -> None:
+        with self._evict_lock:
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            recent = time.time() - _EVICT_MIN_AGE_SECONDS
+            for mtime, size, data_path in entries:
+                if total <= self._max_bytes or mtime > recent:
+                    break
+                if data_path == keep:
+                    continue
+                self._remove(data_path)
+                total -= size
+                logger.info("[disk-cache] Evicted %s (%d bytes)", data_path.name, size)
+
+    @contextlib.contextmanager
+    def _key_lock(self, storage_key: str) -> Iterator[None]:
+        with self._key_locks_guard:
+            lock = self._key_locks.setdefault(storage_key, threading.Lock())
+        with lock:
+            if fcntl is None:
+                yield
+                return
+            lock_path = self._data_path(storage_key).with_suffix(".lock")
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(lock_path, "a") as fh:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def _digests(path: Path) -> tuple[str, str]:
+    md5 = hashlib.md5(usedforsecurity=False)
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(_CHUNK), b""):
+            md5.update(chunk)
+            sha256.update(chunk)
+    return md5.hexdigest(), sha256.hexdigest()
+
+
+def _sha256(path: Path) -> str:
+    return _digests(path)[1]
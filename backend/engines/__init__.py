@@ -6,12 +6,13 @@ Provides a pluggable interface for TTS / voice-cloning engines
 added or removed without touching the API or UI layers.
 """
 
-from backend.engines.base import EngineAdapter, VoiceEmbeddingRef
+from backend.engines.base import EngineAdapter, SynthesisOutput, VoiceEmbeddingRef
 from backend.engines.config import EngineConfig
 from backend.engines.factory import get_engine_adapter
 
 __all__ = [
     "EngineAdapter",
+    "SynthesisOutput",
     "VoiceEmbeddingRef",
     "EngineConfig",
     "get_engine_adapter",
@@ -9,6 +9,7 @@ knowing which model is actually loaded.
 from __future__ import annotations
 
 import json
+import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
@@ -37,6 +38,43 @@ class VoiceEmbeddingRef:
         return cls(**data)
 
 
+@dataclass
+class SynthesisOutput:
+    """Result of ``EngineAdapter.synthesize_audio``.
+
+    Exactly one of ``data`` (encoded audio held in memory) or ``path``
+    (audio spooled to local disk because it was too large to keep in
+    memory) is set.
+    """
+
+    data: bytes | None = None
+    path: Path | None = None
+    content_type: str = "audio/wav"
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        spool_dir: Path,
+        max_memory_bytes: int,
+        content_type: str = "audio/wav",
+    ) -> SynthesisOutput:
+        """Keep *data* in memory, or spool it to *spool_dir* when it is
+        larger than *max_memory_bytes*."""
+        if len(data) <= max_memory_bytes:
+            return cls(data=data, content_type=content_type)
+        spool_dir.mkdir(parents=True, exist_ok=True)
+        path = spool_dir / f"synth_{uuid.uuid4().hex[:16]}.wav"
+        path.write_bytes(data)
+        return cls(path=path, content_type=content_type)
+
+    @property
+    def size(self) -> int:
+        if self.data is not None:
+            return len(self.data)
+        return self.path.stat().st_size if self.path is not None else 0
+
+
 class EngineAdapter(ABC):
     """Common interface every TTS / voice-cloning engine must implement.
 
@@ -105,3 +143,22 @@ class EngineAdapter(ABC):
             concrete adapters create a silent dummy WAV file.
         """
         ...
+
+    def synthesize_audio(
+        self,
+        text: str,
+        voice_ref: VoiceEmbeddingRef,
+        params: dict[str, Any] | None = None,
+    ) -> SynthesisOutput:
+        """Generate audio, preferably as an in-memory buffer.
+
+        Workers call this instead of ``synthesize`` so that small outputs
+        go straight from memory to object storage without a disk round
+        trip.  The default implementation falls back to ``synthesize``;
+        adapters override it when they can render into a buffer.
+
+        Implementations with a decoder loop should call
+        ``backend.cancellation.raise_if_cancelled(progress)`` between
+        steps so that a cancelled job stops early.
+        """
+        return SynthesisOutput(path=self.synthesize(text, voice_ref, params))
@@ -8,7 +8,20 @@ from environment variables.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+def _default_memory_output_limit() -> int:
+    return int(os.environ.get("AWAAZTWIN_OUTPUT_MEMORY_LIMIT_BYTES", 32 * 1024 * 1024))
+
+
+def _default_output_dir() -> str:
+    return os.environ.get(
+        "AWAAZTWIN_OUTPUT_SPOOL_DIR",
+        str(Path(tempfile.gettempdir()) / "awaaztwin-spool"),
+    )
 
 
 @dataclass
@@ -31,6 +44,13 @@ class EngineConfig:
         Whether the engine should be loaded at startup.
     max_concurrent_jobs:
         Maximum number of jobs this engine should serve in parallel.
+    output_dir:
+        Scratch directory where synthesised audio is spooled until it is
+        uploaded.  Kept apart from ``model_path`` so that output churn
+        never fills (or contends for I/O with) the model weights volume.
+    max_memory_output_bytes:
+        Outputs up to this size are kept in memory and uploaded directly;
+        larger ones are spooled to ``output_dir`` first.
     """
 
     name: str
@@ -39,6 +59,8 @@ class EngineConfig:
     device: str = "auto"
     enabled: bool = True
     max_concurrent_jobs: int = 2
+    output_dir: str = field(default_factory=_default_output_dir)
+    max_memory_output_bytes: int = field(default_factory=_default_memory_output_limit)
 
     # ------------------------------------------------------------------
     # Helpers
@@ -76,6 +98,10 @@ def load_engine_configs_from_env() -> list[EngineConfig]:
     * ``AWAAZTWIN_ENGINE_OPENVOICE_PATH``  — model path for OpenVoice
     * ``AWAAZTWIN_ENGINE_OPENVOICE_DEVICE`` — device for OpenVoice
     * ``AWAAZTWIN_ENGINE_OPENVOICE_ENABLED`` — ``"true"`` / ``"false"``
+    * ``AWAAZTWIN_OUTPUT_SPOOL_DIR`` — scratch directory for synthesis
+      outputs, shared by all engines
+    * ``AWAAZTWIN_OUTPUT_MEMORY_LIMIT_BYTES`` — largest output kept in
+      memory instead of being spooled, shared by all engines
     """
 
     def _bool(val: str | None, default: bool = True) -> bool:
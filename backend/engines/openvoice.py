@@ -16,13 +16,14 @@ TODO: Replace dummy logic with real OpenVoice loading and inference:
 
 from __future__ import annotations
 
+import io
 import logging
 import uuid
 import wave
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-from backend.engines.base import EngineAdapter, VoiceEmbeddingRef
+from backend.engines.base import EngineAdapter, SynthesisOutput, VoiceEmbeddingRef
 from backend.engines.config import EngineConfig
 
 logger = logging.getLogger(__name__)
@@ -89,7 +90,37 @@ class OpenVoiceEngineAdapter(EngineAdapter):
         voice_ref: VoiceEmbeddingRef,
         params: dict[str, Any] | None = None,
     ) -> Path:
-        """Generate a dummy WAV file.
+        """Generate a dummy WAV file in the output spool directory."""
+        output_dir = Path(self._config.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        unique_id = uuid.uuid4().hex[:16]
+        output_path = output_dir / f"synth_{unique_id}.wav"
+        output_path.write_bytes(self._render(text, voice_ref, params))
+
+        logger.info("[OPENVOICE_V2] Synthesised audio written to %s", output_path)
+        return output_path
+
+    def synthesize_audio(
+        self,
+        text: str,
+        voice_ref: VoiceEmbeddingRef,
+        params: dict[str, Any] | None = None,
+    ) -> SynthesisOutput:
+        """Generate audio in memory, spooling only above the size limit."""
+        return SynthesisOutput.from_bytes(
+            self._render(text, voice_ref, params),
+            spool_dir=Path(self._config.output_dir),
+            max_memory_bytes=self._config.max_memory_output_bytes,
+        )
+
+    def _render(
+        self,
+        text: str,
+        voice_ref: VoiceEmbeddingRef,
+        params: dict[str, Any] | None,
+    ) -> bytes:
+        """Return encoded WAV bytes for *text* (currently silence).
 
         TODO: run base TTS to generate speech, then apply the
         tone-color converter using the stored embedding to match the
@@ -103,29 +134,22 @@ class OpenVoiceEngineAdapter(EngineAdapter):
             params,
         )
 
-        output_dir = Path(self._config.model_path) / "outputs"
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        unique_id = uuid.uuid4().hex[:16]
-        output_path = output_dir / f"synth_{unique_id}.wav"
-
-        _write_silent_wav(output_path, duration_sec=1.0)
-
-        logger.info("[OPENVOICE_V2] Synthesised audio written to %s", output_path)
-        return output_path
+        buf = io.BytesIO()
+        _write_silent_wav(buf, duration_sec=1.0)
+        return buf.getvalue()
 
 
 def _write_silent_wav(
-    path: Path,
+    target: Path | BinaryIO,
     duration_sec: float = 1.0,
     sample_rate: int = 22050,
     channels: int = 1,
     sample_width: int = 2,
 ) -> None:
-    """Write a valid silent WAV file."""
+    """Write a valid silent WAV file to a path or binary file object."""
     n_frames = int(sample_rate * duration_sec)
     silent_data = bytes(n_frames * channels * sample_width)
-    with wave.open(str(path), "wb") as wf:
+    with wave.open(str(target) if isinstance(target, Path) else target, "wb") as wf:
         wf.setnchannels(channels)
         wf.setsampwidth(sample_width)
         wf.setframerate(sample_rate)
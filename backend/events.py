@@ -0,0 +1,151 @@
+"""Job progress events over Redis pub/sub.
+
+Workers (and the API, for ``queued``) publish an event on every stage
+transition of a synthesis job:
+
+``queued`` → ``started`` → ``chunk`` (N of M) → ``uploaded`` →
+``completed`` (or ``failed``, or ``cancelled`` at any point, or
+``expired`` if its deadline passed before a worker picked it up)
+
+Each event is published on ``awaaztwin:jobs:<id>:events``.  It is also
+stored as the job's *last event*, so a subscriber that connects mid-job
+starts from the current state instead of waiting for the next
+transition.  ``GET /jobs/{id}/events`` (SSE) and ``/jobs/{id}/ws``
+(WebSocket) relay the stream to clients, so they don't have to poll.
+
+Events are not replayed: one lost to a Redis outage is gone, and the job
+row (``GET /jobs/{id}``) stays the source of truth.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from backend.config import get_config
+from backend.redis_client import KEY_PREFIX, get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+_CHANNEL = KEY_PREFIX + "jobs:{job_id}:events"
+_LAST_EVENT_KEY = KEY_PREFIX + "jobs:{job_id}:last_event"
+
+QUEUED = "queued"
+STARTED = "started"
+CHUNK = "chunk"
+UPLOADED = "uploaded"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+EXPIRED = "expired"
+
+#: Stages after which no further events are published for a job.
+TERMINAL_STAGES = frozenset({COMPLETED, FAILED, CANCELLED, EXPIRED})
+
+
+def make_event(job_id: str, stage: str, **data: Any) -> dict[str, Any]:
+    """Build an event payload (``data`` holds stage-specific fields)."""
+    return {"job_id": str(job_id), "stage": stage, "ts": time.time(), **data}
+
+
+def _encode(event: dict[str, Any]) -> str:
+    return json.dumps(event, separators=(",", ":"), default=str)
+
+
+def publish(job_id: str, stage: str, **data: Any) -> None:
+    """Publish a stage transition (worker side, blocking)."""
+    event = make_event(job_id, stage, **data)
+    payload = _encode(event)
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.set(
+            _LAST_EVENT_KEY.format(job_id=job_id),
+            payload,
+            ex=get_config().events.last_event_ttl_seconds,
+        )
+        pipe.publish(_CHANNEL.format(job_id=job_id), payload)
+        pipe.execute()
+    except RedisError:
+        logger.warning("Could not publish %s event for job %s", stage, job_id, exc_info=True)
+
+
+async def publish_async(job_id: str, stage: str, **data: Any) -> None:
+    """Publish a stage transition (API side)."""
+    event = make_event(job_id, stage, **data)
+    payload = _encode(event)
+    try:
+        pipe = get_async_redis().pipeline(transaction=False)
+        pipe.set(
+            _LAST_EVENT_KEY.format(job_id=job_id),
+            payload,
+            ex=get_config().events.last_event_ttl_seconds,
+        )
+        pipe.publish(_CHANNEL.format(job_id=job_id), payload)
+        await pipe.execute()
+    except RedisError:
+        logger.warning("Could not publish %s event for job %s", stage, job_id, exc_info=True)
+
+
+async def publish_many_async(job_ids: list[str], stage: str, **data: Any) -> None:
+    """Publish the same transition for many jobs in one round trip."""
+    ttl = get_config().events.last_event_ttl_seconds
+    try:
+        pipe = get_async_redis().pipeline(transaction=False)
+        for job_id in job_ids:
+            payload = _encode(make_event(job_id, stage, **data))
+            pipe.set(_LAST_EVENT_KEY.format(job_id=job_id), payload, ex=ttl)
+            pipe.publish(_CHANNEL.format(job_id=job_id), payload)
+        await pipe.execute()
+    except RedisError:
+        logger.warning("Could not publish %s events for %d jobs", stage, len(job_ids), exc_info=True)
+
+
+async def last_stage(job_id: str) -> str | None:
+    """Return the stage of *job_id*'s last event, if one is stored."""
+    snapshot = await get_async_redis().get(_LAST_EVENT_KEY.format(job_id=job_id))
+    return json.loads(snapshot).get("stage") if snapshot is not None else None
+
+
+async def subscribe(job_id: str) -> AsyncIterator[dict[str, Any] | None]:
+    """Yield *job_id*'s events, starting with its last known one.
+
+    ``None`` is yielded after ``keepalive_seconds`` without an event, so
+    that callers can keep idle connections open.  The iterator ends
+    after a terminal event.
+    """
+    cfg = get_config().events
+    redis = get_async_redis()
+    pubsub = redis.pubsub()
+    # Subscribe before reading the snapshot so no transition is missed.
+    await pubsub.subscribe(_CHANNEL.format(job_id=job_id))
+    try:
+        last_ts = 0.0
+        snapshot = await redis.get(_LAST_EVENT_KEY.format(job_id=job_id))
+        if snapshot is not None:
+            event = json.loads(snapshot)
+            last_ts = event.get("ts", 0.0)
+            yield event
+            if event.get("stage") in TERMINAL_STAGES:
+                return
+
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=cfg.keepalive_seconds
+            )
+            if message is None:
+                yield None
+                continue
+            event = json.loads(message["data"])
+            if event.get("ts", 0.0) <= last_ts:
+                continue  # already covered by the snapshot
+            yield event
+            if event.get("stage") in TERMINAL_STAGES:
+                return
+    finally:
+        await pubsub.unsubscribe()
+        await pubsub.aclose()
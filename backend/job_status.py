@@ -0,0 +1,125 @@
+"""Redis read cache of synthesis job status for ``GET /jobs/{id}``.
+
+Clients poll job status far more often than it changes, so each job's
+current state is kept in a small Redis hash,
+``awaaztwin:jobs:<id>:status``, holding just the fields of
+``SynthesisJobStatusResponse`` – never the job's input text.  Postgres stays the source of truth;
+the hash is written *after* each committed change:
+
+* the worker (and the stuck-job reaper) record every status transition,
+  plus ``progress`` as segments complete;
+* the API fills a job's hash when it creates the job, and whenever a
+  poll misses (read-through).
+
+A fill never overwrites fields that are already present: those came
+from a worker, which only writes after its commit, so they are never
+older than the row the API just read.  Entries expire ``ttl_seconds``
+after their last write, which bounds how long a write lost to a Redis
+error can be served.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime, timezone
+
+from redis.exceptions import RedisError
+
+from backend.config import get_config
+from backend.models import SynthesisJobStatus
+from backend.redis_client import KEY_PREFIX, get_async_redis, get_redis
+from backend.schemas import SynthesisJobStatusResponse
+
+logger = logging.getLogger(__name__)
+
+_STATUS_KEY = KEY_PREFIX + "jobs:{job_id}:status"
+
+# Fields that never change after submission, stored together as JSON.
+_ROW_FIELDS = {"id", "voice_profile_id", "engine_name", "created_at", "batch_id"}
+# Fields that follow the job's progress, stored one per hash field.
+_STATE_FIELDS = set(SynthesisJobStatusResponse.model_fields) - _ROW_FIELDS
+
+
+def _key(job_id: str) -> str:
+    return _STATUS_KEY.format(job_id=job_id)
+
+
+def _state_fields(
+    status: SynthesisJobStatus | None = None,
+    progress: float | None = None,
+    **values: object,
+) -> dict[str, str]:
+    fields = {name: str(value) for name, value in values.items() if value is not None}
+    if status is not None:
+        fields["status"] = status.value
+    if progress is not None:
+        fields["progress"] = f"{progress:.4f}"
+    fields["updated_at"] = datetime.now(timezone.utc).isoformat()
+    return fields
+
+
+def record(job_id: str, **state: object) -> None:
+    """Record a committed change of *job_id*'s state (worker side).
+
+    *state* takes ``status``, ``progress``, ``output_storage_key`` and
+    ``error_message``.
+    """
+    cfg = get_config().status_cache
+    if not cfg.enabled:
+        return
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.hset(_key(job_id), mapping=_state_fields(**state))
+        pipe.expire(_key(job_id), cfg.ttl_seconds)
+        pipe.execute()
+    except RedisError:
+        logger.warning("Could not cache the status of job %s", job_id, exc_info=True)
+
+
+async def record_async(job_id: str, **state: object) -> None:
+    """``record`` for the API."""
+    cfg = get_config().status_cache
+    if not cfg.enabled:
+        return
+    try:
+        pipe = get_async_redis().pipeline(transaction=False)
+        pipe.hset(_key(job_id), mapping=_state_fields(**state))
+        pipe.expire(_key(job_id), cfg.ttl_seconds)
+        await pipe.execute()
+    except RedisError:
+        logger.warning("Could not cache the status of job %s", job_id, exc_info=True)
+
+
+async def fill(jobs: list[SynthesisJobStatusResponse]) -> None:
+    """Cache *jobs* as just read from (or written to) Postgres.
+
+    Fields a worker has already recorded are kept (see the module
+    docstring).
+    """
+    cfg = get_config().status_cache
+    if not cfg.enabled or not jobs:
+        return
+    try:
+        pipe = get_async_redis().pipeline(transaction=False)
+        for job in jobs:
+            key = _key(str(job.id))
+            pipe.hset(key, "row", job.model_dump_json(include=_ROW_FIELDS))
+            for name, value in job.model_dump(mode="json", include=_STATE_FIELDS).items():
+                if value is not None:
+                    pipe.hsetnx(key, name, str(value))
+            pipe.expire(key, cfg.ttl_seconds)
+        await pipe.execute()
+    except RedisError:
+        logger.warning("Could not cache the status of %d job(s)", len(jobs), exc_info=True)
+
+
+async def read(job_id: str) -> SynthesisJobStatusResponse | None:
+    """Return the cached state of *job_id*; ``None`` on a miss."""
+    if not get_config().status_cache.enabled:
+        return None
+    fields = await get_async_redis().hgetall(_key(job_id))
+    row = fields.pop("row", None)
+    if row is None or "status" not in fields:
+        return None
+    return SynthesisJobStatusResponse.model_validate({**json.loads(row), **fields})
@@ -26,6 +26,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     yield
 
 
+# JSON responses use FastAPI's default path on purpose: for a route with a
+# ``response_model`` it dumps the model straight to JSON bytes with Pydantic's
+# (Rust) serialiser.  Setting a ``default_response_class`` such as
+# ``ORJSONResponse`` would route every response through ``jsonable_encoder``
+# first, which ``scripts/bench_serialization.py`` measures as several times
+# slower – so every JSON route declares a response model instead.
 app = FastAPI(
     title="AwaazTwin API",
     description="Voice-cloning & TTS backend for AwaazTwin",
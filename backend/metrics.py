@@ -0,0 +1,213 @@
+"""Operational metrics kept in Redis.
+
+Workers record measurements with the blocking helpers below; the admin
+router reads them back with the async readers.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+
+from redis.exceptions import RedisError
+
+from backend.redis_client import KEY_PREFIX, get_async_redis, get_redis
+from backend.schemas import CancellationStats, LaneWaitStats, TaskFailureStats
+
+logger = logging.getLogger(__name__)
+
+#: Number of most recent wait samples kept per lane for percentiles.
+WAIT_SAMPLE_SIZE = 1000
+
+_WAIT_SAMPLES_KEY = KEY_PREFIX + "metrics:queue_wait:{lane}"
+_WAIT_TOTALS_KEY = KEY_PREFIX + "metrics:queue_wait_totals:{lane}"
+# One counter per lane per minute; old buckets expire on their own.
+_COMPLETIONS_KEY = KEY_PREFIX + "metrics:completions:{lane}:{minute}"
+_COMPLETIONS_TTL_SECONDS = 3600
+# Hash per task: "<failure class>:retried" / "<failure class>:failed" -> count.
+_FAILURES_KEY = KEY_PREFIX + "metrics:task_failures:{task}"
+# Hash: "queued" / "running" -> cancelled jobs, "saved_seconds" -> compute saved.
+_CANCELLATIONS_KEY = KEY_PREFIX + "metrics:cancellations"
+# Hash: "requeued" / "failed" -> jobs reclaimed from dead workers.
+_RECLAIMED_KEY = KEY_PREFIX + "metrics:reclaimed"
+
+
+# ---------------------------------------------------------------------------
+# Queue wait time (per latency lane)
+# ---------------------------------------------------------------------------
+
+def record_queue_wait(lane: str, wait_seconds: float) -> None:
+    """Record how long a task sat in *lane* before a worker started it."""
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        samples_key = _WAIT_SAMPLES_KEY.format(lane=lane)
+        totals_key = _WAIT_TOTALS_KEY.format(lane=lane)
+        pipe.lpush(samples_key, round(wait_seconds, 3))
+        pipe.ltrim(samples_key, 0, WAIT_SAMPLE_SIZE - 1)
+        pipe.hincrby(totals_key, "count", 1)
+        pipe.hincrbyfloat(totals_key, "sum", wait_seconds)
+        pipe.execute()
+    except RedisError:
+        logger.warning("Could not record queue wait for lane %s", lane, exc_info=True)
+
+
+async def read_queue_wait_stats(lanes: list[str]) -> list[LaneWaitStats]:
+    """Summarise recent queue wait times for each of *lanes*."""
+    pipe = get_async_redis().pipeline(transaction=False)
+    for lane in lanes:
+        pipe.lrange(_WAIT_SAMPLES_KEY.format(lane=lane), 0, -1)
+        pipe.hgetall(_WAIT_TOTALS_KEY.format(lane=lane))
+    results = await pipe.execute()
+
+    stats: list[LaneWaitStats] = []
+    for i, lane in enumerate(lanes):
+        samples = sorted(float(v) for v in results[2 * i])
+        totals = results[2 * i + 1]
+        count = int(totals.get("count", 0))
+        stats.append(
+            LaneWaitStats(
+                lane=lane,
+                total_tasks=count,
+                mean_wait_seconds=float(totals.get("sum", 0.0)) / count if count else 0.0,
+                p50_wait_seconds=_percentile(samples, 0.50),
+                p95_wait_seconds=_percentile(samples, 0.95),
+                max_wait_seconds=samples[-1] if samples else 0.0,
+            )
+        )
+    return stats
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[idx]
+
+
+# ---------------------------------------------------------------------------
+# Throughput (per latency lane)
+# ---------------------------------------------------------------------------
+
+def record_completion(lane: str) -> None:
+    """Count one task that *lane*'s workers finished (successfully or not)."""
+    key = _COMPLETIONS_KEY.format(lane=lane, minute=int(time.time() // 60))
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.incr(key)
+        pipe.expire(key, _COMPLETIONS_TTL_SECONDS)
+        pipe.execute()
+    except RedisError:
+        logger.warning("Could not record completion for lane %s", lane, exc_info=True)
+
+
+async def read_throughput(lanes: list[str], window_seconds: int) -> dict[str, float]:
+    """Return each lane's completions per second over the last *window_seconds*.
+
+    The window is rounded up to whole minutes; the current, partial
+    minute is included and weighted by how much of it has elapsed.
+    """
+    now = time.time()
+    current = int(now // 60)
+    minutes = range(current - max(1, math.ceil(window_seconds / 60)) + 1, current + 1)
+    elapsed = (len(minutes) - 1) * 60 + (now - current * 60)
+
+    pipe = get_async_redis().pipeline(transaction=False)
+    for lane in lanes:
+        pipe.mget([_COMPLETIONS_KEY.format(lane=lane, minute=m) for m in minutes])
+    results = await pipe.execute()
+    return {
+        lane: sum(int(v) for v in counts if v) / max(elapsed, 1.0)
+        for lane, counts in zip(lanes, results)
+    }
+
+
+# ---------------------------------------------------------------------------
+# Task failures (per failure class)
+# ---------------------------------------------------------------------------
+
+def record_task_failure(task: str, failure_class: str, *, retried: bool) -> None:
+    """Count a failed attempt of *task* that was retried or given up on."""
+    field = f"{failure_class}:{'retried' if retried else 'failed'}"
+    try:
+        get_redis().hincrby(_FAILURES_KEY.format(task=task), field, 1)
+    except RedisError:
+        logger.warning("Could not record failure of %s", task, exc_info=True)
+
+
+async def read_task_failures(tasks: list[str]) -> list[TaskFailureStats]:
+    """Return retry and failure counts per task and failure class."""
+    pipe = get_async_redis().pipeline(transaction=False)
+    for task in tasks:
+        pipe.hgetall(_FAILURES_KEY.format(task=task))
+    results = await pipe.execute()
+
+    stats: list[TaskFailureStats] = []
+    for task, counts in zip(tasks, results):
+        by_class: dict[str, TaskFailureStats] = {}
+        for field, value in counts.items():
+            failure_class, _, outcome = field.rpartition(":")
+            entry = by_class.setdefault(
+                failure_class, TaskFailureStats(task=task, failure_class=failure_class)
+            )
+            if outcome == "retried":
+                entry.retries = int(value)
+            else:
+                entry.failures = int(value)
+        stats.extend(by_class[c] for c in sorted(by_class))
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Cancellations
+# ---------------------------------------------------------------------------
+
+def _count_cancellation(pipe, state: str, saved_seconds: float) -> None:  # noqa: ANN001
+    pipe.hincrby(_CANCELLATIONS_KEY, state, 1)
+    pipe.hincrbyfloat(_CANCELLATIONS_KEY, "saved_seconds", saved_seconds)
+
+
+def record_cancellation(state: str, saved_seconds: float) -> None:
+    """Count a job cancelled while *state* (``queued``/``running``)."""
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        _count_cancellation(pipe, state, saved_seconds)
+        pipe.execute()
+    except RedisError:
+        logger.warning("Could not record cancellation", exc_info=True)
+
+
+async def record_cancellation_async(state: str, saved_seconds: float) -> None:
+    """``record_cancellation`` for the API."""
+    try:
+        pipe = get_async_redis().pipeline(transaction=False)
+        _count_cancellation(pipe, state, saved_seconds)
+        await pipe.execute()
+    except RedisError:
+        logger.warning("Could not record cancellation", exc_info=True)
+
+
+async def read_cancellations() -> CancellationStats:
+    counts = await get_async_redis().hgetall(_CANCELLATIONS_KEY)
+    return CancellationStats(
+        cancelled_queued=int(counts.get("queued", 0)),
+        cancelled_running=int(counts.get("running", 0)),
+        compute_seconds_saved=round(float(counts.get("saved_seconds", 0.0)), 3),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Jobs reclaimed from dead workers
+# ---------------------------------------------------------------------------
+
+def record_reclaimed(outcome: str) -> None:
+    """Count a stuck job the reaper ``requeued`` or ``failed``."""
+    try:
+        get_redis().hincrby(_RECLAIMED_KEY, outcome, 1)
+    except RedisError:
+        logger.warning("Could not record reclaimed job", exc_info=True)
+
+
+async def read_reclaimed() -> dict[str, int]:
+    counts = await get_async_redis().hgetall(_RECLAIMED_KEY)
+    return {outcome: int(counts.get(outcome, 0)) for outcome in ("requeued", "failed")}
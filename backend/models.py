@@ -4,15 +4,21 @@ from __future__ import annotations
 
 import enum
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlalchemy import (
+    Connection,
     DateTime,
+    ColumnElement,
     Enum,
     ForeignKey,
+    Index,
     String,
+    Table,
     Text,
+    event,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import (
@@ -22,6 +28,9 @@ from sqlalchemy.orm import (
     relationship,
 )
 
+from backend import partitions
+from backend.config import get_config
+
 
 # ---------------------------------------------------------------------------
 # Base & helpers
@@ -67,6 +76,8 @@ class SynthesisJobStatus(str, enum.Enum):
     PROCESSING = "PROCESSING"
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+    EXPIRED = "EXPIRED"
 
 
 # ---------------------------------------------------------------------------
@@ -102,6 +113,8 @@ class User(Base):
 
 class VoiceProfile(Base):
     __tablename__ = "voice_profiles"
+    # Listings are keyset-paginated on (created_at, id); see backend.pagination.
+    __table_args__ = (Index("ix_voice_profiles_user_created", "user_id", "created_at", "id"),)
 
     id: Mapped[uuid.UUID] = _uuid_pk()
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
@@ -152,8 +165,26 @@ class EngineConfig(Base):
 
 class SynthesisJob(Base):
     __tablename__ = "synthesis_jobs"
+    # Listings are keyset-paginated on (created_at, id); see backend.pagination.
+    # Partitioned by month of created_at (see backend.partitions), which the
+    # primary key must therefore include; rows are still identified by id,
+    # looked up through ``id_criteria`` so that partitions are pruned.
+    __table_args__ = (
+        Index("ix_synthesis_jobs_voice_created", "voice_profile_id", "created_at", "id"),
+        Index("ix_synthesis_jobs_status_created", "status", "created_at", "id"),
+        Index("ix_synthesis_jobs_created", "created_at", "id"),
+        # Reference lookups of the output GC (``collect_orphaned_outputs``).
+        Index(
+            "ix_synthesis_jobs_output_storage_key",
+            "output_storage_key",
+            postgresql_where=text("output_storage_key IS NOT NULL"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
-    id: Mapped[uuid.UUID] = _uuid_pk()
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=partitions.new_id
+    )
     voice_profile_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("voice_profiles.id"), nullable=False
     )
@@ -165,7 +196,40 @@ class SynthesisJob(Base):
     )
     output_storage_key: Mapped[str | None] = mapped_column(Text, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = _ts_created()
+    # Set for jobs submitted through ``POST /synthesize/batch``.
+    batch_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True, index=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
+    )
     updated_at: Mapped[datetime] = _ts_updated()
 
     voice_profile: Mapped["VoiceProfile"] = relationship()
+
+    __mapper_args__ = {"primary_key": [id]}
+
+    @classmethod
+    def id_criteria(cls, *job_ids: uuid.UUID) -> list[ColumnElement[bool]]:
+        """Return WHERE clauses selecting the jobs *job_ids*.
+
+        Time-ordered ids also bound ``created_at``, so Postgres only probes
+        the partitions they can be in; older ids match on ``id`` alone.
+        """
+        clauses: list[ColumnElement[bool]] = [
+            cls.id == job_ids[0] if len(job_ids) == 1 else cls.id.in_(job_ids)
+        ]
+        windows = [partitions.id_created_window(job_id) for job_id in job_ids]
+        if all(windows):
+            clauses.append(
+                cls.created_at.between(min(w[0] for w in windows), max(w[1] for w in windows))
+            )
+        return clauses
+
+
+@event.listens_for(SynthesisJob.__table__, "after_create")
+def _create_job_partitions(table: Table, conn: Connection, **_kw: object) -> None:
+    """Create the current and upcoming months' partitions with the table."""
+    current = partitions.month_of(datetime.now(timezone.utc))
+    ahead = get_config().job_retention.partitions_ahead_months
+    partitions.ensure_partitions(conn, table.name, current, partitions.add_months(current, ahead))
@@ -0,0 +1,73 @@
+"""Keyset (cursor) pagination for listings ordered newest first.
+
+Listings are ordered by ``(created_at, id)`` descending, and each page
+continues *after* the last row of the previous one instead of skipping
+``OFFSET`` rows, so page N costs the same as page 1 on any table size –
+provided an index ends in ``(created_at, id)`` after the listing's
+equality filters (see the ``__table_args__`` in ``backend.models``).
+
+The cursor handed to clients is opaque: the last row's ``created_at``
+and ``id``, base64url-encoded.  Listings return it in the
+``X-Next-Cursor`` response header; it is absent on the last page.
+"""
+
+from __future__ import annotations
+
+import base64
+import uuid
+from datetime import datetime
+from typing import Any, TypeVar
+
+from sqlalchemy import Select, tuple_
+
+from backend.config import get_config
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Inverse of ``encode_cursor``; raises ``ValueError`` if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, _, row_id = raw.partition("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+
+
+def page_size(limit: int | None) -> int:
+    """Clamp a requested page size to the configured bounds."""
+    cfg = get_config().limits
+    return min(limit or cfg.default_page_size, cfg.max_page_size)
+
+
+def keyset_page(stmt: Select, model: Any, cursor: str | None, limit: int) -> Select:
+    """Order *stmt* newest first and restrict it to the page after *cursor*.
+
+    One row more than *limit* is fetched so that ``split_page`` can tell
+    whether another page follows.
+    """
+    if cursor is not None:
+        created_at, row_id = decode_cursor(cursor)
+        # The plain bound lets the planner skip newer partitions of a
+        # table partitioned on created_at, which the row comparison does not.
+        stmt = stmt.where(
+            model.created_at <= created_at,
+            tuple_(model.created_at, model.id) < (created_at, row_id),
+        )
+    return stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+
+def split_page(rows: list[T], limit: int) -> tuple[list[T], str | None]:
+    """Return the page's rows and the cursor of the next page, if any."""
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], encode_cursor(last.created_at, last.id)
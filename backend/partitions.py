@@ -0,0 +1,146 @@
+"""Monthly range partitions of ``synthesis_jobs``.
+
+``synthesis_jobs`` is partitioned by ``RANGE (created_at)`` with one
+partition per calendar month (UTC), named ``synthesis_jobs_y2026m10``
+and so on.  Queries that bound ``created_at`` – listings, which are
+keyset-paginated on it – only scan the partitions in range, and expired
+months are dropped whole instead of deleted row by row.
+
+Partitions are created ahead of time: for the current month and the
+next ``partitions_ahead_months`` when the table is created, and then by
+the maintenance worker's ``manage_job_partitions`` task, which also
+archives and drops the months past ``retention_months``.  There is no
+default partition, so a row dated outside every partition is rejected.
+
+Job ids are time-ordered (UUIDv7, see ``new_id``), so a lookup by id
+alone can still be bounded on ``created_at`` (``id_created_window``) and
+only probe the partitions of the month it was submitted in.
+
+The partition helpers take a synchronous ``Connection``; from async code
+run them through ``AsyncConnection.run_sync`` / ``AsyncSession.run_sync``.
+"""
+
+from __future__ import annotations
+
+import re
+import secrets
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import Connection, text
+
+_NAME = re.compile(r"^(?P<table>\w+)_y(?P<year>\d{4})m(?P<month>\d{2})$")
+# ``created_at`` is the database's clock at insert; the id's timestamp is
+# the API host's, taken a moment earlier or later.
+_ID_CLOCK_SLACK = timedelta(days=1)
+
+
+def month_of(moment: datetime) -> date:
+    """Return the first day of *moment*'s month (in UTC)."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return date(moment.year, moment.month, 1)
+
+
+def add_months(month: date, n: int) -> date:
+    """Return the first day of the month *n* months after *month*."""
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def list_partitions(conn: Connection, table: str) -> dict[date, str]:
+    """Return month -> partition name for *table*'s monthly partitions."""
+    names = conn.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:table AS regclass)"
+        ),
+        {"table": table},
+    ).scalars()
+    months: dict[date, str] = {}
+    for name in names:
+        match = _NAME.match(name)
+        if match and match["table"] == table:
+            months[date(int(match["year"]), int(match["month"]), 1)] = name
+    return months
+
+
+def ensure_partitions(conn: Connection, table: str, first: date, last: date) -> list[str]:
+    """Create *table*'s missing partitions for the months *first* to *last*.
+
+    Returns:
+        The names of the partitions created.
+    """
+    existing = list_partitions(conn, table)
+    created: list[str] = []
+    month = first
+    while month <= last:
+        if month not in existing:
+            name = partition_name(table, month)
+            conn.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                    f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+                    f"TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+                )
+            )
+            created.append(name)
+        month = add_months(month, 1)
+    return created
+
+
+def expired_partitions(
+    conn: Connection, table: str, now: datetime, retention_months: int
+) -> dict[date, str]:
+    """Return *table*'s partitions whose rows are all older than the retention.
+
+    A month expires once ``retention_months`` whole months have passed
+    since it ended; ``retention_months=0`` keeps every partition.
+    """
+    if retention_months <= 0:
+        return {}
+    cutoff = add_months(month_of(now), -retention_months)
+    return {
+        month: name
+        for month, name in sorted(list_partitions(conn, table).items())
+        if add_months(month, 1) <= cutoff
+    }
+
+
+def drop_partition(conn: Connection, table: str, name: str) -> None:
+    """Detach partition *name* from *table* and drop it.
+
+    Detaching locks *table* briefly; ``lock_timeout`` makes the caller
+    give up (and retry on its next run) rather than queue every query on
+    the table behind a long-running one.
+    """
+    conn.execute(text("SET LOCAL lock_timeout = '5s'"))
+    conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+    conn.execute(text(f"DROP TABLE {name}"))
+
+
+def new_id() -> uuid.UUID:
+    """Return a new time-ordered UUID (version 7, RFC 9562)."""
+    ms = time.time_ns() // 1_000_000
+    value = (ms & (1 << 48) - 1) << 80 | secrets.randbits(76)
+    value |= 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # variant
+    return uuid.UUID(int=value)
+
+
+def id_created_window(row_id: uuid.UUID) -> tuple[datetime, datetime] | None:
+    """Return bounds on ``created_at`` for the row with id *row_id*.
+
+    ``None`` for ids that are not time-ordered (rows created before
+    ``new_id`` was introduced).
+    """
+    if row_id.version != 7:
+        return None
+    moment = datetime.fromtimestamp((row_id.int >> 80) / 1000, tz=timezone.utc)
+    return moment - _ID_CLOCK_SLACK, moment + _ID_CLOCK_SLACK
@@ -0,0 +1,34 @@
+"""Shared Redis clients for the API and the workers.
+
+The API talks to Redis through the asyncio client; Celery workers (which
+are synchronous) use the blocking client.  Both are created lazily, once
+per process, from ``RedisConfig.url``.
+
+Redis only holds derived, operational state (events, counters, metrics,
+caches).  Its write helpers are best-effort – a Redis hiccup must never
+fail a request or a job – so they log and swallow ``RedisError``.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+
+from backend.config import get_config
+
+#: Prefix for every key AwaazTwin itself writes (Celery / RQ keep their own).
+KEY_PREFIX = "awaaztwin:"
+
+
+@functools.lru_cache(maxsize=1)
+def get_redis() -> Redis:
+    """Return the process-wide blocking Redis client (workers)."""
+    return Redis.from_url(get_config().redis.url, decode_responses=True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_redis() -> AsyncRedis:
+    """Return the process-wide asyncio Redis client (API)."""
+    return AsyncRedis.from_url(get_config().redis.url, decode_responses=True)
@@ -4,8 +4,29 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
+from backend import counters
+from backend import metrics as metrics_store
+from backend.database import pool_stats
 from backend.engines.factory import list_engines
-from backend.schemas import AdminMetrics, EngineInfo, QueueStats
+from backend.models import SynthesisJob, SynthesisJobStatus, VoiceProfile
+from backend.schemas import (
+    AdminMetrics,
+    AutoscalerDecision,
+    CancellationStats,
+    EngineInfo,
+    LaneWaitStats,
+    QueueStats,
+    TaskFailureStats,
+)
+from backend.workers import autoscaler
+from backend.workers import queue_stats as queue_stats_reader
+from backend.workers.routing import RUN_SYNTHESIS_TASK, SYNTHESIS_QUEUES
+
+# Tasks whose retries and failures are reported by ``/admin/failures``.
+_RETRYING_TASKS = [
+    "backend.workers.voice_prep_worker.prepare_voice_profile",
+    RUN_SYNTHESIS_TASK,
+]
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -14,21 +35,64 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 async def metrics() -> AdminMetrics:
     """Return high-level platform metrics.
 
-    TODO: Query real counts from the database.
+    Row counts come from the status counters (``backend.counters``), so
+    this is constant-time whatever the table sizes.  ``db_pool`` describes
+    the connection pool of the API process that answered.
     """
-    return AdminMetrics()
+    voices, jobs = await counters.read_counts(VoiceProfile, SynthesisJob)
+    reclaimed = await metrics_store.read_reclaimed()
+    return AdminMetrics(
+        total_voices=sum(voices.values()),
+        total_jobs=sum(jobs.values()),
+        pending_jobs=jobs.get(SynthesisJobStatus.PENDING.value, 0),
+        processing_jobs=jobs.get(SynthesisJobStatus.PROCESSING.value, 0),
+        voices_by_status=voices,
+        jobs_by_status=jobs,
+        reclaimed_requeued=reclaimed["requeued"],
+        reclaimed_failed=reclaimed["failed"],
+        db_pool=pool_stats(),
+    )
 
 
 @router.get("/queues", response_model=list[QueueStats])
 async def queue_stats() -> list[QueueStats]:
-    """Return stats for each RQ worker queue.
+    """Return stats for the voice-prep and synthesis queues.
 
-    TODO: Connect to Redis and read real queue lengths.
+    Celery and RQ queues are added up; see ``backend.workers.queue_stats``.
     """
-    return [
-        QueueStats(name="voice-prep"),
-        QueueStats(name="synthesis"),
-    ]
+    return await queue_stats_reader.read_queue_stats()
+
+
+@router.get("/lanes", response_model=list[LaneWaitStats])
+async def lane_wait_stats() -> list[LaneWaitStats]:
+    """Return queue wait times for each synthesis latency lane.
+
+    Lets operators confirm that interactive jobs are not stuck behind
+    long-form work (head-of-line blocking).
+    """
+    return await metrics_store.read_queue_wait_stats(list(SYNTHESIS_QUEUES))
+
+
+@router.get("/failures", response_model=list[TaskFailureStats])
+async def task_failures() -> list[TaskFailureStats]:
+    """Return worker retry and final-failure counts by failure class.
+
+    A rising ``permanent`` count points at bad input or configuration;
+    ``resource_exhausted`` at capacity problems (memory, disk, throttling).
+    """
+    return await metrics_store.read_task_failures(_RETRYING_TASKS)
+
+
+@router.get("/cancellations", response_model=CancellationStats)
+async def cancellations() -> CancellationStats:
+    """Return cancelled-job counts and the estimated compute they saved."""
+    return await metrics_store.read_cancellations()
+
+
+@router.get("/autoscaler", response_model=list[AutoscalerDecision])
+async def autoscaler_decisions() -> list[AutoscalerDecision]:
+    """Return the worker-pool autoscaler's latest decision per pool."""
+    return await autoscaler.read_decisions()
 
 
 @router.get("/engines", response_model=list[EngineInfo])
@@ -2,18 +2,150 @@
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import json
+import logging
 import uuid
-from datetime import datetime, timezone
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+    WebSocketException,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from redis.exceptions import RedisError
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from backend import (
+    admission,
+    cancellation,
+    coalescing,
+    counters,
+    events,
+    job_status,
+    metrics,
+    partitions,
+    storage,
+)
+from backend.config import get_config
+from backend.database import get_db, get_primary_read_db, get_read_db
+from backend.pagination import NEXT_CURSOR_HEADER, keyset_page, page_size, split_page
+from backend.models import SynthesisJob, SynthesisJobStatus, VoiceProfile, VoiceProfileStatus
+from backend.schemas import (
+    SynthesisBatchCreate,
+    SynthesisBatchResponse,
+    SynthesisBatchStatus,
+    SynthesisJobCreate,
+    SynthesisJobResponse,
+    SynthesisJobStatusResponse,
+    SynthesisJobSummary,
+)
+from backend.workers import affinity
+from backend.workers.routing import (
+    PartialEnqueueError,
+    Route,
+    enqueue_synthesis,
+    enqueue_synthesis_many,
+    estimate_cost,
+    revoke_synthesis,
+    route_synthesis,
+    voice_embedding_json,
+)
 
-from backend.database import get_db
-from backend.schemas import SynthesisJobCreate, SynthesisJobResponse
+logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["synthesis"])
 
+# A job's output never changes once written, so browsers may keep it for a
+# day and revalidate cheaply with ``If-None-Match`` afterwards.
+_AUDIO_CACHE_CONTROL = "private, max-age=86400"
+
+# Jobs in these states publish no further events and will not change.
+_FINAL_STATUSES = frozenset(
+    {
+        SynthesisJobStatus.COMPLETED,
+        SynthesisJobStatus.FAILED,
+        SynthesisJobStatus.CANCELLED,
+        SynthesisJobStatus.EXPIRED,
+    }
+)
+
+# Terminal event stage reported for a finished job, by status.
+_FINAL_STAGES = {
+    SynthesisJobStatus.COMPLETED: events.COMPLETED,
+    SynthesisJobStatus.FAILED: events.FAILED,
+    SynthesisJobStatus.CANCELLED: events.CANCELLED,
+    SynthesisJobStatus.EXPIRED: events.EXPIRED,
+}
+
+# Last-event stages of a job that a worker has picked up.
+_RUNNING_STAGES = frozenset({events.STARTED, events.CHUNK, events.UPLOADED})
+
+# Listings select only what ``SynthesisJobSummary`` shows: the input text
+# (up to 5000 characters) is cut to a preview by Postgres, not in Python.
+_INPUT_PREVIEW_CHARS = 80
+_JOB_SUMMARY_COLUMNS = (
+    SynthesisJob.id,
+    SynthesisJob.voice_profile_id,
+    SynthesisJob.engine_name,
+    func.substr(SynthesisJob.input_text, 1, _INPUT_PREVIEW_CHARS).label("input_preview"),
+    SynthesisJob.status,
+    SynthesisJob.output_storage_key,
+    SynthesisJob.error_message,
+    SynthesisJob.created_at,
+    SynthesisJob.updated_at,
+    SynthesisJob.batch_id,
+)
+
+
+# A status poll that misses the cache reads all but the input text and parameters.
+_JOB_STATUS_COLUMNS = load_only(
+    SynthesisJob.id,
+    SynthesisJob.voice_profile_id,
+    SynthesisJob.engine_name,
+    SynthesisJob.status,
+    SynthesisJob.output_storage_key,
+    SynthesisJob.error_message,
+    SynthesisJob.created_at,
+    SynthesisJob.updated_at,
+    SynthesisJob.batch_id,
+)
+
+
+async def _get_job(
+    db: AsyncSession,
+    job_id: uuid.UUID,
+    *,
+    status_only: bool = False,
+    for_update: bool = False,
+) -> SynthesisJob | None:
+    """Load a job by id, pruned to the partitions it can be in.
+
+    With *for_update* the row stays locked until the transaction ends, so
+    a worker cannot move the job on between the caller's check and write.
+    """
+    stmt = select(SynthesisJob).where(*SynthesisJob.id_criteria(job_id))
+    if status_only:
+        stmt = stmt.options(_JOB_STATUS_COLUMNS)
+    if for_update:
+        stmt = stmt.with_for_update(of=SynthesisJob)
+    return await db.scalar(stmt)
+
 
 @router.post(
     "/synthesize",
@@ -22,36 +154,696 @@ router = APIRouter(tags=["synthesis"])
 )
 async def submit_synthesis_job(
     body: SynthesisJobCreate,
+    response: Response,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> SynthesisJobResponse:
     """Submit a new text-to-speech synthesis job.
 
-    The job is queued for async processing and the response contains a job ID
-    that can be polled via ``GET /jobs/{job_id}``.
+    The job is persisted, routed to the interactive or bulk lane by its
+    estimated cost, and queued for async processing.  The response
+    contains a job ID that can be polled via ``GET /jobs/{job_id}``.
 
-    TODO: Validate voice profile exists and is READY, persist job row,
-          enqueue onto Redis/RQ synthesis queue.
+    An identical submission (same engine, voice, normalised text and
+    params) made while an earlier one is still in flight is attached to
+    that job instead: its ID is returned, nothing new is enqueued, and
+    ``X-Coalesced: true`` is set on the response.
+
+    New work is subject to admission control: when the target lane's
+    backlog is too deep (503) or its predicted wait too long (429) the
+    job is rejected with a ``Retry-After`` header.  Accepted jobs carry
+    an ``estimated_completion_at`` and are steered to the worker that
+    already holds the voice when it has room (voice affinity).
+
+    With a ``deadline`` or ``max_wait_ms``, a job that no worker has
+    started in time is dropped as ``EXPIRED`` – or completed from an
+    identical job's output, when one is cached.
     """
+    deadline = _deadline(body)
+    profile = await db.get(VoiceProfile, body.voice_profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Voice profile not found")
+    if profile.status != VoiceProfileStatus.READY or not profile.embedding_path:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Voice profile is not ready"
+        )
+
+    job_id = partitions.new_id()
+    coalesce_key = None
+    if get_config().coalescing.enabled:
+        coalesce_key = coalescing.coalesce_key(
+            body.engine_name, profile.id, body.text, body.params
+        )
+        inflight = await _attach_to_inflight(db, coalesce_key, job_id)
+        if inflight is not None:
+            response.headers["X-Coalesced"] = "true"
+            return SynthesisJobResponse.model_validate(inflight)
+
+    route = route_synthesis(body.text, body.engine_name)
+    verdict = await _admit(route)
+    if verdict is not None and not verdict.accepted:
+        if coalesce_key is not None:
+            await _release_inflight(coalesce_key, job_id)
+        raise HTTPException(
+            status_code=verdict.status_code,
+            detail="Synthesis queue is full, retry later",
+            headers={"Retry-After": str(verdict.retry_after_seconds)},
+        )
+    route = await _assign_worker(route, profile.id)
+
     now = datetime.now(timezone.utc)
-    return SynthesisJobResponse(
-        id=uuid.uuid4(),
-        voice_profile_id=body.voice_profile_id,
+    job = SynthesisJob(
+        id=job_id,
+        voice_profile_id=profile.id,
         engine_name=body.engine_name,
         input_text=body.text,
         params_json=body.params,
-        status="PENDING",
+        status=SynthesisJobStatus.PENDING,
         created_at=now,
         updated_at=now,
     )
+    db.add(job)
+    # The row must be visible before a worker can pick the task up.
+    await db.commit()
+    await counters.transition_async(SynthesisJob, None, SynthesisJobStatus.PENDING)
+    await job_status.fill([SynthesisJobStatusResponse.model_validate(job)])
+
+    try:
+        await run_in_threadpool(
+            enqueue_synthesis,
+            job_id=str(job.id),
+            text=body.text,
+            voice_embedding_json=voice_embedding_json(profile, body.engine_name),
+            engine_name=body.engine_name,
+            params=body.params,
+            coalesce_key=coalesce_key,
+            deadline=deadline,
+            route=route,
+        )
+    except Exception as exc:
+        logger.exception("Failed to enqueue synthesis job %s", job.id)
+        job.status = SynthesisJobStatus.FAILED
+        job.error_message = "Could not enqueue job"
+        await db.commit()
+        await counters.transition_async(
+            SynthesisJob, SynthesisJobStatus.PENDING, SynthesisJobStatus.FAILED
+        )
+        await job_status.record_async(
+            str(job.id), status=SynthesisJobStatus.FAILED, error_message=job.error_message
+        )
+        if coalesce_key is not None:
+            await _release_inflight(coalesce_key, job.id)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Job queue unavailable"
+        ) from exc
+    await events.publish_async(str(job.id), events.QUEUED, lane=route.lane)
+
+    result = SynthesisJobResponse.model_validate(job)
+    if verdict is not None:
+        result.estimated_completion_at = now + timedelta(
+            seconds=verdict.estimated_wait_seconds + route.estimated_cost_seconds
+        )
+    return result
+
+
+def _deadline(item: SynthesisJobCreate) -> float | None:
+    """Return *item*'s deadline as unix time; 422 if it has already passed."""
+    now = datetime.now(timezone.utc)
+    deadline = item.deadline_at(now)
+    if deadline is None:
+        return None
+    if deadline <= now:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Deadline has already passed",
+        )
+    return deadline.timestamp()
+
 
+async def _admit(route: Route, count: int = 1) -> admission.Admission | None:
+    """Run admission control for *count* jobs like *route*; ``None`` if skipped.
 
-@router.get("/jobs/{job_id}", response_model=SynthesisJobResponse)
+    For a batch, the check is made for its last job, i.e. as if the
+    ``count - 1`` jobs before it were already queued.  Like coalescing,
+    admission fails open: an unreadable queue must not take submissions
+    down with it.
+    """
+    if not get_config().admission.enabled:
+        return None
+    try:
+        load = await admission.read_lane_load(route.lane)
+    except RedisError:
+        logger.warning("Queue depth unavailable; admitting without a check", exc_info=True)
+        return None
+    load = dataclasses.replace(load, depth=load.depth + count - 1)
+    verdict = admission.assess(load, route)
+    if not verdict.accepted:
+        logger.info(
+            "Rejected synthesis job for %s: depth=%d wait=%.1fs (HTTP %d)",
+            route.lane,
+            load.depth,
+            verdict.estimated_wait_seconds,
+            verdict.status_code,
+        )
+    return verdict
+
+
+async def _attach_to_inflight(
+    db: AsyncSession, key: str, job_id: uuid.UUID
+) -> SynthesisJob | None:
+    """Claim *key* for *job_id*, or return the job that already holds it.
+
+    ``None`` means the caller now owns the key and should create and
+    enqueue its job.  A holder whose row never shows up (it crashed
+    before committing) or that has already failed, been cancelled or
+    expired is taken over.
+    Coalescing is an optimisation only: if Redis is unavailable the
+    submission simply goes ahead on its own.
+    """
+    cfg = get_config().coalescing
+    try:
+        holder = await coalescing.claim(key, str(job_id), cfg.ttl_seconds)
+        if holder is None:
+            return None
+
+        # The holder commits its row right after claiming; give it a moment.
+        deadline = asyncio.get_running_loop().time() + cfg.attach_wait_ms / 1000
+        while True:
+            inflight = await _get_job(db, uuid.UUID(holder))
+            if inflight is not None or asyncio.get_running_loop().time() >= deadline:
+                break
+            await asyncio.sleep(0.05)
+
+        if inflight is not None and inflight.status not in (
+            SynthesisJobStatus.FAILED,
+            SynthesisJobStatus.CANCELLED,
+            SynthesisJobStatus.EXPIRED,
+        ):
+            logger.info("Coalesced submission onto in-flight job %s", inflight.id)
+            return inflight
+        await coalescing.take_over(key, str(job_id), cfg.ttl_seconds)
+    except RedisError:
+        logger.warning("Coalescing unavailable; submitting uncoalesced", exc_info=True)
+    return None
+
+
+async def _assign_worker(route: Route, voice_profile_id: uuid.UUID) -> Route:
+    """Apply voice-affinity routing; the shared lane queue if unavailable."""
+    try:
+        return await affinity.assign(route, voice_profile_id)
+    except RedisError:
+        logger.warning("Affinity routing unavailable; using the shared queue", exc_info=True)
+        return route
+
+
+async def _release_inflight(key: str, job_id: uuid.UUID) -> None:
+    try:
+        await coalescing.release_async(key, str(job_id))
+    except RedisError:
+        logger.warning("Could not release in-flight marker for job %s", job_id, exc_info=True)
+
+
+@router.get("/jobs", response_model=list[SynthesisJobSummary])
+async def list_synthesis_jobs(
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    voice_profile_id: uuid.UUID | None = None,
+    status_filter: Annotated[SynthesisJobStatus | None, Query(alias="status")] = None,
+    cursor: str | None = None,
+    limit: Annotated[int | None, Query(ge=1)] = None,
+) -> list[SynthesisJobSummary]:
+    """List synthesis jobs, newest first, one keyset page at a time.
+
+    Filter by voice profile and/or status.  Pass the ``X-Next-Cursor``
+    response header back as ``cursor`` to get the following page; the
+    header is absent on the last page.  Jobs are summarised; the full
+    job is at ``GET /jobs/{job_id}``.
+    """
+    size = page_size(limit)
+    stmt = select(*_JOB_SUMMARY_COLUMNS)
+    if voice_profile_id is not None:
+        stmt = stmt.where(SynthesisJob.voice_profile_id == voice_profile_id)
+    if status_filter is not None:
+        stmt = stmt.where(SynthesisJob.status == status_filter)
+    try:
+        stmt = keyset_page(stmt, SynthesisJob, cursor, size)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    rows, next_cursor = split_page((await db.execute(stmt)).all(), size)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return [SynthesisJobSummary.model_validate(row) for row in rows]
+
+
+@router.get("/jobs/{job_id}", response_model=SynthesisJobStatusResponse)
 async def get_synthesis_job(
+    job_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+) -> SynthesisJobStatusResponse:
+    """Poll the status of a synthesis job.
+
+    Served from the job's Redis status hash (see ``backend.job_status``);
+    on a miss the row is read from the database and cached.  The input
+    text and parameters are not included.
+    """
+    try:
+        cached = await job_status.read(str(job_id))
+    except RedisError:
+        logger.warning("Status cache unavailable for job %s", job_id, exc_info=True)
+        cached = None
+    if cached is not None:
+        return cached
+
+    job = await _get_job(db, job_id, status_only=True)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    result = SynthesisJobStatusResponse.model_validate(job)
+    await job_status.fill([result])
+    return result
+
+
+@router.delete("/jobs/{job_id}", response_model=SynthesisJobResponse)
+async def cancel_synthesis_job(
     job_id: uuid.UUID,
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> SynthesisJobResponse:
-    """Poll the status of a synthesis job.
+    """Cancel a synthesis job.
+
+    A queued job's task is revoked so that no worker starts it; a running
+    job stops at its next cancellation check (see
+    ``backend.cancellation``).  Cancelling a cancelled job is a no-op;
+    a completed or failed job cannot be cancelled (409).
+    """
+    # Locked, like the reaper's reclaim: a worker's transition either lands
+    # before this read or waits for the cancellation to commit.
+    job = await _get_job(db, job_id, for_update=True)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    if job.status == SynthesisJobStatus.CANCELLED:
+        return SynthesisJobResponse.model_validate(job)
+    if job.status in _FINAL_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job already {job.status.value.lower()}",
+        )
+
+    previous = job.status
+    started = previous == SynthesisJobStatus.PROCESSING
+    job.status = SynthesisJobStatus.CANCELLED
+    await db.commit()
+    await counters.transition_async(SynthesisJob, previous, SynthesisJobStatus.CANCELLED)
+    await job_status.record_async(str(job_id), status=SynthesisJobStatus.CANCELLED)
+
+    try:
+        await cancellation.request_cancel(str(job_id))
+        started = started or await events.last_stage(str(job_id)) in _RUNNING_STAGES
+    except RedisError:
+        logger.warning("Could not flag job %s as cancelled", job_id, exc_info=True)
+    try:
+        await run_in_threadpool(revoke_synthesis, str(job_id))
+    except Exception:
+        logger.warning("Could not revoke the task of job %s", job_id, exc_info=True)
+
+    # A running job's worker reports the share it did not have to compute.
+    if not started:
+        await metrics.record_cancellation_async(
+            "queued", estimate_cost(job.input_text, job.engine_name)
+        )
+    await events.publish_async(str(job_id), events.CANCELLED)
+    return SynthesisJobResponse.model_validate(job)
 
-    TODO: Query DB by job_id, return 404 if not found.
+
+@router.post(
+    "/synthesize/batch",
+    response_model=SynthesisBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_synthesis_batch(
+    body: SynthesisBatchCreate,
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> SynthesisBatchResponse:
+    """Submit many synthesis jobs in one request.
+
+    Voices are validated with a single query, all job rows are inserted
+    in one statement and one transaction, and the tasks are published
+    over a single broker connection.  Admission control is applied per
+    lane for the batch as a whole.  Progress is available in aggregate
+    from ``GET /batches/{batch_id}`` and per job as usual.
+
+    Batch jobs always use the shared lane queues: a large batch would
+    overrun any single worker's affinity queue, and content pipelines
+    rarely repeat prompts, so batches are not coalesced either.
     """
-    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    items = body.items
+    max_items = get_config().limits.max_batch_size
+    if len(items) > max_items:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"A batch may contain at most {max_items} items",
+        )
+    deadlines = [_deadline(item) for item in items]
+
+    voice_ids = {item.voice_profile_id for item in items}
+    profiles = {
+        p.id: p
+        for p in await db.scalars(select(VoiceProfile).where(VoiceProfile.id.in_(voice_ids)))
+    }
+    missing = voice_ids - profiles.keys()
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Voice profile(s) not found: {', '.join(sorted(map(str, missing)))}",
+        )
+    not_ready = [
+        p.id
+        for p in profiles.values()
+        if p.status != VoiceProfileStatus.READY or not p.embedding_path
+    ]
+    if not_ready:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Voice profile(s) not ready: {', '.join(sorted(map(str, not_ready)))}",
+        )
+
+    routes = [route_synthesis(item.text, item.engine_name) for item in items]
+    verdicts: list[tuple[admission.Admission, Route]] = []
+    for lane in {r.lane for r in routes}:
+        in_lane = [r for r in routes if r.lane == lane]
+        slowest = max(in_lane, key=lambda r: r.estimated_cost_seconds)
+        verdict = await _admit(slowest, count=len(in_lane))
+        if verdict is None:
+            continue
+        if not verdict.accepted:
+            raise HTTPException(
+                status_code=verdict.status_code,
+                detail="Synthesis queue is full, retry later",
+                headers={"Retry-After": str(verdict.retry_after_seconds)},
+            )
+        verdicts.append((verdict, slowest))
+
+    batch_id = uuid.uuid4()
+    job_ids = [partitions.new_id() for _ in items]
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "id": job_id,
+            "batch_id": batch_id,
+            "voice_profile_id": item.voice_profile_id,
+            "engine_name": item.engine_name,
+            "input_text": item.text,
+            "params_json": item.params,
+            "status": SynthesisJobStatus.PENDING,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for job_id, item in zip(job_ids, items)
+    ]
+    await db.execute(insert(SynthesisJob), rows)
+    await db.commit()
+    await counters.transition_async(
+        SynthesisJob, None, SynthesisJobStatus.PENDING, n=len(job_ids)
+    )
+    await job_status.fill([SynthesisJobStatusResponse.model_validate(row) for row in rows])
+
+    voice_json: dict[tuple[uuid.UUID, str], str] = {}
+    for item in items:
+        key = (item.voice_profile_id, item.engine_name)
+        if key not in voice_json:
+            voice_json[key] = voice_embedding_json(profiles[item.voice_profile_id], item.engine_name)
+    requests = [
+        {
+            "job_id": str(job_id),
+            "text": item.text,
+            "voice_embedding_json": voice_json[(item.voice_profile_id, item.engine_name)],
+            "engine_name": item.engine_name,
+            "params": item.params,
+            "deadline": deadline,
+            "route": route,
+        }
+        for job_id, item, route, deadline in zip(job_ids, items, routes, deadlines)
+    ]
+    try:
+        await run_in_threadpool(enqueue_synthesis_many, requests)
+    except PartialEnqueueError as exc:
+        logger.exception("Failed to enqueue batch %s after %d job(s)", batch_id, exc.published)
+        await db.execute(
+            update(SynthesisJob)
+            .where(*SynthesisJob.id_criteria(*job_ids[exc.published :]))
+            .values(status=SynthesisJobStatus.FAILED, error_message="Could not enqueue job")
+        )
+        await db.commit()
+        await counters.transition_async(
+            SynthesisJob,
+            SynthesisJobStatus.PENDING,
+            SynthesisJobStatus.FAILED,
+            n=len(job_ids) - exc.published,
+        )
+        for job_id in job_ids[exc.published :]:
+            await job_status.record_async(
+                str(job_id), status=SynthesisJobStatus.FAILED, error_message="Could not enqueue job"
+            )
+        await events.publish_many_async(
+            [str(j) for j in job_ids[: exc.published]], events.QUEUED
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "message": "Job queue unavailable",
+                "batch_id": str(batch_id),
+                "enqueued": exc.published,
+            },
+        ) from exc
+    await events.publish_many_async([str(j) for j in job_ids], events.QUEUED)
+
+    eta = None
+    if verdicts:
+        eta = now + timedelta(
+            seconds=max(v.estimated_wait_seconds + r.estimated_cost_seconds for v, r in verdicts)
+        )
+    return SynthesisBatchResponse(batch_id=batch_id, job_ids=job_ids, estimated_completion_at=eta)
+
+
+@router.get("/batches/{batch_id}", response_model=SynthesisBatchStatus)
+async def get_synthesis_batch(
+    batch_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+) -> SynthesisBatchStatus:
+    """Aggregate status of a batch: job counts per status."""
+    rows = await db.execute(
+        select(SynthesisJob.status, func.count())
+        .where(SynthesisJob.batch_id == batch_id)
+        .group_by(SynthesisJob.status)
+    )
+    counts = {SynthesisJobStatus(s): n for s, n in rows.all()}
+    total = sum(counts.values())
+    if total == 0:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Batch not found")
+    return SynthesisBatchStatus(
+        batch_id=batch_id,
+        total=total,
+        counts=counts,
+        finished=sum(n for s, n in counts.items() if s in _FINAL_STATUSES) == total,
+    )
+
+
+async def _job_events(
+    job_id: uuid.UUID, db: AsyncSession
+) -> AsyncIterator[dict | None] | None:
+    """Return *job_id*'s event stream, or ``None`` if the job is unknown.
+
+    A job that already finished yields a single event built from its row.
+    The DB session is closed before streaming so that a long-lived
+    connection does not pin a pooled database connection.
+    """
+    job = await _get_job(db, job_id)
+    if job is None:
+        return None
+    if job.status not in _FINAL_STATUSES:
+        await db.close()
+        return events.subscribe(str(job_id))
+
+    snapshot = events.make_event(
+        str(job.id),
+        _FINAL_STAGES[job.status],
+        output_storage_key=job.output_storage_key,
+        error=job.error_message,
+    )
+    await db.close()
+
+    async def _finished() -> AsyncIterator[dict | None]:
+        yield snapshot
+
+    return _finished()
+
+
+@router.get(
+    "/jobs/{job_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_synthesis_events(
+    job_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+) -> StreamingResponse:
+    """Stream a job's progress as Server-Sent Events.
+
+    Emits one event per stage transition (``queued``, ``started``,
+    ``chunk``, ``uploaded``, ``completed`` / ``failed``), starting with
+    the current stage, and closes after the final one.  Idle streams get
+    a comment line every ``events.keepalive_seconds``.
+    """
+    stream = await _job_events(job_id, db)
+    if stream is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+    async def _sse() -> AsyncIterator[str]:
+        async with aclosing(stream):
+            async for event in stream:
+                if event is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: {event['stage']}\ndata: {json.dumps(event, default=str)}\n\n"
+
+    return StreamingResponse(
+        _sse(),
+        media_type="text/event-stream",
+        # Stop reverse proxies from buffering the stream.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/jobs/{job_id}/ws")
+async def synthesis_events_ws(
+    websocket: WebSocket,
+    job_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+) -> None:
+    """WebSocket variant of ``GET /jobs/{job_id}/events``.
+
+    Sends each event as a JSON text frame and closes normally after the
+    final one.
+    """
+    stream = await _job_events(job_id, db)
+    if stream is None:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Job not found")
+
+    await websocket.accept()
+    async with aclosing(stream):
+        try:
+            async for event in stream:
+                if event is not None:
+                    await websocket.send_json(event)
+        except WebSocketDisconnect:
+            return
+    await websocket.close()
+
+
+@router.get(
+    "/jobs/{job_id}/audio",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"audio/wav": {}}},
+        206: {"description": "Partial content for a satisfiable ``Range``"},
+        304: {"description": "Not modified (``If-None-Match`` matched)"},
+        416: {"description": "Requested range not satisfiable"},
+    },
+)
+async def get_synthesis_audio(
+    job_id: uuid.UUID,
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
+    range_header: Annotated[str | None, Header(alias="Range")] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+    if_range: Annotated[str | None, Header()] = None,
+) -> Response:
+    """Stream a job's generated audio from object storage.
+
+    Supports single-range ``Range`` requests (so browsers can seek and
+    resume), ``ETag`` / ``If-None-Match`` revalidation and ``If-Range``.
+    Bytes are proxied chunk by chunk and never buffered whole in memory.
+    """
+    job = await _get_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    if not job.output_storage_key:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Job has no audio output yet"
+        )
+
+    info = await run_in_threadpool(storage.stat_object, job.output_storage_key)
+    if info is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audio not found")
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": _AUDIO_CACHE_CONTROL,
+        "ETag": info.etag,
+    }
+    if if_none_match is not None and _etag_matches(if_none_match, info.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    byte_range = None
+    if range_header is not None and (if_range is None or if_range == info.etag):
+        byte_range = _parse_range(range_header, info.size)
+
+    if byte_range is None:
+        body = storage.iter_object(info.storage_key)
+        headers["Content-Length"] = str(info.size)
+        return StreamingResponse(
+            iterate_in_threadpool(body), media_type=info.content_type, headers=headers
+        )
+
+    start, end = byte_range
+    body = storage.iter_object(info.storage_key, start, end)
+    headers["Content-Length"] = str(end - start + 1)
+    headers["Content-Range"] = f"bytes {start}-{end}/{info.size}"
+    return StreamingResponse(
+        iterate_in_threadpool(body),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=info.content_type,
+        headers=headers,
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against *etag*."""
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == bare
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """Parse a ``Range`` header into an inclusive ``(start, end)`` pair.
+
+    Returns ``None`` when the header should be ignored (unknown unit,
+    malformed, or multiple ranges – we then serve the full body, which
+    RFC 9110 permits).  Raises 416 when the range cannot be satisfied.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        elif last:
+            start, end = max(size - int(last), 0), size - 1
+        else:
+            return None
+    except ValueError:
+        return None
+
+    if start >= size:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    if start > end:
+        return None
+    return start, min(end, size - 1)
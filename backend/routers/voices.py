@@ -6,14 +6,34 @@ import uuid
 from datetime import datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.database import get_db
-from backend.schemas import AudioSampleResponse, VoiceProfileCreate, VoiceProfileResponse
+from backend.database import get_db, get_primary_read_db, get_read_db
+from backend.models import VoiceProfile
+from backend.pagination import NEXT_CURSOR_HEADER, keyset_page, page_size, split_page
+from backend.schemas import (
+    AudioSampleResponse,
+    VoiceProfileCreate,
+    VoiceProfileResponse,
+    VoiceProfileSummary,
+)
 
 router = APIRouter(prefix="/voices", tags=["voices"])
 
+# Listings select only the columns ``VoiceProfileSummary`` shows.
+_VOICE_SUMMARY_COLUMNS = (
+    VoiceProfile.id,
+    VoiceProfile.user_id,
+    VoiceProfile.label,
+    VoiceProfile.language,
+    VoiceProfile.status,
+    VoiceProfile.engine_name,
+    VoiceProfile.created_at,
+    VoiceProfile.updated_at,
+)
+
 
 @router.post(
     "",
@@ -42,22 +62,40 @@ async def create_voice_profile(
     )
 
 
-@router.get("", response_model=list[VoiceProfileResponse])
+@router.get("", response_model=list[VoiceProfileSummary])
 async def list_voice_profiles(
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[VoiceProfileResponse]:
-    """List all voice profiles for the current user.
-
-    TODO: Query DB with user-scoped filter + pagination.
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    user_id: uuid.UUID | None = None,
+    cursor: str | None = None,
+    limit: Annotated[int | None, Query(ge=1)] = None,
+) -> list[VoiceProfileSummary]:
+    """List voice profiles, newest first, one keyset page at a time.
+
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` to get
+    the following page; the header is absent on the last page.  Profiles
+    are summarised; the full profile is at ``GET /voices/{voice_id}``.
+
+    TODO: Take the user from the auth context instead of ``user_id``.
     """
-    # TODO: Real DB query.
-    return []
+    size = page_size(limit)
+    stmt = select(*_VOICE_SUMMARY_COLUMNS)
+    if user_id is not None:
+        stmt = stmt.where(VoiceProfile.user_id == user_id)
+    try:
+        stmt = keyset_page(stmt, VoiceProfile, cursor, size)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    rows, next_cursor = split_page((await db.execute(stmt)).all(), size)
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return [VoiceProfileSummary.model_validate(row) for row in rows]
 
 
 @router.get("/{voice_id}", response_model=VoiceProfileResponse)
 async def get_voice_profile(
     voice_id: uuid.UUID,
-    db: Annotated[AsyncSession, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_primary_read_db)],
 ) -> VoiceProfileResponse:
     """Get a single voice profile by ID.
 
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -40,6 +40,21 @@ class VoiceProfileResponse(BaseModel):
     updated_at: datetime
 
 
+class VoiceProfileSummary(BaseModel):
+    """A voice profile in listings: without its embedding path and metadata."""
+
+    model_config = {"from_attributes": True}
+
+    id: uuid.UUID
+    user_id: uuid.UUID
+    label: str
+    language: str
+    status: VoiceProfileStatus
+    engine_name: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
 class AudioSampleResponse(BaseModel):
     """Serialised audio sample."""
 
@@ -65,6 +80,22 @@ class SynthesisJobCreate(BaseModel):
     engine_name: str = Field(default="xtts-hindi", max_length=64)
     text: str = Field(..., min_length=1, max_length=5000)
     params: dict[str, Any] | None = None
+    # Optional client deadline; a job not started by then is dropped as
+    # EXPIRED.  When both are given, the earlier one applies.
+    deadline: datetime | None = None
+    max_wait_ms: int | None = Field(default=None, gt=0)
+
+    def deadline_at(self, now: datetime) -> datetime | None:
+        """Return the effective deadline for a job submitted at *now*."""
+        candidates = []
+        if self.deadline is not None:
+            deadline = self.deadline
+            if deadline.tzinfo is None:
+                deadline = deadline.replace(tzinfo=timezone.utc)
+            candidates.append(deadline)
+        if self.max_wait_ms is not None:
+            candidates.append(now + timedelta(milliseconds=self.max_wait_ms))
+        return min(candidates, default=None)
 
 
 class SynthesisJobResponse(BaseModel):
@@ -82,6 +113,75 @@ class SynthesisJobResponse(BaseModel):
     error_message: str | None = None
     created_at: datetime
     updated_at: datetime
+    batch_id: uuid.UUID | None = None
+    # Share of the work done (0–1) while running, when the worker reports it.
+    progress: float | None = None
+    # Set on submission only: queue wait plus estimated synthesis time.
+    estimated_completion_at: datetime | None = None
+
+
+class SynthesisJobSummary(BaseModel):
+    """A synthesis job in listings: without its input text and parameters."""
+
+    model_config = {"from_attributes": True}
+
+    id: uuid.UUID
+    voice_profile_id: uuid.UUID
+    engine_name: str
+    # The start of ``input_text``, to tell jobs apart in a list.
+    input_preview: str
+    status: SynthesisJobStatus
+    output_storage_key: str | None = None
+    error_message: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    batch_id: uuid.UUID | None = None
+
+
+class SynthesisJobStatusResponse(BaseModel):
+    """A synthesis job's state, as polled through ``GET /jobs/{id}``.
+
+    Leaves out the input text and parameters, which the client sent
+    itself, so that polls are served from a small cached hash (see
+    ``backend.job_status``).
+    """
+
+    model_config = {"from_attributes": True}
+
+    id: uuid.UUID
+    voice_profile_id: uuid.UUID
+    engine_name: str
+    status: SynthesisJobStatus
+    # Share of the work done (0–1) while running, when the worker reports it.
+    progress: float | None = None
+    output_storage_key: str | None = None
+    error_message: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    batch_id: uuid.UUID | None = None
+
+
+class SynthesisBatchCreate(BaseModel):
+    """Request body for ``POST /synthesize/batch``."""
+
+    items: list[SynthesisJobCreate] = Field(..., min_length=1)
+
+
+class SynthesisBatchResponse(BaseModel):
+    """Accepted batch: its ID and the job IDs, in submission order."""
+
+    batch_id: uuid.UUID
+    job_ids: list[uuid.UUID]
+    estimated_completion_at: datetime | None = None
+
+
+class SynthesisBatchStatus(BaseModel):
+    """Aggregate status of a batch, for ``GET /batches/{batch_id}``."""
+
+    batch_id: uuid.UUID
+    total: int
+    counts: dict[SynthesisJobStatus, int]
+    finished: bool
 
 
 # ---------------------------------------------------------------------------
@@ -98,11 +198,34 @@ class EngineInfo(BaseModel):
     device: str
 
 
+class DatabasePoolStats(BaseModel):
+    """The API process's connection pool, for sizing ``database.pool_size``."""
+
+    size: int = 0
+    checked_out: int = 0
+    idle: int = 0
+    overflow: int = 0
+    max_connections: int = 0
+    # Cumulative since the process started; a rising wait means the pool is
+    # too small (or connections are held too long).
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+
 class AdminMetrics(BaseModel):
     total_voices: int = 0
     total_jobs: int = 0
     pending_jobs: int = 0
     processing_jobs: int = 0
+    voices_by_status: dict[VoiceProfileStatus, int] = Field(default_factory=dict)
+    jobs_by_status: dict[SynthesisJobStatus, int] = Field(default_factory=dict)
+    # Jobs taken back from workers that stopped heartbeating.
+    reclaimed_requeued: int = 0
+    reclaimed_failed: int = 0
+    # Of the API process that served the request.
+    db_pool: DatabasePoolStats | None = None
 
 
 class QueueStats(BaseModel):
@@ -111,3 +234,49 @@ class QueueStats(BaseModel):
     started: int = 0
     finished: int = 0
     failed: int = 0
+    # Age of the oldest queued message, when it can be told.
+    oldest_age_seconds: float | None = None
+
+
+class CancellationStats(BaseModel):
+    """Cancelled synthesis jobs and the worker time they freed up."""
+
+    cancelled_queued: int = 0
+    cancelled_running: int = 0
+    compute_seconds_saved: float = 0.0  # estimated with the routing cost model
+
+
+class TaskFailureStats(BaseModel):
+    """Retries and final failures of one task, per failure class."""
+
+    task: str
+    failure_class: str
+    retries: int = 0
+    failures: int = 0
+
+
+class AutoscalerDecision(BaseModel):
+    """The autoscaler's latest sizing decision for one worker pool."""
+
+    pool: str
+    current_workers: int
+    desired_workers: int
+    queue_depth: int
+    oldest_age_seconds: float
+    age_slope: float  # growth of the oldest message's age, seconds per second
+    reason: str
+    decided_at: float  # unix time
+
+
+class LaneWaitStats(BaseModel):
+    """Queue wait times for one synthesis latency lane.
+
+    Percentiles and max are over the most recent samples only.
+    """
+
+    lane: str
+    total_tasks: int = 0
+    mean_wait_seconds: float = 0.0
+    p50_wait_seconds: float = 0.0
+    p95_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
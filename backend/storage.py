@@ -2,23 +2,39 @@
 
 from __future__ import annotations
 
+import functools
+import io
 import logging
+import shutil
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import boto3
 from botocore.client import Config as BotoConfig
+from botocore.exceptions import ClientError
 
 if TYPE_CHECKING:
     import botocore.client
 
 from backend.config import get_config
+from backend.disk_cache import DiskCache
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def _get_s3_client() -> "botocore.client.BaseClient":
-    """Create a boto3 S3 client configured for the storage backend."""
+    """Return the process-wide boto3 S3 client for the storage backend.
+
+    boto3 clients are thread-safe and expensive to build (endpoint
+    resolution, credential chain, service model loading), so one client
+    is shared for the lifetime of the process.
+    """
     cfg = get_config().storage
     return boto3.client(
         "s3",
@@ -30,12 +46,20 @@ def _get_s3_client() -> "botocore.client.BaseClient":
     )
 
 
-async def upload_file(local_path: Path, storage_key: str) -> str:
+# Above this size in-memory uploads switch from a single PutObject to a
+# (concurrent) multipart upload.  Matches boto3's default TransferConfig.
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+
+
+async def upload_file(
+    local_path: Path, storage_key: str, content_type: str | None = None
+) -> str:
     """Upload a local file to object storage.
 
     Args:
         local_path: Path to the file on disk.
         storage_key: The key (path) to use inside the bucket.
+        content_type: Optional ``Content-Type`` to store with the object.
 
     Returns:
         The storage key on success.
@@ -43,22 +67,295 @@ async def upload_file(local_path: Path, storage_key: str) -> str:
     # TODO: Move to async (aioboto3) for true non-blocking I/O.
     bucket = get_config().storage.bucket
     client = _get_s3_client()
-    client.upload_file(str(local_path), bucket, storage_key)
+    extra_args = {"ContentType": content_type} if content_type else None
+    client.upload_file(str(local_path), bucket, storage_key, ExtraArgs=extra_args)
+    _forget_cached(storage_key)
     logger.info("Uploaded %s → s3://%s/%s", local_path, bucket, storage_key)
     return storage_key
 
 
+async def upload_bytes(
+    data: bytes, storage_key: str, content_type: str | None = None
+) -> str:
+    """Upload an in-memory buffer to object storage without touching disk.
+
+    Small buffers go up in a single ``PutObject``; larger ones use a
+    multipart upload streamed from memory.
+
+    Returns:
+        The storage key on success.
+    """
+    bucket = get_config().storage.bucket
+    client = _get_s3_client()
+    extra_args = {"ContentType": content_type} if content_type else {}
+    if len(data) <= _MULTIPART_THRESHOLD:
+        client.put_object(Bucket=bucket, Key=storage_key, Body=data, **extra_args)
+    else:
+        client.upload_fileobj(
+            io.BytesIO(data), bucket, storage_key, ExtraArgs=extra_args or None
+        )
+    _forget_cached(storage_key)
+    logger.info("Uploaded %d bytes → s3://%s/%s", len(data), bucket, storage_key)
+    return storage_key
+
+
+def _forget_cached(storage_key: str) -> None:
+    """Drop every locally cached view of an overwritten object."""
+    invalidate_presigned_url(storage_key)
+    cache = get_disk_cache()
+    if cache is not None:
+        cache.invalidate(storage_key)
+
+
 async def download_file(storage_key: str, local_path: Path) -> Path:
     """Download a file from object storage to a local path.
 
+    When the worker-local disk cache is enabled the object is served from
+    (or read through) the cache and then copied to *local_path*, which the
+    caller is free to modify.  Objects too large for the cache are
+    downloaded straight to *local_path*.
+
     Returns:
         The local path of the downloaded file.
     """
+    cache = get_disk_cache()
+    if cache is None:
+        _fetch_object(storage_key, local_path)
+        return local_path
+
+    cached = cache.get(storage_key, _fetch_object, dest=local_path)
+    if cached == local_path:
+        return local_path
+    shutil.copyfile(cached, local_path)
+    return local_path
+
+
+async def get_cached_path(storage_key: str) -> Path:
+    """Return a read-only local path for *storage_key* via the disk cache.
+
+    Unlike :func:`download_file` no per-call copy is made, which is what
+    workers want for large, immutable artefacts such as embeddings and
+    model weights.  Falls back to a plain download into the cache
+    directory when caching is disabled.
+    """
+    cache = get_disk_cache()
+    if cache is not None:
+        return cache.get(storage_key, _fetch_object)
+    dest = Path(get_config().disk_cache.dir) / "uncached" / storage_key
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    _fetch_object(storage_key, dest)
+    return dest
+
+
+@functools.lru_cache(maxsize=1)
+def get_disk_cache() -> DiskCache | None:
+    """Return the process-wide ``DiskCache``, or ``None`` when disabled."""
+    cfg = get_config().disk_cache
+    if not cfg.enabled:
+        return None
+    return DiskCache(Path(cfg.dir), max_bytes=cfg.max_bytes, verify_on_hit=cfg.verify_on_hit)
+
+
+def _fetch_object(storage_key: str, local_path: Path) -> str | None:
+    """Download *storage_key* to *local_path* and return its ETag."""
     bucket = get_config().storage.bucket
     client = _get_s3_client()
+    head = client.head_object(Bucket=bucket, Key=storage_key)
     client.download_file(bucket, storage_key, str(local_path))
     logger.info("Downloaded s3://%s/%s → %s", bucket, storage_key, local_path)
-    return local_path
+    return head.get("ETag")
+
+
+@dataclass(frozen=True)
+class ObjectInfo:
+    """Metadata of a stored object, as returned by ``HEAD``."""
+
+    storage_key: str
+    size: int
+    etag: str
+    content_type: str
+    last_modified: datetime | None = None
+
+
+def stat_object(storage_key: str) -> ObjectInfo | None:
+    """Return metadata for *storage_key*, or ``None`` if it does not exist.
+
+    Blocking (a ``HEAD`` request): async callers should run it in a
+    thread pool (e.g. ``starlette.concurrency.run_in_threadpool``).
+    """
+    client = _get_s3_client()
+    try:
+        head = client.head_object(Bucket=get_config().storage.bucket, Key=storage_key)
+    except ClientError as exc:
+        if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+    return ObjectInfo(
+        storage_key=storage_key,
+        size=head["ContentLength"],
+        etag=head["ETag"],
+        content_type=head.get("ContentType") or "application/octet-stream",
+        last_modified=head.get("LastModified"),
+    )
+
+
+def iter_object(
+    storage_key: str,
+    start: int | None = None,
+    end: int | None = None,
+    chunk_size: int = 64 * 1024,
+) -> Iterator[bytes]:
+    """Stream the bytes of *storage_key* (optionally ``start..end`` inclusive).
+
+    This is a blocking iterator over the S3 response body – nothing is
+    buffered beyond one chunk – so async callers should drive it from a
+    thread pool (e.g. ``starlette.concurrency.iterate_in_threadpool``).
+    """
+    params = {"Bucket": get_config().storage.bucket, "Key": storage_key}
+    if start is not None:
+        params["Range"] = f"bytes={start}-{'' if end is None else end}"
+    body = _get_s3_client().get_object(**params)["Body"]
+    try:
+        yield from body.iter_chunks(chunk_size)
+    finally:
+        body.close()
+
+
+def list_objects(
+    prefix: str,
+    modified_before: datetime | None = None,
+    start_after: str | None = None,
+) -> Iterator[ObjectInfo]:
+    """Yield objects under *prefix* in key order, optionally only those older than a cutoff.
+
+    With *start_after*, listing resumes after that key.  Blocking:
+    intended for worker / maintenance code.
+    """
+    bucket = get_config().storage.bucket
+    paginator = _get_s3_client().get_paginator("list_objects_v2")
+    extra = {"StartAfter": start_after} if start_after else {}
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix, **extra):
+        for obj in page.get("Contents", []):
+            if modified_before is not None and obj["LastModified"] >= modified_before:
+                continue
+            yield ObjectInfo(
+                storage_key=obj["Key"],
+                size=obj["Size"],
+                etag=obj["ETag"],
+                content_type="application/octet-stream",
+                last_modified=obj["LastModified"],
+            )
+
+
+def delete_objects(storage_keys: list[str]) -> int:
+    """Delete *storage_keys* in bulk (``DeleteObjects``, 1000 keys per call).
+
+    Returns:
+        The number of objects S3 reported as deleted.
+    """
+    bucket = get_config().storage.bucket
+    client = _get_s3_client()
+    deleted = 0
+    for i in range(0, len(storage_keys), 1000):
+        batch = storage_keys[i : i + 1000]
+        resp = client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": k} for k in batch], "Quiet": False},
+        )
+        for err in resp.get("Errors", []):
+            logger.warning("Failed to delete s3://%s/%s: %s", bucket, err.get("Key"), err.get("Message"))
+        deleted += len(resp.get("Deleted", []))
+        for key in batch:
+            _forget_cached(key)
+    return deleted
+
+
+# ---------------------------------------------------------------------------
+# Pre-signed URL cache
+# ---------------------------------------------------------------------------
+
+class _PresignCache:
+    """Small thread-safe TTL cache for pre-signed GET URLs.
+
+    Entries are keyed by ``(storage_key, expiry bucket)`` where the bucket
+    is the requested ``expires_in`` rounded up to ``bucket_seconds``.  A
+    cached URL is only handed out while at least ``min_remaining_ratio``
+    of the *requested* validity window is still left, so callers never
+    receive a URL that is about to expire.
+    """
+
+    def __init__(self, max_entries: int, bucket_seconds: int, min_remaining_ratio: float) -> None:
+        self._max_entries = max_entries
+        self._bucket_seconds = max(1, bucket_seconds)
+        self._min_remaining_ratio = min_remaining_ratio
+        self._entries: dict[tuple[str, int], tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, expires_in: int) -> int:
+        """Round *expires_in* up to the next expiry bucket."""
+        step = self._bucket_seconds
+        return max(step, -(-expires_in // step) * step)
+
+    def get(self, storage_key: str, expires_in: int) -> str | None:
+        key = (storage_key, self.bucket_for(expires_in))
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            url, expires_at = entry
+            if expires_at - now < expires_in * self._min_remaining_ratio:
+                del self._entries[key]
+                return None
+            return url
+
+    def put(self, storage_key: str, expires_in: int, url: str, expires_at: float) -> None:
+        key = (storage_key, self.bucket_for(expires_in))
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._max_entries:
+                self._evict_locked()
+            self._entries[key] = (url, expires_at)
+
+    def invalidate(self, storage_key: str) -> int:
+        with self._lock:
+            stale = [k for k in self._entries if k[0] == storage_key]
+            for k in stale:
+                del self._entries[k]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict_locked(self) -> None:
+        """Drop expired entries, or the soonest-to-expire one if none are."""
+        now = time.time()
+        expired = [k for k, (_, exp) in self._entries.items() if exp <= now]
+        for k in expired:
+            del self._entries[k]
+        if len(self._entries) >= self._max_entries:
+            oldest = min(self._entries, key=lambda k: self._entries[k][1])
+            del self._entries[oldest]
+
+
+@functools.lru_cache(maxsize=1)
+def _get_presign_cache() -> _PresignCache:
+    cfg = get_config().storage
+    return _PresignCache(
+        max_entries=cfg.presign_cache_max_entries,
+        bucket_seconds=cfg.presign_cache_bucket_seconds,
+        min_remaining_ratio=cfg.presign_cache_min_remaining_ratio,
+    )
+
+
+def invalidate_presigned_url(storage_key: str) -> None:
+    """Forget any cached pre-signed URLs for *storage_key*.
+
+    Must be called whenever an object is overwritten or deleted so that
+    pollers do not keep receiving a URL for the previous version.
+    """
+    if _get_presign_cache().invalidate(storage_key):
+        logger.debug("Invalidated cached pre-signed URL(s) for %s", storage_key)
 
 
 async def get_presigned_url(storage_key: str, expires_in: int = 3600) -> str:
@@ -70,12 +367,33 @@ async def get_presigned_url(storage_key: str, expires_in: int = 3600) -> str:
 
     Returns:
         A pre-signed URL string.
+
+    Signed URLs are cached per ``(storage_key, expiry bucket)`` and reused
+    while enough of their validity window remains, so repeated status
+    polls do not pay for a fresh SigV4 signature each time.
     """
-    bucket = get_config().storage.bucket
+    cfg = get_config().storage
+    if not cfg.presign_cache_enabled:
+        return _presign(storage_key, expires_in)
+
+    cache = _get_presign_cache()
+    cached = cache.get(storage_key, expires_in)
+    if cached is not None:
+        return cached
+
+    # Sign for the whole bucket so that a URL reused later in the window
+    # still covers the validity the later caller asked for.
+    signed_for = cache.bucket_for(expires_in)
+    url = _presign(storage_key, signed_for)
+    cache.put(storage_key, expires_in, url, time.time() + signed_for)
+    return url
+
+
+def _presign(storage_key: str, expires_in: int) -> str:
     client = _get_s3_client()
     url: str = client.generate_presigned_url(
         "get_object",
-        Params={"Bucket": bucket, "Key": storage_key},
+        Params={"Bucket": get_config().storage.bucket, "Key": storage_key},
         ExpiresIn=expires_in,
     )
     return url
@@ -0,0 +1,100 @@
+"""Tests for queue-depth admission control."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend import admission, metrics
+from backend.workers import affinity
+from backend.workers.routing import BULK_QUEUE, INTERACTIVE_QUEUE, Route, priority_queue_keys
+
+SHORT = Route(
+    lane=INTERACTIVE_QUEUE, queue=INTERACTIVE_QUEUE, priority=2, estimated_cost_seconds=2.0
+)
+LONG = Route(lane=BULK_QUEUE, queue=BULK_QUEUE, priority=7, estimated_cost_seconds=120.0)
+
+
+def _load(route: Route, depth: int, throughput: float = 1.0) -> admission.LaneLoad:
+    return admission.LaneLoad(queue=route.lane, depth=depth, throughput=throughput)
+
+
+class TestAssess:
+    def test_idle_lane_accepts(self) -> None:
+        verdict = admission.assess(_load(SHORT, 0), SHORT)
+        assert verdict.accepted
+        assert verdict.estimated_wait_seconds == 0
+
+    def test_wait_is_backlog_over_throughput(self) -> None:
+        verdict = admission.assess(_load(SHORT, 10, throughput=2.0), SHORT)
+        assert verdict.accepted
+        assert verdict.estimated_wait_seconds == 5.0
+
+    def test_long_predicted_wait_is_429(self) -> None:
+        # 60 queued at 1/s is a 60s wait, over the 30s interactive target.
+        verdict = admission.assess(_load(SHORT, 60), SHORT)
+        assert not verdict.accepted
+        assert verdict.status_code == 429
+        assert verdict.retry_after_seconds == 30
+
+    def test_saturated_lane_is_503(self) -> None:
+        verdict = admission.assess(_load(SHORT, 250, throughput=100.0), SHORT)
+        assert verdict.status_code == 503
+        assert verdict.retry_after_seconds == 1
+
+    def test_retry_after_is_capped(self) -> None:
+        verdict = admission.assess(_load(LONG, 100_000, throughput=0.01), LONG)
+        assert verdict.retry_after_seconds == 300
+
+    def test_unmeasured_throughput_falls_back_to_estimate(self) -> None:
+        # 4 concurrent jobs of 120s each: 8 queued jobs take 240s.
+        verdict = admission.assess(_load(LONG, 8, throughput=0.0), LONG)
+        assert verdict.accepted
+        assert verdict.estimated_wait_seconds == 240.0
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self.redis = redis
+        self.calls: list[tuple[str, tuple]] = []
+
+    def __getattr__(self, name: str):  # noqa: ANN204
+        return lambda *args: self.calls.append((name, args))
+
+    async def execute(self) -> list:
+        return [getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.lists: dict[str, int] = {}
+        self.sets: dict[str, set[str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    def smembers(self, key: str) -> set[str]:
+        return set(self.sets.get(key, set()))
+
+    def llen(self, key: str) -> int:
+        return self.lists.get(key, 0)
+
+
+async def test_lane_depth_includes_personal_queues(monkeypatch: pytest.MonkeyPatch) -> None:
+    redis = _FakeRedis()
+    monkeypatch.setattr(admission, "get_async_redis", lambda: redis)
+    monkeypatch.setattr(admission, "_personal_queues", set())
+
+    async def _throughput(queues: list[str], window: float) -> dict[str, float]:
+        return dict.fromkeys(queues, 1.0)
+
+    monkeypatch.setattr(metrics, "read_throughput", _throughput)
+    mine = affinity.personal_queue(INTERACTIVE_QUEUE, "node-a")
+    redis.sets[affinity.PERSONAL_QUEUES_KEY] = {
+        mine,
+        affinity.personal_queue(BULK_QUEUE, "node-a"),
+    }
+    redis.lists = {INTERACTIVE_QUEUE: 2, priority_queue_keys(mine)[3]: 5, BULK_QUEUE: 7}
+
+    # Personal queues found by one read are counted from the next one.
+    assert (await admission.read_lane_load(INTERACTIVE_QUEUE)).depth == 2
+    assert (await admission.read_lane_load(INTERACTIVE_QUEUE)).depth == 7
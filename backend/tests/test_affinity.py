@@ -0,0 +1,169 @@
+"""Tests for voice-affinity routing."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections import defaultdict
+from types import SimpleNamespace
+
+import pytest
+
+from backend.workers import affinity
+from backend.workers.routing import BULK_QUEUE, INTERACTIVE_QUEUE, Route, priority_queue_keys
+
+ROUTE = Route(
+    lane=INTERACTIVE_QUEUE, queue=INTERACTIVE_QUEUE, priority=1, estimated_cost_seconds=2.0
+)
+
+
+class _FakePipeline:
+    def __init__(self, lists: dict[str, list[str]]) -> None:
+        self._lists = lists
+        self._ops: list[str] = []
+
+    def llen(self, key: str) -> None:
+        self._ops.append(key)
+
+    async def execute(self) -> list[int]:
+        return [len(self._lists.get(k, [])) for k in self._ops]
+
+
+class _FakeRedis:
+    """The handful of Redis commands the affinity module uses."""
+
+    def __init__(self) -> None:
+        self.lists: dict[str, list[str]] = defaultdict(list)
+        self.zsets: dict[str, dict[str, float]] = defaultdict(dict)
+        self.sets: dict[str, set[str]] = defaultdict(set)
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self.lists)
+
+    def smembers(self, key: str) -> set[str]:
+        return set(self.sets[key])
+
+    def srem(self, key: str, member: str) -> None:
+        self.sets[key].discard(member)
+
+    def zscore(self, key: str, member: str) -> float | None:
+        return self.zsets[key].get(member)
+
+    def zrem(self, key: str, member: str) -> None:
+        self.zsets[key].pop(member, None)
+
+    def rpoplpush(self, src: str, dst: str) -> str | None:
+        if not self.lists[src]:
+            return None
+        value = self.lists[src].pop()
+        self.lists[dst].insert(0, value)
+        return value
+
+
+@pytest.fixture
+def redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    fake = _FakeRedis()
+    monkeypatch.setattr(affinity, "get_redis", lambda: fake)
+    monkeypatch.setattr(affinity, "get_async_redis", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def members(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    live: list[str] = []
+
+    async def _live(lane: str) -> tuple[str, ...]:
+        return tuple(sorted(live))
+
+    monkeypatch.setattr(affinity, "_live_members", _live)
+    return live
+
+
+class TestHashRing:
+    def test_empty_ring(self) -> None:
+        assert affinity.HashRing((), 8).node_for("voice") is None
+
+    def test_is_deterministic(self) -> None:
+        ring = affinity.HashRing(("a", "b", "c"), 64)
+        assert ring.node_for("voice-1") == affinity.HashRing(("c", "b", "a"), 64).node_for("voice-1")
+
+    def test_adding_a_node_moves_few_keys(self) -> None:
+        keys = [str(uuid.UUID(int=i)) for i in range(2000)]
+        before = affinity.HashRing(tuple(f"w{i}" for i in range(4)), 64)
+        after = affinity.HashRing(tuple(f"w{i}" for i in range(5)), 64)
+        moved = sum(before.node_for(k) != after.node_for(k) for k in keys)
+        # Ideal is 1/5 of the keys; a modulo hash would move ~4/5.
+        assert moved / len(keys) < 0.35
+
+    def test_spreads_keys_across_nodes(self) -> None:
+        ring = affinity.HashRing(tuple(f"w{i}" for i in range(4)), 64)
+        owners = {ring.node_for(str(uuid.UUID(int=i))) for i in range(200)}
+        assert owners == {"w0", "w1", "w2", "w3"}
+
+
+class TestAssign:
+    async def test_routes_to_owner_personal_queue(
+        self, redis: _FakeRedis, members: list[str]
+    ) -> None:
+        members.extend(["celery@a", "celery@b"])
+        voice = uuid.uuid4()
+
+        route = await affinity.assign(ROUTE, voice)
+
+        owner = affinity.HashRing(("celery@a", "celery@b"), 64).node_for(str(voice))
+        assert route.queue == affinity.personal_queue(INTERACTIVE_QUEUE, owner)
+        assert route.lane == INTERACTIVE_QUEUE
+        assert route.priority == ROUTE.priority
+
+    async def test_no_live_workers_keeps_shared_queue(
+        self, redis: _FakeRedis, members: list[str]
+    ) -> None:
+        assert await affinity.assign(ROUTE, uuid.uuid4()) == ROUTE
+
+    async def test_overloaded_owner_falls_back(self, redis: _FakeRedis, members: list[str]) -> None:
+        members.append("celery@a")
+        personal = affinity.personal_queue(INTERACTIVE_QUEUE, "celery@a")
+        redis.lists[priority_queue_keys(personal)[3]] = ["job"] * 8
+
+        assert await affinity.assign(ROUTE, uuid.uuid4()) == ROUTE
+
+
+class TestWorkerSide:
+    def test_join_consumes_personal_queue_first(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(affinity._Membership, "start", lambda self: None)
+        calls: list[tuple[str, str]] = []
+        consumer = SimpleNamespace(
+            hostname="celery@a",
+            task_consumer=SimpleNamespace(
+                queues=[SimpleNamespace(name=INTERACTIVE_QUEUE), SimpleNamespace(name=BULK_QUEUE)]
+            ),
+            cancel_task_queue=lambda q: calls.append(("cancel", q)),
+            add_task_queue=lambda q: calls.append(("add", q)),
+        )
+
+        affinity._join(consumer)
+
+        assert [q for op, q in calls if op == "add"] == [
+            f"{INTERACTIVE_QUEUE}.celery@a",
+            INTERACTIVE_QUEUE,
+            f"{BULK_QUEUE}.celery@a",
+            BULK_QUEUE,
+        ]
+
+    def test_rehome_moves_only_dead_workers_jobs(self, redis: _FakeRedis) -> None:
+        members_key = affinity._MEMBERS_KEY.format(lane=BULK_QUEUE)
+        redis.zsets[members_key] = {"celery@live": time.time(), "celery@dead": 0.0}
+        live = affinity.personal_queue(BULK_QUEUE, "celery@live")
+        dead = affinity.personal_queue(BULK_QUEUE, "celery@dead")
+        redis.sets[affinity.PERSONAL_QUEUES_KEY] = {live, dead}
+        redis.lists[priority_queue_keys(live)[0]] = ["x"]
+        redis.lists[priority_queue_keys(dead)[0]] = ["a", "b"]
+        redis.lists[priority_queue_keys(dead)[5]] = ["c"]
+
+        assert affinity.rehome_orphaned_queues() == 3
+
+        assert redis.lists[priority_queue_keys(BULK_QUEUE)[0]] == ["a", "b"]
+        assert redis.lists[priority_queue_keys(BULK_QUEUE)[5]] == ["c"]
+        assert redis.lists[priority_queue_keys(live)[0]] == ["x"]
+        assert "celery@dead" not in redis.zsets[members_key]
+        assert redis.sets[affinity.PERSONAL_QUEUES_KEY] == {live}
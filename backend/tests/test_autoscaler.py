@@ -0,0 +1,140 @@
+"""Tests for the backlog-driven worker autoscaler."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import defaultdict
+
+import pytest
+
+from backend.config import AutoscalerConfig
+from backend.workers import affinity, autoscaler
+from backend.workers.autoscaler import Observation, Planner, PoolSpec, QueueObserver
+from backend.workers.routing import BULK_QUEUE, INTERACTIVE_QUEUE, priority_queue_keys
+
+CFG = AutoscalerConfig(
+    target_backlog_per_worker=10, age_slope_threshold=0.5, scale_down_stable_intervals=3
+)
+POOL = PoolSpec(
+    name="synthesis",
+    queues=(INTERACTIVE_QUEUE, BULK_QUEUE),
+    min_workers=1,
+    max_workers=5,
+    include_personal_queues=True,
+)
+
+
+def _obs(depth: int, age: float = 0.0, at: float = 0.0) -> Observation:
+    return Observation(depth=depth, oldest_age_seconds=age, at=at)
+
+
+class TestPlanner:
+    def test_scales_up_to_backlog(self) -> None:
+        decision = Planner(POOL, CFG).plan(_obs(35), current=1)
+        assert decision.desired_workers == 4
+        assert decision.reason == "backlog"
+
+    def test_clamped_to_bounds(self) -> None:
+        planner = Planner(POOL, CFG)
+        assert planner.plan(_obs(1_000), current=1).desired_workers == 5
+        assert Planner(POOL, CFG).plan(_obs(0), current=0).desired_workers == 1
+
+    def test_adds_worker_while_oldest_message_ages(self) -> None:
+        planner = Planner(POOL, CFG)
+        planner.plan(_obs(5, age=10, at=100), current=2)
+        decision = planner.plan(_obs(5, age=25, at=110), current=2)
+        assert decision.desired_workers == 3
+        assert decision.reason == "oldest message aging"
+        assert decision.age_slope == pytest.approx(1.5)
+
+    def test_scale_down_waits_for_stable_readings_and_steps_by_one(self) -> None:
+        planner = Planner(POOL, CFG)
+        reasons = [planner.plan(_obs(0, at=t), current=4).reason for t in range(3)]
+        assert reasons == ["scale-down cooldown", "scale-down cooldown", "backlog drained"]
+        assert planner.plan(_obs(0, at=3), current=3).desired_workers == 3
+
+    def test_burst_resets_scale_down_streak(self) -> None:
+        planner = Planner(POOL, CFG)
+        planner.plan(_obs(0, at=0), current=4)
+        planner.plan(_obs(0, at=1), current=4)
+        planner.plan(_obs(40, at=2), current=4)
+        assert planner.plan(_obs(0, at=3), current=4).desired_workers == 4
+
+    def test_memory_ceiling_blocks_growth(self) -> None:
+        decision = Planner(POOL, CFG).plan(_obs(50), current=2, can_grow=False)
+        assert decision.desired_workers == 2
+        assert decision.reason == "memory ceiling"
+
+
+class _FakePipeline:
+    def __init__(self, lists: dict[str, list[str]]) -> None:
+        self._lists = lists
+        self._ops: list[tuple[str, str]] = []
+
+    def llen(self, key: str) -> None:
+        self._ops.append(("llen", key))
+
+    def lindex(self, key: str, index: int) -> None:
+        self._ops.append(("lindex", key))
+
+    def execute(self) -> list:
+        out = []
+        for op, key in self._ops:
+            items = self._lists.get(key, [])
+            out.append(len(items) if op == "llen" else (items[-1] if items else None))
+        return out
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.lists: dict[str, list[str]] = defaultdict(list)
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self.lists)
+
+
+def _message(**headers: object) -> str:
+    return json.dumps({"body": "", "headers": headers})
+
+
+class TestQueueObserver:
+    @pytest.fixture(autouse=True)
+    def personal(self, monkeypatch: pytest.MonkeyPatch) -> set[str]:
+        queues: set[str] = set()
+        monkeypatch.setattr(affinity, "personal_queues", lambda: queues)
+        return queues
+
+    def test_sums_priority_and_personal_queues(self, personal: set[str]) -> None:
+        redis = _FakeRedis()
+        personal.add(f"{INTERACTIVE_QUEUE}.synthesis0@host")
+        personal.add("elsewhere.node")
+        redis.lists[priority_queue_keys(INTERACTIVE_QUEUE)[0]] = ["a", "b"]
+        redis.lists[priority_queue_keys(BULK_QUEUE)[3]] = ["c"]
+        redis.lists[priority_queue_keys(f"{INTERACTIVE_QUEUE}.synthesis0@host")[1]] = ["d"]
+        redis.lists["elsewhere.node"] = ["e"]
+
+        obs = QueueObserver(redis).observe([POOL])
+
+        assert obs["synthesis"].depth == 4
+
+    def test_oldest_age_from_enqueued_at_header(self) -> None:
+        redis = _FakeRedis()
+        now = time.time()
+        redis.lists[INTERACTIVE_QUEUE] = [_message(enqueued_at=now - 5), _message(enqueued_at=now - 30)]
+        redis.lists[BULK_QUEUE] = [_message(enqueued_at=now - 12)]
+
+        obs = QueueObserver(redis).observe([POOL])
+
+        assert obs["synthesis"].oldest_age_seconds == pytest.approx(30, abs=1)
+
+    def test_oldest_age_falls_back_to_first_seen(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        redis = _FakeRedis()
+        pool = PoolSpec(name="voice_prep", queues=("voice_prep",), min_workers=1, max_workers=2)
+        redis.lists["voice_prep"] = [_message(id="task-1")]
+        observer = QueueObserver(redis)
+        clock = iter([1_000.0, 1_020.0])
+        monkeypatch.setattr(autoscaler.time, "time", lambda: next(clock))
+
+        assert observer.observe([pool])["voice_prep"].oldest_age_seconds == 0
+        assert observer.observe([pool])["voice_prep"].oldest_age_seconds == 20
@@ -0,0 +1,46 @@
+"""Tests for cooperative job cancellation."""
+
+from __future__ import annotations
+
+import contextvars
+from types import SimpleNamespace
+
+import pytest
+
+from backend import cancellation
+from backend.cancellation import JobCancelled, raise_if_cancelled
+
+
+@pytest.fixture
+def flags(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Cancelled job IDs, and every flag read."""
+    state = SimpleNamespace(cancelled=set(), reads=[])
+
+    def _is_cancelled(job_id: str) -> bool:
+        state.reads.append(job_id)
+        return job_id in state.cancelled
+
+    monkeypatch.setattr(cancellation, "is_cancelled", _is_cancelled)
+    return state
+
+
+def _in_fresh_context(fn) -> None:  # noqa: ANN001
+    contextvars.Context().run(fn)
+
+
+def test_noop_without_a_watched_job(flags: SimpleNamespace) -> None:
+    _in_fresh_context(lambda: raise_if_cancelled(force=True))
+    assert flags.reads == []
+
+
+def test_flag_reads_are_throttled(flags: SimpleNamespace) -> None:
+    def _run() -> None:
+        cancellation.watch("job-1")
+        flags.cancelled.add("job-1")
+        raise_if_cancelled()  # within check_interval_seconds of watch()
+        with pytest.raises(JobCancelled) as info:
+            raise_if_cancelled(0.25, force=True)
+        assert info.value.remaining_fraction == pytest.approx(0.75)
+
+    _in_fresh_context(_run)
+    assert flags.reads == ["job-1"]
@@ -0,0 +1,77 @@
+"""Tests for segment checkpoints of long synthesis jobs."""
+
+from __future__ import annotations
+
+import wave
+from pathlib import Path
+
+import pytest
+
+from backend.workers import checkpoints
+from backend.workers.checkpoints import Checkpoint, concat_wavs, split_text
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    def delete(self, key: str) -> None:
+        self.hashes.pop(key, None)
+
+
+@pytest.fixture
+def redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    fake = _FakeRedis()
+    monkeypatch.setattr(checkpoints, "get_redis", lambda: fake)
+    return fake
+
+
+class TestSplitText:
+    def test_packs_whole_sentences(self) -> None:
+        text = "One two. Three four. Five six seven eight nine."
+        assert split_text(text, 30) == ["One two. Three four.", "Five six seven eight nine."]
+
+    def test_splits_on_danda(self) -> None:
+        text = "नमस्ते। आप कैसे हैं?"
+        assert len(split_text(text, 12)) == 2
+
+    def test_breaks_long_sentence_at_whitespace(self) -> None:
+        segments = split_text("aaaa bbbb cccc dddd", 10)
+        assert segments == ["aaaa bbbb", "cccc dddd"]
+        assert all(len(s) <= 10 for s in split_text("x" * 25, 10))
+
+    def test_short_text_is_one_segment(self) -> None:
+        assert split_text("Hello.", 300) == ["Hello."]
+
+
+class TestCheckpoint:
+    def test_load_returns_finished_segments(self, redis: _FakeRedis) -> None:
+        cp = Checkpoint("job-1", ["a", "b", "c"])
+        redis.hashes[cp.key] = {"plan": cp.plan, "0": "k0", "2": "k2"}
+        assert cp.load() == {0: "k0", 2: "k2"}
+
+    def test_stale_plan_is_discarded(self, redis: _FakeRedis) -> None:
+        old = Checkpoint("job-1", ["a", "b"])
+        redis.hashes[old.key] = {"plan": old.plan, "0": "k0"}
+        assert Checkpoint("job-1", ["a", "b", "c"]).load() == {}
+        assert old.key not in redis.hashes
+
+
+def _wav(path: Path, frames: int) -> Path:
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(8000)
+        wf.writeframes(bytes(frames * 2))
+    return path
+
+
+def test_concat_wavs(tmp_path: Path) -> None:
+    parts = [_wav(tmp_path / "a.wav", 100), _wav(tmp_path / "b.wav", 250)]
+    target = concat_wavs(parts, tmp_path / "out.wav")
+    with wave.open(str(target), "rb") as wf:
+        assert wf.getnframes() == 350
+        assert wf.getframerate() == 8000
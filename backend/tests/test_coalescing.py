@@ -0,0 +1,33 @@
+"""Tests for single-flight coalescing keys."""
+
+from __future__ import annotations
+
+import uuid
+
+from backend import coalescing
+
+VOICE = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+
+class TestCoalesceKey:
+    def test_whitespace_and_unicode_form_are_ignored(self) -> None:
+        composed = "\u0958\u093f\u0932\u093e"  # qa as one code point
+        decomposed = "\u0915\u093c\u093f\u0932\u093e"  # ka + nukta
+        a = coalescing.coalesce_key("xtts-hindi", VOICE, f"  {composed}\n hai ", None)
+        b = coalescing.coalesce_key("xtts-hindi", VOICE, f"{decomposed} hai", {})
+        assert a == b
+
+    def test_param_order_is_ignored(self) -> None:
+        a = coalescing.coalesce_key("xtts-hindi", VOICE, "Hi", {"speed": 1.2, "pitch": 0})
+        b = coalescing.coalesce_key("xtts-hindi", VOICE, "Hi", {"pitch": 0, "speed": 1.2})
+        assert a == b
+
+    def test_every_component_matters(self) -> None:
+        base = coalescing.coalesce_key("xtts-hindi", VOICE, "Hi", {"speed": 1.0})
+        assert base != coalescing.coalesce_key("openvoice", VOICE, "Hi", {"speed": 1.0})
+        assert base != coalescing.coalesce_key("xtts-hindi", uuid.uuid4(), "Hi", {"speed": 1.0})
+        assert base != coalescing.coalesce_key("xtts-hindi", VOICE, "hi", {"speed": 1.0})
+        assert base != coalescing.coalesce_key("xtts-hindi", VOICE, "Hi", {"speed": 1.1})
+
+    def test_key_is_namespaced(self) -> None:
+        assert coalescing.coalesce_key("e", VOICE, "t", None).startswith("awaaztwin:inflight:")
@@ -0,0 +1,66 @@
+"""Tests for the incrementally maintained status counters."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend import counters
+from backend.models import SynthesisJob, SynthesisJobStatus
+
+PENDING, PROCESSING = SynthesisJobStatus.PENDING, SynthesisJobStatus.PROCESSING
+KEY = "awaaztwin:counters:synthesis_jobs"
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self.redis = redis
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):  # noqa: ANN204
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self) -> list:
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    def hincrby(self, key: str, field: str, n: int) -> int:
+        h = self.hashes.setdefault(key, {})
+        h[field] = str(int(h.get(field, 0)) + n)
+        return int(h[field])
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    def hset(self, key: str, mapping: dict[str, int]) -> None:
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def delete(self, key: str) -> None:
+        self.hashes.pop(key, None)
+
+
+@pytest.fixture
+def redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    fake = _FakeRedis()
+    monkeypatch.setattr(counters, "get_redis", lambda: fake)
+    return fake
+
+
+def test_transitions_move_counts(redis: _FakeRedis) -> None:
+    counters.transition(SynthesisJob, None, PENDING, n=3)
+    counters.transition(SynthesisJob, PENDING, PROCESSING)
+    counters.transition(SynthesisJob, PROCESSING, PROCESSING)  # no-op
+    assert redis.hashes[KEY] == {"PENDING": "2", "PROCESSING": "1"}
+
+
+def test_reset_reports_drift(redis: _FakeRedis) -> None:
+    redis.hashes[KEY] = {"PENDING": "5", "FAILED": "1"}
+    drift = counters.reset(SynthesisJob, {"PENDING": 4, "COMPLETED": 7})
+    assert drift == {"PENDING": -1, "COMPLETED": 7, "FAILED": -1}
+    assert redis.hashes[KEY] == {"PENDING": "4", "COMPLETED": "7"}
@@ -0,0 +1,155 @@
+"""Tests for the connection pool settings and sessions of ``backend.database``."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import math
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import Response
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from backend import database
+from backend.config import DatabaseConfig, get_config
+
+
+class TestConnectArgs:
+    def test_statement_cache_size(self) -> None:
+        args = database._connect_args(DatabaseConfig(statement_cache_size=500))
+        assert args == {"statement_cache_size": 500, "prepared_statement_cache_size": 500}
+
+    def test_pgbouncer_disables_caching_and_names_statements_uniquely(self) -> None:
+        args = database._connect_args(DatabaseConfig(pgbouncer=True, statement_cache_size=500))
+        assert args["statement_cache_size"] == args["prepared_statement_cache_size"] == 0
+        name = args["prepared_statement_name_func"]
+        assert name() != name()
+
+    def test_pool_options(self) -> None:
+        options = database._engine_options(
+            DatabaseConfig(pool_size=4, max_overflow=2, pool_recycle_seconds=-1)
+        )
+        assert options["poolclass"] is database._TimedPool
+        assert (options["pool_size"], options["max_overflow"]) == (4, 2)
+        assert options["pool_recycle"] == -1
+
+
+def test_checkout_waits_are_recorded(monkeypatch: pytest.MonkeyPatch) -> None:
+    waits = database._PoolWaits()
+    monkeypatch.setattr(database, "_pool_waits", waits)
+    pool = database._TimedPool(MagicMock, pool_size=1, max_overflow=0, timeout=0.05)
+
+    async def _exhaust() -> None:
+        held = await greenlet_spawn(pool.connect)
+        with pytest.raises(exc.TimeoutError):
+            await greenlet_spawn(pool.connect)
+        await greenlet_spawn(held.close)
+
+    asyncio.run(_exhaust())
+
+    assert (waits.checkouts, waits.timeouts) == (2, 1)
+    assert waits.max_seconds >= 0.05
+
+
+def _sessions(name: str) -> MagicMock:
+    factory = MagicMock(name=name)
+    factory.return_value.__aenter__.return_value = factory.session = AsyncMock()
+    return factory
+
+
+def _read_session(cookies: dict[str, str] | None = None) -> MagicMock:
+    async def _request() -> MagicMock:
+        async for db in database.get_read_db(SimpleNamespace(cookies=cookies or {})):
+            return db
+
+    return asyncio.run(_request())
+
+
+def test_read_session_is_never_committed(monkeypatch: pytest.MonkeyPatch) -> None:
+    primary = _sessions("primary")
+    monkeypatch.setattr(database, "_read_session_factory", primary)
+
+    assert _read_session() is primary.session
+    primary.session.commit.assert_not_called()
+
+
+class TestReplicaRouting:
+    @pytest.fixture
+    def replicas(self, monkeypatch: pytest.MonkeyPatch) -> list[database._Replica]:
+        monkeypatch.setattr(database, "_read_session_factory", _sessions("primary"))
+        replicas = [
+            database._Replica(name=name, engine=MagicMock(), sessions=_sessions(name))
+            for name in ("r1", "r2")
+        ]
+        monkeypatch.setattr(database, "_replicas", replicas)
+        monkeypatch.setattr(database, "_next_replica", itertools.count())
+        return replicas
+
+    @pytest.fixture
+    def down(self, monkeypatch: pytest.MonkeyPatch) -> set[str]:
+        """Names of replicas whose health check fails; checks are counted."""
+        failing: set[str] = set()
+        self.checks: list[str] = []
+
+        async def _is_healthy(replica: database._Replica) -> bool:
+            self.checks.append(replica.name)
+            return replica.name not in failing
+
+        monkeypatch.setattr(database, "_is_healthy", _is_healthy)
+        return failing
+
+    def test_round_robin(self, replicas: list, down: set[str]) -> None:
+        served = [_read_session() for _ in range(4)]
+        assert served == [r.sessions.session for r in replicas] * 2
+
+    def test_unhealthy_replica_is_skipped(self, replicas: list, down: set[str]) -> None:
+        down.add("r1")
+        assert [_read_session() for _ in range(3)] == [replicas[1].sessions.session] * 3
+
+    def test_falls_back_to_the_primary(self, replicas: list, down: set[str]) -> None:
+        down.update({"r1", "r2"})
+        assert _read_session() is database._read_session_factory.session
+
+    def test_writer_is_pinned_to_the_primary(self, replicas: list, down: set[str]) -> None:
+        pinned = _read_session({database.PRIMARY_PIN_COOKIE: "1"})
+        assert pinned is database._read_session_factory.session
+        assert self.checks == []
+
+    def test_lookups_by_id_always_read_the_primary(self, replicas: list, down: set[str]) -> None:
+        async def _request() -> MagicMock:
+            async for db in database.get_primary_read_db():
+                return db
+
+        assert asyncio.run(_request()) is database._read_session_factory.session
+        assert self.checks == []
+
+    def test_write_session_sets_the_pin(
+        self, replicas: list, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(database, "_session_factory", _sessions("primary"))
+        response = Response()
+
+        async def _request() -> None:
+            async for _ in database.get_db(response):
+                pass
+
+        asyncio.run(_request())
+        database._session_factory.session.commit.assert_awaited_once()
+        cookie = response.headers["set-cookie"]
+        assert cookie.startswith(f"{database.PRIMARY_PIN_COOKIE}=1")
+        window = get_config().database.read_your_writes_seconds
+        assert f"Max-Age={math.ceil(window)}" in cookie
+
+
+def test_health_check_result_is_reused(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(get_config().database, "replica_health_check_seconds", 60.0)
+    engine = MagicMock()
+    engine.connect.side_effect = OSError("connection refused")
+    replica = database._Replica(name="r1", engine=engine, sessions=MagicMock())
+
+    assert asyncio.run(database._is_healthy(replica)) is False
+    assert asyncio.run(database._is_healthy(replica)) is False
+    assert engine.connect.call_count == 1
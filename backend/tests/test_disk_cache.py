@@ -0,0 +1,146 @@
+"""Tests for the worker-local disk cache."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from backend.disk_cache import CacheIntegrityError, DiskCache
+
+
+class _FakeStore:
+    """Counts fetches and serves deterministic payloads per key."""
+
+    def __init__(self, size: int = 100, delay: float = 0.0) -> None:
+        self.calls: list[str] = []
+        self._size = size
+        self._delay = delay
+        self._lock = threading.Lock()
+
+    def payload(self, key: str) -> bytes:
+        return (key.encode() * self._size)[: self._size]
+
+    def fetch(self, key: str, dest: Path) -> str:
+        with self._lock:
+            self.calls.append(key)
+        time.sleep(self._delay)
+        data = self.payload(key)
+        dest.write_bytes(data)
+        return f'"{hashlib.md5(data).hexdigest()}"'
+
+
+class TestDiskCache:
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        store = _FakeStore()
+        cache = DiskCache(tmp_path, max_bytes=10_000)
+
+        first = cache.get("samples/v1/a.wav", store.fetch)
+        second = cache.get("samples/v1/a.wav", store.fetch)
+
+        assert first == second
+        assert first.read_bytes() == store.payload("samples/v1/a.wav")
+        assert store.calls == ["samples/v1/a.wav"]
+
+    def test_lru_eviction_respects_byte_budget(self, tmp_path: Path) -> None:
+        store = _FakeStore(size=100)
+        cache = DiskCache(tmp_path, max_bytes=250)
+
+        a = cache.get("a", store.fetch)
+        b = cache.get("b", store.fetch)
+        # Make "a" the most recently used entry.
+        os.utime(b, (1, 1))
+        cache.get("a", store.fetch)
+        cache.get("c", store.fetch)
+
+        assert cache.size_bytes() <= 250
+        assert a.exists()
+        assert not b.exists()
+
+    def test_etag_mismatch_is_rejected(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path, max_bytes=10_000)
+
+        def bad_fetch(key: str, dest: Path) -> str:
+            dest.write_bytes(b"truncated")
+            return '"' + "0" * 32 + '"'
+
+        with pytest.raises(CacheIntegrityError):
+            cache.get("k", bad_fetch)
+        assert cache.size_bytes() == 0
+
+    def test_multipart_etag_skips_md5_check(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path, max_bytes=10_000)
+
+        def fetch(key: str, dest: Path) -> str:
+            dest.write_bytes(b"weights")
+            return '"abc123-4"'
+
+        assert cache.get("models/x.pth", fetch).read_bytes() == b"weights"
+
+    def test_corrupt_entry_is_refetched(self, tmp_path: Path) -> None:
+        store = _FakeStore()
+        cache = DiskCache(tmp_path, max_bytes=10_000)
+
+        path = cache.get("k", store.fetch)
+        path.write_bytes(b"short")
+        cache.get("k", store.fetch)
+
+        assert store.calls == ["k", "k"]
+
+    def test_concurrent_gets_share_one_fetch(self, tmp_path: Path) -> None:
+        store = _FakeStore(delay=0.05)
+        cache = DiskCache(tmp_path, max_bytes=10_000)
+        results: list[Path] = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get("k", store.fetch)))
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert store.calls == ["k"]
+        assert len(set(results)) == 1
+
+    def test_invalidate(self, tmp_path: Path) -> None:
+        store = _FakeStore()
+        cache = DiskCache(tmp_path, max_bytes=10_000)
+
+        cache.get("k", store.fetch)
+        cache.invalidate("k")
+        cache.get("k", store.fetch)
+
+        assert store.calls == ["k", "k"]
+
+    def test_object_larger_than_budget_is_not_cached(self, tmp_path: Path) -> None:
+        store = _FakeStore(size=100)
+        cache = DiskCache(tmp_path / "cache", max_bytes=10)
+        dest = tmp_path / "out.wav"
+
+        path = cache.get("big", store.fetch, dest=dest)
+
+        assert path == dest
+        assert path.read_bytes() == store.payload("big")
+        assert cache.size_bytes() == 0
+
+    def test_concurrent_fills_are_not_evicted_under_callers(self, tmp_path: Path) -> None:
+        store = _FakeStore(size=100, delay=0.05)
+        cache = DiskCache(tmp_path, max_bytes=150)
+        results: dict[str, bytes] = {}
+
+        def _get(key: str) -> None:
+            results[key] = cache.get(key, store.fetch).read_bytes()
+
+        threads = [threading.Thread(target=_get, args=(key,)) for key in ("a", "b")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == {key: store.payload(key) for key in ("a", "b")}
@@ -194,6 +194,42 @@ class TestXTTSHindiEngineAdapter:
             assert wf.getframerate() == 22050
 
 
+    def test_synthesize_audio_in_memory(self, tmp_path: Path) -> None:
+        cfg = EngineConfig(
+            name="XTTS_HI",
+            engine_type="xtts",
+            model_path=str(tmp_path / "model"),
+            device="cpu",
+            output_dir=str(tmp_path / "spool"),
+        )
+        adapter = XTTSHindiEngineAdapter(cfg)
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path="/e.json")
+
+        output = adapter.synthesize_audio("Hello", ref)
+
+        assert output.path is None
+        assert output.data is not None and output.data[:4] == b"RIFF"
+        assert not (tmp_path / "spool").exists()
+
+    def test_synthesize_audio_spills_above_limit(self, tmp_path: Path) -> None:
+        cfg = EngineConfig(
+            name="XTTS_HI",
+            engine_type="xtts",
+            model_path=str(tmp_path / "model"),
+            device="cpu",
+            output_dir=str(tmp_path / "spool"),
+            max_memory_output_bytes=16,
+        )
+        adapter = XTTSHindiEngineAdapter(cfg)
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path="/e.json")
+
+        output = adapter.synthesize_audio("Hello", ref)
+
+        assert output.data is None
+        assert output.path is not None and output.path.parent == tmp_path / "spool"
+        assert output.size == output.path.stat().st_size
+
+
 # ---------------------------------------------------------------
 # OpenVoiceEngineAdapter (placeholder behaviour)
 # ---------------------------------------------------------------
@@ -0,0 +1,88 @@
+"""Tests for the worker failure taxonomy and retry policy."""
+
+from __future__ import annotations
+
+import errno
+import json
+import subprocess
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from backend import metrics
+from backend.workers import failures
+from backend.workers.failures import FailureClass
+
+
+def _client_error(code: str) -> ClientError:
+    return ClientError({"Error": {"Code": code}}, "GetObject")
+
+
+class TestClassify:
+    @pytest.mark.parametrize(
+        ("exc", "expected"),
+        [
+            (ValueError("Requested engine 'X' is not configured"), FailureClass.PERMANENT),
+            (json.JSONDecodeError("bad", "{", 0), FailureClass.PERMANENT),
+            (KeyError("embedding_path"), FailureClass.PERMANENT),
+            (subprocess.CalledProcessError(1, ["ffmpeg"]), FailureClass.PERMANENT),
+            (failures.PermanentError(), FailureClass.PERMANENT),
+            (_client_error("NoSuchKey"), FailureClass.PERMANENT),
+            (ConnectionError("reset"), FailureClass.TRANSIENT),
+            (TimeoutError(), FailureClass.TRANSIENT),
+            (_client_error("InternalError"), FailureClass.TRANSIENT),
+            (failures.TransientError(), FailureClass.TRANSIENT),
+            (RuntimeError("something odd"), FailureClass.TRANSIENT),
+            (MemoryError(), FailureClass.RESOURCE_EXHAUSTED),
+            (OSError(errno.ENOSPC, "No space left on device"), FailureClass.RESOURCE_EXHAUSTED),
+            (_client_error("SlowDown"), FailureClass.RESOURCE_EXHAUSTED),
+            (type("OutOfMemoryError", (RuntimeError,), {})(), FailureClass.RESOURCE_EXHAUSTED),
+        ],
+    )
+    def test_classify(self, exc: BaseException, expected: FailureClass) -> None:
+        assert failures.classify(exc) is expected
+
+
+class TestBackoff:
+    def test_grows_exponentially_within_cap(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(failures.random, "uniform", lambda lo, hi: hi)
+        delays = [failures.backoff_seconds(FailureClass.TRANSIENT, n) for n in range(8)]
+        assert delays[:4] == [2.0, 4.0, 8.0, 16.0]
+        assert max(delays) == 60.0
+
+    def test_resource_exhaustion_backs_off_longer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(failures.random, "uniform", lambda lo, hi: hi)
+        assert failures.backoff_seconds(FailureClass.RESOURCE_EXHAUSTED, 0) == 30.0
+
+    def test_is_jittered(self) -> None:
+        delays = {failures.backoff_seconds(FailureClass.TRANSIENT, 3) for _ in range(20)}
+        assert len(delays) > 1
+        assert all(0 <= d <= 16.0 for d in delays)
+
+
+class TestDecide:
+    @pytest.fixture
+    def recorded(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        mock = MagicMock()
+        monkeypatch.setattr(metrics, "record_task_failure", mock)
+        return mock
+
+    def _task(self, retries: int) -> SimpleNamespace:
+        return SimpleNamespace(name="t", max_retries=3, request=SimpleNamespace(retries=retries))
+
+    def test_permanent_gives_up_immediately(self, recorded: MagicMock) -> None:
+        decision = failures.decide(self._task(0), ValueError("bad"))
+        assert decision.countdown is None
+        recorded.assert_called_once_with("t", "permanent", retried=False)
+
+    def test_transient_retries(self, recorded: MagicMock) -> None:
+        decision = failures.decide(self._task(1), ConnectionError())
+        assert decision.countdown is not None
+        recorded.assert_called_once_with("t", "transient", retried=True)
+
+    def test_gives_up_after_max_retries(self, recorded: MagicMock) -> None:
+        decision = failures.decide(self._task(3), ConnectionError())
+        assert decision.countdown is None
+        recorded.assert_called_once_with("t", "transient", retried=False)
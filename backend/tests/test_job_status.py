@@ -0,0 +1,149 @@
+"""Tests for the Redis read cache of job status."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from backend import job_status
+from backend.config import get_config
+from backend.models import SynthesisJobStatus
+from backend.schemas import SynthesisJobStatusResponse
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self.redis = redis
+        self.calls: list[tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):  # noqa: ANN204
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self) -> list:
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+class _FakeAsyncPipeline(_FakePipeline):
+    async def execute(self) -> list:  # type: ignore[override]
+        return super().execute()
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    def hset(
+        self,
+        key: str,
+        field: str | None = None,
+        value: str | None = None,
+        mapping: dict[str, str] | None = None,
+    ) -> None:
+        h = self.hashes.setdefault(key, {})
+        if field is not None:
+            h[field] = value
+        h.update(mapping or {})
+
+    def hsetnx(self, key: str, field: str, value: str) -> None:
+        self.hashes.setdefault(key, {}).setdefault(field, value)
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    def expire(self, key: str, seconds: int) -> None:
+        self.ttls[key] = seconds
+
+
+class _FakeAsyncRedis:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self.redis = redis
+
+    def pipeline(self, transaction: bool = True) -> _FakeAsyncPipeline:
+        return _FakeAsyncPipeline(self.redis)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return self.redis.hgetall(key)
+
+
+@pytest.fixture
+def redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    fake = _FakeRedis()
+    monkeypatch.setattr(job_status, "get_redis", lambda: fake)
+    monkeypatch.setattr(job_status, "get_async_redis", lambda: _FakeAsyncRedis(fake))
+    return fake
+
+
+def _job(**overrides: object) -> SynthesisJobStatusResponse:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    fields = {
+        "id": uuid.uuid4(),
+        "voice_profile_id": uuid.uuid4(),
+        "engine_name": "XTTS_HI",
+        "status": SynthesisJobStatus.PENDING,
+        "created_at": now,
+        "updated_at": now,
+    }
+    return SynthesisJobStatusResponse(**{**fields, **overrides})
+
+
+def test_fill_then_read_round_trips(redis: _FakeRedis) -> None:
+    job = _job()
+    asyncio.run(job_status.fill([job]))
+    assert asyncio.run(job_status.read(str(job.id))) == job
+    assert redis.ttls[f"awaaztwin:jobs:{job.id}:status"] == get_config().status_cache.ttl_seconds
+
+
+def test_input_text_is_not_cached(redis: _FakeRedis) -> None:
+    """Filled from a full job, the hash still only holds the status fields."""
+    job = _job()
+    full = {**job.model_dump(), "input_text": "namaste " * 500, "params_json": {"speed": 1.1}}
+    asyncio.run(job_status.fill([SynthesisJobStatusResponse.model_validate(full)]))
+
+    cached = redis.hashes[f"awaaztwin:jobs:{job.id}:status"]
+    assert "namaste" not in "".join(cached.values())
+    assert "params_json" not in cached["row"]
+
+
+def test_worker_updates_are_served(redis: _FakeRedis) -> None:
+    job = _job()
+    asyncio.run(job_status.fill([job]))
+    job_status.record(str(job.id), status=SynthesisJobStatus.PROCESSING, progress=0.5)
+    job_status.record(
+        str(job.id), status=SynthesisJobStatus.COMPLETED, output_storage_key="out.wav"
+    )
+
+    cached = asyncio.run(job_status.read(str(job.id)))
+    assert cached.status == SynthesisJobStatus.COMPLETED
+    assert cached.progress == 0.5
+    assert cached.output_storage_key == "out.wav"
+    assert cached.engine_name == job.engine_name
+
+
+def test_fill_keeps_newer_worker_fields(redis: _FakeRedis) -> None:
+    job = _job()
+    # The worker finished before a poll filled the row it read earlier.
+    job_status.record(str(job.id), status=SynthesisJobStatus.COMPLETED)
+    asyncio.run(job_status.fill([job]))
+    assert asyncio.run(job_status.read(str(job.id))).status == SynthesisJobStatus.COMPLETED
+
+
+def test_worker_fields_alone_are_a_miss(redis: _FakeRedis) -> None:
+    job_id = str(uuid.uuid4())
+    job_status.record(job_id, status=SynthesisJobStatus.PROCESSING)
+    assert asyncio.run(job_status.read(job_id)) is None
+
+
+def test_disabled_cache_is_bypassed(redis: _FakeRedis, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(get_config().status_cache, "enabled", False)
+    job = _job()
+    asyncio.run(job_status.fill([job]))
+    job_status.record(str(job.id), status=SynthesisJobStatus.PROCESSING)
+    assert redis.hashes == {}
+    assert asyncio.run(job_status.read(str(job.id))) is None
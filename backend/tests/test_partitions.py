@@ -0,0 +1,90 @@
+"""Tests for the monthly partitions of ``synthesis_jobs``."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from backend import partitions
+from backend.models import SynthesisJob
+
+
+class _FakeConnection:
+    """Records statements; answers the partition listing from ``names``."""
+
+    def __init__(self, names: list[str]) -> None:
+        self.names = names
+        self.statements: list[str] = []
+
+    def execute(self, stmt: Any, params: Any = None) -> Any:
+        sql = str(stmt)
+        self.statements.append(sql)
+        return SimpleNamespace(scalars=lambda: list(self.names))
+
+
+def test_month_arithmetic() -> None:
+    utc = datetime(2026, 10, 31, 23, 30, tzinfo=timezone.utc)
+    assert partitions.month_of(utc) == date(2026, 10, 1)
+    # 23:30 in UTC-2 is already the next month in UTC.
+    behind = utc.replace(tzinfo=timezone(timedelta(hours=-2)))
+    assert partitions.month_of(behind) == date(2026, 11, 1)
+    assert partitions.add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert partitions.add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_missing_partitions_are_created() -> None:
+    conn = _FakeConnection(["synthesis_jobs_y2026m10", "other_y2026m11"])
+
+    created = partitions.ensure_partitions(
+        conn, "synthesis_jobs", date(2026, 10, 1), date(2026, 12, 1)
+    )
+
+    assert created == ["synthesis_jobs_y2026m11", "synthesis_jobs_y2026m12"]
+    assert (
+        "CREATE TABLE IF NOT EXISTS synthesis_jobs_y2026m12 PARTITION OF synthesis_jobs "
+        "FOR VALUES FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')"
+    ) in conn.statements
+
+
+@pytest.mark.parametrize(
+    ("retention_months", "expired"),
+    [
+        (0, []),
+        (1, ["synthesis_jobs_y2026m07", "synthesis_jobs_y2026m08"]),
+        (2, ["synthesis_jobs_y2026m07"]),
+        (12, []),
+    ],
+)
+def test_expired_partitions(retention_months: int, expired: list[str]) -> None:
+    conn = _FakeConnection([f"synthesis_jobs_y2026m{m:02d}" for m in (9, 7, 8, 10, 11)])
+    now = datetime(2026, 10, 19, tzinfo=timezone.utc)
+
+    result = partitions.expired_partitions(conn, "synthesis_jobs", now, retention_months)
+
+    assert list(result.values()) == expired
+
+
+def test_new_ids_are_time_ordered() -> None:
+    before = datetime.now(timezone.utc)
+    first, second = partitions.new_id(), partitions.new_id()
+
+    assert first.version == 7
+    assert first.int >> 80 <= second.int >> 80
+    low, high = partitions.id_created_window(first)
+    assert low < before < high
+    assert partitions.id_created_window(uuid.uuid4()) is None
+
+
+def test_id_criteria_bound_created_at() -> None:
+    ids = [partitions.new_id(), partitions.new_id()]
+
+    pruned = " AND ".join(str(c) for c in SynthesisJob.id_criteria(*ids))
+    legacy = " AND ".join(str(c) for c in SynthesisJob.id_criteria(uuid.uuid4()))
+
+    assert "synthesis_jobs.id IN" in pruned
+    assert "synthesis_jobs.created_at BETWEEN" in pruned
+    assert "created_at" not in legacy
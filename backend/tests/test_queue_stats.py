@@ -0,0 +1,143 @@
+"""Tests for the ``GET /admin/queues`` statistics."""
+
+from __future__ import annotations
+
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from backend.workers import affinity, queue_stats
+from backend.workers.routing import priority_queue_keys
+
+
+class _FakePipeline:
+    def __init__(self, redis: _FakeRedis) -> None:
+        self.redis = redis
+        self.calls: list[tuple[str, tuple]] = []
+
+    def __getattr__(self, name: str):  # noqa: ANN204
+        return lambda *args: self.calls.append((name, args))
+
+    async def execute(self) -> list:
+        self.redis.round_trips += 1
+        return [getattr(self.redis, name)(*args) for name, args in self.calls]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.lists: dict[str, list[str]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.zsets: dict[str, int] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    def smembers(self, key: str) -> set[str]:
+        return set(self.sets.get(key, set()))
+
+    def hvals(self, key: str) -> list[str]:
+        return list(self.hashes.get(key, {}).values())
+
+    def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    def llen(self, key: str) -> int:
+        return len(self.lists.get(key, []))
+
+    def lindex(self, key: str, index: int) -> str | None:
+        items = self.lists.get(key, [])
+        return items[index] if items else None
+
+    def zcard(self, key: str) -> int:
+        return self.zsets.get(key, 0)
+
+    def eval(self, script: str, numkeys: int, key: str) -> str | None:
+        head = self.lindex(key, 0)
+        return None if head is None else self.hashes[f"rq:job:{head}"]["enqueued_at"]
+
+
+def _celery_message(enqueued_at: float | None = None) -> str:
+    return json.dumps({"headers": {"enqueued_at": enqueued_at}, "body": ""})
+
+
+@pytest.fixture
+def redis(monkeypatch: pytest.MonkeyPatch) -> _FakeRedis:
+    fake = _FakeRedis()
+    monkeypatch.setattr(queue_stats, "get_async_redis", lambda: fake)
+    monkeypatch.setattr(queue_stats, "_cache", None)
+    monkeypatch.setattr(queue_stats, "_personal_queues", set())
+    return fake
+
+
+async def test_adds_up_celery_and_rq(redis: _FakeRedis) -> None:
+    now = time.time()
+    bulk = priority_queue_keys("synthesis.bulk")
+    redis.lists[bulk[0]] = [_celery_message(now - 5)]
+    redis.lists[bulk[4]] = [_celery_message(now - 1), _celery_message(now - 30)]
+    redis.lists["voice_prep"] = [_celery_message()]  # no enqueued_at header
+    redis.hashes["unacked"] = {
+        "t1": json.dumps([{}, "", "synthesis.interactive"]),
+        "t2": json.dumps([{}, "", "synthesis.bulk.worker-1"]),
+        "t3": json.dumps([{}, "", "maintenance"]),
+    }
+    redis.hashes["awaaztwin:metrics:task_results:synthesis"] = {"finished": "7", "failed": "2"}
+    redis.lists["rq:queue:synthesis"] = ["job-a"]
+    redis.hashes["rq:job:job-a"] = {"enqueued_at": "2000-01-01T00:00:00.000000Z"}
+    redis.zsets["rq:wip:synthesis"] = 1
+    redis.zsets["rq:finished:synthesis"] = 3
+
+    stats = {s.name: s for s in await queue_stats.read_queue_stats()}
+
+    assert redis.round_trips == 1
+    synthesis = stats["synthesis"]
+    counts = (synthesis.queued, synthesis.started, synthesis.finished, synthesis.failed)
+    assert counts == (4, 3, 10, 2)
+    assert synthesis.oldest_age_seconds > 365 * 86400  # the RQ job
+    voice_prep = stats["voice_prep"]
+    assert (voice_prep.queued, voice_prep.started) == (1, 0)
+    assert voice_prep.oldest_age_seconds is None
+
+
+async def test_reads_are_cached(redis: _FakeRedis) -> None:
+    await queue_stats.read_queue_stats()
+    await queue_stats.read_queue_stats()
+    assert redis.round_trips == 1
+
+
+async def test_personal_queues_join_on_the_next_read(
+    redis: _FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    redis.sets[affinity.PERSONAL_QUEUES_KEY] = {"synthesis.bulk.worker-1"}
+    redis.lists["synthesis.bulk.worker-1"] = [_celery_message(time.time())]
+
+    first = {s.name: s for s in await queue_stats.read_queue_stats()}
+    monkeypatch.setattr(queue_stats, "_cache", None)
+    second = {s.name: s for s in await queue_stats.read_queue_stats()}
+
+    assert (first["synthesis"].queued, second["synthesis"].queued) == (0, 1)
+
+
+def test_counts_task_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    counted: list[tuple[str, str]] = []
+    monkeypatch.setattr(
+        queue_stats,
+        "get_redis",
+        lambda: SimpleNamespace(hincrby=lambda key, field, n: counted.append((key, field))),
+    )
+
+    def _task(routing_key: str) -> SimpleNamespace:
+        return SimpleNamespace(request=SimpleNamespace(delivery_info={"routing_key": routing_key}))
+
+    queue_stats._count_result(task=_task("voice_prep"), state="SUCCESS")
+    queue_stats._count_result(task=_task("synthesis.interactive"), state="FAILURE")
+    queue_stats._count_result(task=_task("synthesis.bulk"), state="RETRY")
+    queue_stats._count_result(task=_task("maintenance"), state="SUCCESS")
+
+    assert counted == [
+        ("awaaztwin:metrics:task_results:voice_prep", "finished"),
+        ("awaaztwin:metrics:task_results:synthesis", "failed"),
+    ]
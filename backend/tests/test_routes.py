@@ -0,0 +1,26 @@
+"""Route-level conventions shared by the routers."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
+
+from backend.routers import health, synthesis, voices
+
+_ROUTES = [
+    route
+    for router in (health.router, synthesis.router, voices.router)
+    for route in router.routes
+    if isinstance(route, APIRoute)
+]
+
+
+@pytest.mark.parametrize("route", _ROUTES, ids=lambda r: f"{sorted(r.methods)[0]} {r.path}")
+def test_json_routes_use_the_pydantic_serialiser(route: APIRoute) -> None:
+    """A response model and no custom response class keep FastAPI's fast JSON path."""
+    if route.response_class is StreamingResponse:
+        return
+    assert route.response_model is not None
+    assert isinstance(route.response_class, DefaultPlaceholder)
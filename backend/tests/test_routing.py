@@ -0,0 +1,84 @@
+"""Tests for latency-class routing of synthesis jobs."""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.workers import routing
+
+
+class TestRouteSynthesis:
+    def test_short_text_goes_interactive(self) -> None:
+        route = routing.route_synthesis("नमस्ते", "xtts-hindi")
+        assert route.queue == routing.INTERACTIVE_QUEUE
+
+    def test_long_text_goes_bulk(self) -> None:
+        route = routing.route_synthesis("क" * 5000, "xtts-hindi")
+        assert route.queue == routing.BULK_QUEUE
+
+    def test_shorter_jobs_get_higher_priority(self) -> None:
+        short = routing.route_synthesis("a" * 10, "xtts-hindi")
+        medium = routing.route_synthesis("a" * 150, "xtts-hindi")
+        assert short.queue == medium.queue == routing.INTERACTIVE_QUEUE
+        assert short.priority < medium.priority
+
+    def test_priority_is_bounded(self) -> None:
+        huge = routing.route_synthesis("a" * 1_000_000, "xtts-hindi")
+        assert 0 <= huge.priority <= routing.MAX_PRIORITY
+
+    def test_cost_grows_with_length(self) -> None:
+        assert routing.estimate_cost("a" * 100, "x") > routing.estimate_cost("a", "x")
+
+
+class TestEnqueueSynthesis:
+    def test_sends_to_routed_lane(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        send_task = MagicMock()
+        monkeypatch.setattr(routing.app, "send_task", send_task)
+
+        route = routing.enqueue_synthesis(
+            job_id="job-1",
+            text="Hello",
+            voice_embedding_json="{}",
+            engine_name="XTTS_HI",
+        )
+
+        name = send_task.call_args.args[0]
+        kwargs = send_task.call_args.kwargs
+        assert name == routing.RUN_SYNTHESIS_TASK
+        assert kwargs["task_id"] == "job-1"
+        assert kwargs["queue"] == route.queue == routing.INTERACTIVE_QUEUE
+        assert kwargs["priority"] == route.priority
+        assert kwargs["headers"]["lane"] == route.lane
+        assert "enqueued_at" in kwargs["headers"]
+
+
+class TestEnqueueSynthesisMany:
+    def _requests(self, n: int) -> list[dict]:
+        return [
+            {"job_id": f"job-{i}", "text": "Hi", "voice_embedding_json": "{}", "engine_name": "X"}
+            for i in range(n)
+        ]
+
+    def test_shares_one_producer(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        producer = object()
+        send_task = MagicMock()
+        monkeypatch.setattr(routing.app, "send_task", send_task)
+        monkeypatch.setattr(routing.app, "producer_or_acquire", lambda: nullcontext(producer))
+
+        routes = routing.enqueue_synthesis_many(self._requests(3))
+
+        assert len(routes) == 3
+        assert [c.kwargs["producer"] for c in send_task.call_args_list] == [producer] * 3
+        assert [c.kwargs["task_id"] for c in send_task.call_args_list] == ["job-0", "job-1", "job-2"]
+
+    def test_reports_how_many_were_published(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        send_task = MagicMock(side_effect=[None, ConnectionError("broker down")])
+        monkeypatch.setattr(routing.app, "send_task", send_task)
+        monkeypatch.setattr(routing.app, "producer_or_acquire", lambda: nullcontext(object()))
+
+        with pytest.raises(routing.PartialEnqueueError) as excinfo:
+            routing.enqueue_synthesis_many(self._requests(3))
+        assert excinfo.value.published == 1
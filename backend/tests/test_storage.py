@@ -0,0 +1,116 @@
+"""Tests for the object-storage helpers.
+
+The S3 client is replaced with a ``MagicMock`` so no MinIO instance is
+required.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend import storage
+from backend.disk_cache import DiskCache
+
+
+@pytest.fixture
+def s3(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Swap the shared S3 client for a mock and reset module caches."""
+    client = MagicMock()
+    counter = iter(range(1_000_000))
+    client.generate_presigned_url.side_effect = (
+        lambda *a, **kw: f"https://minio/signed/{next(counter)}"
+    )
+    monkeypatch.setattr(storage, "_get_s3_client", lambda: client)
+    storage._get_presign_cache().clear()
+    yield client
+    storage._get_presign_cache().clear()
+
+
+# ---------------------------------------------------------------
+# Pre-signed URL cache
+# ---------------------------------------------------------------
+
+
+class TestPresignCache:
+    def test_repeated_calls_reuse_signature(self, s3: MagicMock) -> None:
+        first = asyncio.run(storage.get_presigned_url("outputs/a.wav"))
+        second = asyncio.run(storage.get_presigned_url("outputs/a.wav"))
+        assert first == second
+        assert s3.generate_presigned_url.call_count == 1
+
+    def test_different_keys_are_signed_separately(self, s3: MagicMock) -> None:
+        a = asyncio.run(storage.get_presigned_url("outputs/a.wav"))
+        b = asyncio.run(storage.get_presigned_url("outputs/b.wav"))
+        assert a != b
+        assert s3.generate_presigned_url.call_count == 2
+
+    def test_expiry_is_rounded_up_to_bucket(self, s3: MagicMock) -> None:
+        asyncio.run(storage.get_presigned_url("outputs/a.wav", expires_in=3601))
+        _, kwargs = s3.generate_presigned_url.call_args
+        assert kwargs["ExpiresIn"] >= 3601
+        assert kwargs["ExpiresIn"] % 300 == 0
+
+    def test_invalidate_forces_resign(self, s3: MagicMock) -> None:
+        first = asyncio.run(storage.get_presigned_url("outputs/a.wav"))
+        storage.invalidate_presigned_url("outputs/a.wav")
+        second = asyncio.run(storage.get_presigned_url("outputs/a.wav"))
+        assert first != second
+        assert s3.generate_presigned_url.call_count == 2
+
+    def test_upload_invalidates(self, s3: MagicMock, tmp_path) -> None:
+        first = asyncio.run(storage.get_presigned_url("outputs/a.wav"))
+        local = tmp_path / "a.wav"
+        local.write_bytes(b"RIFF")
+        asyncio.run(storage.upload_file(local, "outputs/a.wav"))
+        second = asyncio.run(storage.get_presigned_url("outputs/a.wav"))
+        assert first != second
+
+    def test_nearly_expired_entry_is_not_reused(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        cache = storage._PresignCache(
+            max_entries=10, bucket_seconds=60, min_remaining_ratio=0.5
+        )
+        now = 1_000_000.0
+        monkeypatch.setattr(storage.time, "time", lambda: now)
+        cache.put("k", 600, "url", expires_at=now + 600)
+        assert cache.get("k", 600) == "url"
+
+        now += 301  # less than half of the 600 s window left
+        assert cache.get("k", 600) is None
+
+    def test_eviction_respects_max_entries(self) -> None:
+        cache = storage._PresignCache(
+            max_entries=2, bucket_seconds=60, min_remaining_ratio=0.0
+        )
+        cache.put("a", 60, "ua", expires_at=1e12)
+        cache.put("b", 60, "ub", expires_at=2e12)
+        cache.put("c", 60, "uc", expires_at=3e12)
+        assert cache.get("a", 60) is None
+        assert cache.get("c", 60) == "uc"
+
+
+# ---------------------------------------------------------------
+# Disk-cached downloads
+# ---------------------------------------------------------------
+
+
+class TestDownloadFile:
+    def test_caller_may_modify_the_download(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        cache = DiskCache(tmp_path / "cache", max_bytes=10_000)
+        monkeypatch.setattr(storage, "get_disk_cache", lambda: cache)
+
+        def _fetch(key: str, dest: Path) -> None:
+            dest.write_bytes(b"original")
+
+        monkeypatch.setattr(storage, "_fetch_object", _fetch)
+
+        local = asyncio.run(storage.download_file("samples/a.wav", tmp_path / "a.wav"))
+        local.write_bytes(b"trimmed")
+
+        again = asyncio.run(storage.download_file("samples/a.wav", tmp_path / "b.wav"))
+        assert again.read_bytes() == b"original"
@@ -0,0 +1,950 @@
+"""Tests for the synthesis router.
+
+The router is mounted on a bare ``FastAPI`` app with ``get_db``
+overridden by an in-memory fake, and object storage is mocked, so no
+Postgres or MinIO instance is required.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import uuid
+from collections.abc import Callable
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from fastapi import FastAPI, WebSocketDisconnect
+from fastapi.testclient import TestClient
+from redis.exceptions import RedisError
+
+from backend import admission, coalescing, events, partitions, storage
+from backend.config import get_config
+from backend.database import get_db, get_primary_read_db, get_read_db
+from backend.models import SynthesisJob, SynthesisJobStatus, VoiceProfileStatus
+from backend.routers import synthesis
+from backend.workers import affinity
+from backend.workers.routing import PartialEnqueueError
+
+
+class _FakeSession:
+    """Just enough of ``AsyncSession`` for the router under test."""
+
+    def __init__(self) -> None:
+        self.rows: dict[uuid.UUID, Any] = {}
+        self.commits = 0
+        self.executed: list[tuple[Any, Any]] = []
+        self.result_rows: list[tuple] = []
+        # Writes another transaction commits while this one runs: a plain
+        # read does not see them, a locking read waits for them.
+        self.concurrent: list[Callable[[], None]] = []
+
+    async def get(self, model: type, key: uuid.UUID) -> Any:
+        return self.rows.get(key)
+
+    async def scalar(self, stmt: Any) -> Any:
+        # Only used to load a job by id (``SynthesisJob.id_criteria``).
+        self.executed.append((stmt, None))
+        if "FOR UPDATE" in str(stmt):
+            while self.concurrent:
+                self.concurrent.pop(0)()
+        params = stmt.compile().params.values()
+        return self.rows.get(next(v for v in params if isinstance(v, uuid.UUID)))
+
+    def add(self, obj: Any) -> None:
+        self.rows[obj.id] = obj
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def close(self) -> None:
+        pass
+
+    async def scalars(self, stmt: Any) -> list[Any]:
+        # Only used to load voice profiles; the router filters by ID itself.
+        return [r for r in self.rows.values() if hasattr(r, "embedding_path")]
+
+    async def execute(self, stmt: Any, params: Any = None) -> Any:
+        self.executed.append((stmt, params))
+        return SimpleNamespace(all=lambda: self.result_rows)
+
+
+@pytest.fixture
+def session() -> _FakeSession:
+    return _FakeSession()
+
+
+@pytest.fixture
+def client(session: _FakeSession) -> TestClient:
+    app = FastAPI()
+    app.include_router(synthesis.router)
+
+    async def _db():
+        yield session
+
+    app.dependency_overrides[get_db] = _db
+    app.dependency_overrides[get_read_db] = _db
+    app.dependency_overrides[get_primary_read_db] = _db
+    return TestClient(app)
+
+
+# ---------------------------------------------------------------
+# POST /synthesize
+# ---------------------------------------------------------------
+
+
+@pytest.fixture
+def ready_voice(session: _FakeSession) -> uuid.UUID:
+    voice_id = uuid.uuid4()
+    session.rows[voice_id] = SimpleNamespace(
+        id=voice_id,
+        status=VoiceProfileStatus.READY,
+        engine_name="XTTS_HI",
+        embedding_path="embeddings/voice.json",
+        metadata_json={},
+    )
+    return voice_id
+
+
+@pytest.fixture(autouse=True)
+def counted(monkeypatch: pytest.MonkeyPatch) -> list[tuple[Any, Any, int]]:
+    """Capture status-counter transitions instead of writing them to Redis."""
+    from backend import counters
+
+    calls: list[tuple[Any, Any, int]] = []
+
+    async def _transition(model: type, old: Any, new: Any, n: int = 1) -> None:
+        calls.append((old, new, n))
+
+    monkeypatch.setattr(counters, "transition_async", _transition)
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def status_cache(monkeypatch: pytest.MonkeyPatch) -> dict[str, dict[str, Any]]:
+    """In-memory stand-in for the Redis job status cache: job ID -> fields."""
+    from backend import job_status
+
+    cache: dict[str, dict[str, Any]] = {}
+
+    async def _fill(jobs: list[Any]) -> None:
+        for job in jobs:
+            cache.setdefault(str(job.id), {}).update(job.model_dump())
+
+    async def _record(job_id: str, **state: Any) -> None:
+        cache.setdefault(job_id, {}).update({k: v for k, v in state.items() if v is not None})
+
+    async def _read(job_id: str) -> Any:
+        fields = cache.get(job_id)
+        return synthesis.SynthesisJobStatusResponse(**fields) if fields else None
+
+    monkeypatch.setattr(job_status, "fill", _fill)
+    monkeypatch.setattr(job_status, "record_async", _record)
+    monkeypatch.setattr(job_status, "read", _read)
+    return cache
+
+
+@pytest.fixture
+def enqueued(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    calls: list[dict[str, Any]] = []
+    monkeypatch.setattr(synthesis, "enqueue_synthesis", lambda **kw: calls.append(kw))
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def markers(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """In-memory stand-in for the Redis in-flight markers."""
+    store: dict[str, str] = {}
+
+    async def _claim(key: str, job_id: str, ttl: int) -> str | None:
+        if key in store:
+            return store[key]
+        store[key] = job_id
+        return None
+
+    async def _take_over(key: str, job_id: str, ttl: int) -> None:
+        store[key] = job_id
+
+    async def _release(key: str, job_id: str) -> None:
+        if store.get(key) == job_id:
+            del store[key]
+
+    monkeypatch.setattr(coalescing, "claim", _claim)
+    monkeypatch.setattr(coalescing, "take_over", _take_over)
+    monkeypatch.setattr(coalescing, "release_async", _release)
+    return store
+
+
+@pytest.fixture(autouse=True)
+def lane_load(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Fake queue state read by admission control (idle by default)."""
+    state: dict[str, Any] = {"depth": 0, "throughput": 1.0}
+
+    async def _read(queue: str) -> admission.LaneLoad:
+        return admission.LaneLoad(queue=queue, **state)
+
+    monkeypatch.setattr(admission, "read_lane_load", _read)
+    return state
+
+
+@pytest.fixture(autouse=True)
+def published(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    calls: list[tuple[str, str]] = []
+
+    async def _publish(job_id: str, stage: str, **data: Any) -> None:
+        calls.append((job_id, stage))
+
+    monkeypatch.setattr(events, "publish_async", _publish)
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def no_affinity(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _assign(route: Any, voice_profile_id: uuid.UUID) -> Any:
+        return route
+
+    monkeypatch.setattr(affinity, "assign", _assign)
+
+
+class TestSubmitSynthesis:
+    def test_persists_and_enqueues(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        ready_voice: uuid.UUID,
+        enqueued: list[dict[str, Any]],
+        published: list[tuple[str, str]],
+    ) -> None:
+        resp = client.post(
+            "/synthesize", json={"voice_profile_id": str(ready_voice), "text": "Namaste"}
+        )
+
+        assert resp.status_code == 202
+        data = resp.json()
+        assert data["status"] == "PENDING"
+        job = session.rows[uuid.UUID(data["id"])]
+        assert isinstance(job, SynthesisJob)
+        assert session.commits == 1
+        assert enqueued[0]["job_id"] == data["id"]
+        assert enqueued[0]["text"] == "Namaste"
+        assert published == [(data["id"], "queued")]
+
+    def test_unknown_voice(self, client: TestClient, enqueued: list) -> None:
+        resp = client.post(
+            "/synthesize", json={"voice_profile_id": str(uuid.uuid4()), "text": "Hi"}
+        )
+        assert resp.status_code == 404
+        assert enqueued == []
+
+    def test_voice_not_ready(
+        self, client: TestClient, session: _FakeSession, ready_voice: uuid.UUID, enqueued: list
+    ) -> None:
+        session.rows[ready_voice].status = VoiceProfileStatus.PROCESSING
+        resp = client.post(
+            "/synthesize", json={"voice_profile_id": str(ready_voice), "text": "Hi"}
+        )
+        assert resp.status_code == 409
+        assert enqueued == []
+
+    def test_deadline_is_propagated(
+        self, client: TestClient, ready_voice: uuid.UUID, enqueued: list[dict[str, Any]]
+    ) -> None:
+        before = datetime.now().timestamp()
+        resp = client.post(
+            "/synthesize",
+            json={"voice_profile_id": str(ready_voice), "text": "Quick", "max_wait_ms": 3000},
+        )
+
+        assert resp.status_code == 202
+        assert before + 3 <= enqueued[0]["deadline"] <= datetime.now().timestamp() + 3
+
+    def test_past_deadline_is_rejected(
+        self, client: TestClient, ready_voice: uuid.UUID, enqueued: list[dict[str, Any]]
+    ) -> None:
+        resp = client.post(
+            "/synthesize",
+            json={
+                "voice_profile_id": str(ready_voice),
+                "text": "Too late",
+                "deadline": "2020-01-01T00:00:00Z",
+            },
+        )
+
+        assert resp.status_code == 422
+        assert enqueued == []
+
+    def test_enqueue_failure_marks_job_failed(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        ready_voice: uuid.UUID,
+        monkeypatch: pytest.MonkeyPatch,
+        status_cache: dict[str, dict[str, Any]],
+    ) -> None:
+        def _broken(**_kw: Any) -> None:
+            raise ConnectionError("broker down")
+
+        monkeypatch.setattr(synthesis, "enqueue_synthesis", _broken)
+        resp = client.post(
+            "/synthesize", json={"voice_profile_id": str(ready_voice), "text": "Hi"}
+        )
+
+        assert resp.status_code == 503
+        jobs = [r for r in session.rows.values() if isinstance(r, SynthesisJob)]
+        assert jobs[0].status == "FAILED"
+        assert status_cache[str(jobs[0].id)]["status"] == SynthesisJobStatus.FAILED
+
+
+class TestAdmission:
+    def test_accepted_job_gets_eta(
+        self,
+        client: TestClient,
+        ready_voice: uuid.UUID,
+        enqueued: list[dict[str, Any]],
+        lane_load: dict[str, Any],
+    ) -> None:
+        lane_load["depth"] = 5
+        resp = client.post("/synthesize", json={"voice_profile_id": str(ready_voice), "text": "Hi"})
+
+        assert resp.status_code == 202
+        data = resp.json()
+        eta = datetime.fromisoformat(data["estimated_completion_at"])
+        created = datetime.fromisoformat(data["created_at"])
+        assert (eta - created).total_seconds() >= 5
+        assert enqueued[0]["route"].queue == "synthesis.interactive"
+
+    def test_affinity_queue_is_used(
+        self,
+        client: TestClient,
+        ready_voice: uuid.UUID,
+        enqueued: list[dict[str, Any]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        async def _assign(route: Any, voice_profile_id: uuid.UUID) -> Any:
+            return dataclasses.replace(route, queue=f"{route.lane}.celery@a")
+
+        monkeypatch.setattr(affinity, "assign", _assign)
+        client.post("/synthesize", json={"voice_profile_id": str(ready_voice), "text": "Hi"})
+
+        route = enqueued[0]["route"]
+        assert route.queue == "synthesis.interactive.celery@a"
+        assert route.lane == "synthesis.interactive"
+
+    def test_overloaded_lane_rejects_with_retry_after(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        ready_voice: uuid.UUID,
+        enqueued: list[dict[str, Any]],
+        lane_load: dict[str, Any],
+        markers: dict[str, str],
+    ) -> None:
+        lane_load["depth"] = 100
+        resp = client.post("/synthesize", json={"voice_profile_id": str(ready_voice), "text": "Hi"})
+
+        assert resp.status_code == 429
+        assert int(resp.headers["retry-after"]) >= 1
+        assert enqueued == []
+        assert not any(isinstance(r, SynthesisJob) for r in session.rows.values())
+        assert markers == {}
+
+    def test_saturated_lane_is_unavailable(
+        self,
+        client: TestClient,
+        ready_voice: uuid.UUID,
+        enqueued: list[dict[str, Any]],
+        lane_load: dict[str, Any],
+    ) -> None:
+        lane_load.update(depth=500, throughput=1000.0)
+        resp = client.post("/synthesize", json={"voice_profile_id": str(ready_voice), "text": "Hi"})
+
+        assert resp.status_code == 503
+        assert "retry-after" in resp.headers
+
+
+class TestCoalescing:
+    def _submit(self, client: TestClient, voice: uuid.UUID, text: str) -> Any:
+        return client.post("/synthesize", json={"voice_profile_id": str(voice), "text": text})
+
+    def test_duplicates_attach_to_inflight_job(
+        self,
+        client: TestClient,
+        ready_voice: uuid.UUID,
+        enqueued: list[dict[str, Any]],
+        markers: dict[str, str],
+    ) -> None:
+        first = self._submit(client, ready_voice, "Namaste duniya")
+        second = self._submit(client, ready_voice, "  Namaste   duniya ")
+
+        assert first.status_code == second.status_code == 202
+        assert second.json()["id"] == first.json()["id"]
+        assert second.headers["x-coalesced"] == "true"
+        assert "x-coalesced" not in first.headers
+        assert len(enqueued) == 1
+        assert enqueued[0]["coalesce_key"] in markers
+
+    def test_different_text_is_not_coalesced(
+        self,
+        client: TestClient,
+        ready_voice: uuid.UUID,
+        enqueued: list[dict[str, Any]],
+        markers: dict[str, str],
+    ) -> None:
+        first = self._submit(client, ready_voice, "Namaste")
+        second = self._submit(client, ready_voice, "Alvida")
+
+        assert first.json()["id"] != second.json()["id"]
+        assert len(enqueued) == 2
+
+    def test_failed_holder_is_taken_over(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        ready_voice: uuid.UUID,
+        enqueued: list[dict[str, Any]],
+        markers: dict[str, str],
+    ) -> None:
+        first = self._submit(client, ready_voice, "Namaste")
+        session.rows[uuid.UUID(first.json()["id"])].status = "FAILED"
+
+        second = self._submit(client, ready_voice, "Namaste")
+
+        assert second.json()["id"] != first.json()["id"]
+        assert len(enqueued) == 2
+        assert markers[enqueued[1]["coalesce_key"]] == second.json()["id"]
+
+    def test_enqueue_failure_releases_marker(
+        self,
+        client: TestClient,
+        ready_voice: uuid.UUID,
+        markers: dict[str, str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        def _broken(**_kw: Any) -> None:
+            raise ConnectionError("broker down")
+
+        monkeypatch.setattr(synthesis, "enqueue_synthesis", _broken)
+        resp = self._submit(client, ready_voice, "Namaste")
+
+        assert resp.status_code == 503
+        assert markers == {}
+
+
+# ---------------------------------------------------------------
+# POST /synthesize/batch  and  GET /batches/{batch_id}
+# ---------------------------------------------------------------
+
+
+@pytest.fixture
+def enqueued_many(monkeypatch: pytest.MonkeyPatch) -> list[list[dict[str, Any]]]:
+    calls: list[list[dict[str, Any]]] = []
+    monkeypatch.setattr(synthesis, "enqueue_synthesis_many", lambda reqs: calls.append(reqs))
+    return calls
+
+
+@pytest.fixture
+def batch_published(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    calls: list[list[str]] = []
+
+    async def _publish_many(job_ids: list[str], stage: str, **data: Any) -> None:
+        calls.append(job_ids)
+
+    monkeypatch.setattr(events, "publish_many_async", _publish_many)
+    return calls
+
+
+class TestBatchSubmission:
+    def _items(self, voice: uuid.UUID, n: int) -> list[dict[str, Any]]:
+        return [{"voice_profile_id": str(voice), "text": f"Line {i}"} for i in range(n)]
+
+    def test_single_insert_and_grouped_enqueue(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        ready_voice: uuid.UUID,
+        enqueued_many: list[list[dict[str, Any]]],
+        batch_published: list[list[str]],
+    ) -> None:
+        resp = client.post("/synthesize/batch", json={"items": self._items(ready_voice, 3)})
+
+        assert resp.status_code == 202
+        data = resp.json()
+        assert len(data["job_ids"]) == 3
+        assert data["estimated_completion_at"] is not None
+
+        (stmt, rows), = session.executed
+        assert len(rows) == 3
+        assert {r["batch_id"] for r in rows} == {uuid.UUID(data["batch_id"])}
+        assert [str(r["id"]) for r in rows] == data["job_ids"]
+        assert session.commits == 1
+
+        (requests,) = enqueued_many
+        assert [r["job_id"] for r in requests] == data["job_ids"]
+        assert batch_published == [data["job_ids"]]
+
+    def test_unknown_voice_rejects_whole_batch(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        ready_voice: uuid.UUID,
+        enqueued_many: list,
+    ) -> None:
+        items = self._items(ready_voice, 2) + self._items(uuid.uuid4(), 1)
+        resp = client.post("/synthesize/batch", json={"items": items})
+
+        assert resp.status_code == 404
+        assert session.executed == []
+        assert enqueued_many == []
+
+    def test_oversized_batch(
+        self, client: TestClient, ready_voice: uuid.UUID, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(get_config().limits, "max_batch_size", 2)
+        resp = client.post("/synthesize/batch", json={"items": self._items(ready_voice, 3)})
+        assert resp.status_code == 413
+
+    def test_partial_enqueue_failure(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        ready_voice: uuid.UUID,
+        batch_published: list[list[str]],
+        counted: list[tuple[Any, Any, int]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        def _broken(requests: list[dict[str, Any]]) -> None:
+            raise PartialEnqueueError(1)
+
+        monkeypatch.setattr(synthesis, "enqueue_synthesis_many", _broken)
+        resp = client.post("/synthesize/batch", json={"items": self._items(ready_voice, 3)})
+
+        assert resp.status_code == 503
+        assert resp.json()["detail"]["enqueued"] == 1
+        assert len(session.executed) == 2  # insert, then mark the unsent two FAILED
+        assert len(batch_published[0]) == 1
+        assert counted == [
+            (None, SynthesisJobStatus.PENDING, 3),
+            (SynthesisJobStatus.PENDING, SynthesisJobStatus.FAILED, 2),
+        ]
+
+
+class TestBatchStatus:
+    def test_counts_by_status(self, client: TestClient, session: _FakeSession) -> None:
+        session.result_rows = [("COMPLETED", 2), ("PENDING", 1)]
+        resp = client.get(f"/batches/{uuid.uuid4()}")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 3
+        assert data["counts"] == {"COMPLETED": 2, "PENDING": 1}
+        assert data["finished"] is False
+
+    def test_finished_batch(self, client: TestClient, session: _FakeSession) -> None:
+        session.result_rows = [("COMPLETED", 2), ("FAILED", 1)]
+        assert client.get(f"/batches/{uuid.uuid4()}").json()["finished"] is True
+
+    def test_unknown_batch(self, client: TestClient) -> None:
+        assert client.get(f"/batches/{uuid.uuid4()}").status_code == 404
+
+
+# ---------------------------------------------------------------
+# DELETE /jobs/{job_id}
+# ---------------------------------------------------------------
+
+
+@pytest.fixture
+def cancel_calls(monkeypatch: pytest.MonkeyPatch) -> dict[str, Any]:
+    """Capture the side effects of a cancellation."""
+    from backend import cancellation, metrics
+
+    calls: dict[str, Any] = {"flagged": [], "revoked": [], "recorded": [], "last_stage": None}
+
+    async def _flag(job_id: str) -> None:
+        calls["flagged"].append(job_id)
+
+    async def _last_stage(job_id: str) -> str | None:
+        return calls["last_stage"]
+
+    async def _record(state: str, saved: float) -> None:
+        calls["recorded"].append((state, saved))
+
+    monkeypatch.setattr(cancellation, "request_cancel", _flag)
+    monkeypatch.setattr(events, "last_stage", _last_stage)
+    monkeypatch.setattr(metrics, "record_cancellation_async", _record)
+    monkeypatch.setattr(synthesis, "revoke_synthesis", calls["revoked"].append)
+    return calls
+
+
+def _job_row(session: _FakeSession, status: SynthesisJobStatus) -> uuid.UUID:
+    job_id = partitions.new_id()
+    now = datetime(2026, 1, 1)
+    session.rows[job_id] = SimpleNamespace(
+        id=job_id,
+        voice_profile_id=uuid.uuid4(),
+        engine_name="xtts-hindi",
+        input_text="x" * 100,
+        params_json=None,
+        status=status,
+        output_storage_key=None,
+        error_message=None,
+        created_at=now,
+        updated_at=now,
+        batch_id=None,
+    )
+    return job_id
+
+
+class TestCancelJob:
+    def test_queued_job_is_revoked_and_fully_credited(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        cancel_calls: dict[str, Any],
+        published: list[tuple[str, str]],
+        counted: list[tuple[Any, Any, int]],
+        status_cache: dict[str, dict[str, Any]],
+    ) -> None:
+        job_id = _job_row(session, SynthesisJobStatus.PENDING)
+        cancel_calls["last_stage"] = events.QUEUED
+
+        resp = client.delete(f"/jobs/{job_id}")
+
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "CANCELLED"
+        assert session.commits == 1
+        assert cancel_calls["flagged"] == cancel_calls["revoked"] == [str(job_id)]
+        cost = synthesis.estimate_cost("x" * 100, "xtts-hindi")
+        assert cancel_calls["recorded"] == [("queued", cost)]
+        assert published == [(str(job_id), events.CANCELLED)]
+        assert counted == [(SynthesisJobStatus.PENDING, SynthesisJobStatus.CANCELLED, 1)]
+        assert status_cache[str(job_id)]["status"] == SynthesisJobStatus.CANCELLED
+
+    def test_running_job_is_left_to_the_worker(
+        self, client: TestClient, session: _FakeSession, cancel_calls: dict[str, Any]
+    ) -> None:
+        job_id = _job_row(session, SynthesisJobStatus.PENDING)
+        cancel_calls["last_stage"] = events.CHUNK
+
+        assert client.delete(f"/jobs/{job_id}").status_code == 200
+        assert cancel_calls["flagged"] == [str(job_id)]
+        assert cancel_calls["recorded"] == []
+
+    def test_cancel_is_idempotent(
+        self, client: TestClient, session: _FakeSession, cancel_calls: dict[str, Any]
+    ) -> None:
+        job_id = _job_row(session, SynthesisJobStatus.CANCELLED)
+
+        assert client.delete(f"/jobs/{job_id}").status_code == 200
+        assert cancel_calls["flagged"] == []
+
+    def test_finished_job_conflicts(
+        self, client: TestClient, session: _FakeSession, cancel_calls: dict[str, Any]
+    ) -> None:
+        job_id = _job_row(session, SynthesisJobStatus.COMPLETED)
+        assert client.delete(f"/jobs/{job_id}").status_code == 409
+
+    def test_job_finished_by_a_worker_meanwhile_conflicts(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        cancel_calls: dict[str, Any],
+        counted: list[tuple[Any, Any, int]],
+    ) -> None:
+        job_id = _job_row(session, SynthesisJobStatus.PROCESSING)
+        row = session.rows[job_id]
+        session.concurrent.append(lambda: setattr(row, "status", SynthesisJobStatus.COMPLETED))
+
+        resp = client.delete(f"/jobs/{job_id}")
+
+        assert resp.status_code == 409
+        assert row.status == SynthesisJobStatus.COMPLETED
+        assert session.commits == 0
+        assert cancel_calls["flagged"] == []
+        assert counted == []
+
+    def test_unknown_job(self, client: TestClient, cancel_calls: dict[str, Any]) -> None:
+        assert client.delete(f"/jobs/{uuid.uuid4()}").status_code == 404
+
+
+# ---------------------------------------------------------------
+# GET /jobs/{job_id}
+# ---------------------------------------------------------------
+
+
+class TestGetJob:
+    def test_miss_reads_the_row_and_fills_the_cache(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        status_cache: dict[str, dict[str, Any]],
+    ) -> None:
+        job_id = _job_row(session, SynthesisJobStatus.PROCESSING)
+
+        resp = client.get(f"/jobs/{job_id}")
+
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "PROCESSING"
+        assert status_cache[str(job_id)]["status"] == SynthesisJobStatus.PROCESSING
+
+    def test_row_lookup_prunes_partitions(
+        self, client: TestClient, session: _FakeSession
+    ) -> None:
+        job_id = _job_row(session, SynthesisJobStatus.PROCESSING)
+
+        client.get(f"/jobs/{job_id}")
+
+        stmt, _ = session.executed[-1]
+        assert "synthesis_jobs.created_at BETWEEN" in str(stmt)
+        assert "input_text" not in str(stmt)
+
+    def test_hit_is_served_without_the_database(
+        self,
+        client: TestClient,
+        session: _FakeSession,
+        status_cache: dict[str, dict[str, Any]],
+    ) -> None:
+        job_id = _job_row(session, SynthesisJobStatus.PROCESSING)
+        client.get(f"/jobs/{job_id}")
+        del session.rows[job_id]
+        status_cache[str(job_id)].update(status=SynthesisJobStatus.PROCESSING, progress=0.25)
+
+        data = client.get(f"/jobs/{job_id}").json()
+
+        assert data["status"] == "PROCESSING"
+        assert data["progress"] == 0.25
+
+    def test_cache_outage_falls_back_to_the_row(
+        self, client: TestClient, session: _FakeSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from backend import job_status
+
+        async def _down(job_id: str) -> None:
+            raise RedisError("down")
+
+        monkeypatch.setattr(job_status, "read", _down)
+        job_id = _job_row(session, SynthesisJobStatus.COMPLETED)
+        assert client.get(f"/jobs/{job_id}").json()["status"] == "COMPLETED"
+
+    def test_unknown_job(self, client: TestClient) -> None:
+        assert client.get(f"/jobs/{uuid.uuid4()}").status_code == 404
+
+
+# ---------------------------------------------------------------
+# GET /jobs
+# ---------------------------------------------------------------
+
+
+class TestListJobs:
+    @staticmethod
+    def _summary_rows(session: _FakeSession) -> list[SimpleNamespace]:
+        """The job rows as the summary projection returns them."""
+        return [
+            SimpleNamespace(**vars(row), input_preview=row.input_text[:80])
+            for row in session.rows.values()
+        ]
+
+    def test_pages_with_a_cursor(self, client: TestClient, session: _FakeSession) -> None:
+        for _ in range(3):
+            _job_row(session, SynthesisJobStatus.PENDING)
+        session.result_rows = self._summary_rows(session)
+
+        resp = client.get("/jobs", params={"status": "PENDING", "limit": 2})
+
+        assert resp.status_code == 200
+        assert len(resp.json()) == 2
+        assert resp.headers["X-Next-Cursor"]
+        sql = str(session.executed[0][0].compile(compile_kwargs={"literal_binds": True}))
+        assert "synthesis_jobs.status = 'PENDING'" in sql
+        assert "LIMIT 3" in sql
+
+    def test_large_columns_are_not_selected(
+        self, client: TestClient, session: _FakeSession
+    ) -> None:
+        _job_row(session, SynthesisJobStatus.COMPLETED)
+        session.result_rows = self._summary_rows(session)
+
+        job = client.get("/jobs").json()[0]
+
+        assert job["input_preview"] == "x" * 80
+        assert "input_text" not in job and "params_json" not in job
+        stmt = session.executed[0][0]
+        assert "input_text" not in [c.name for c in stmt.selected_columns]
+        assert "params_json" not in [c.name for c in stmt.selected_columns]
+        assert "substr(synthesis_jobs.input_text" in str(stmt)
+
+    def test_last_page_has_no_cursor(self, client: TestClient, session: _FakeSession) -> None:
+        _job_row(session, SynthesisJobStatus.PENDING)
+        session.result_rows = self._summary_rows(session)
+
+        resp = client.get("/jobs")
+
+        assert resp.status_code == 200
+        assert "X-Next-Cursor" not in resp.headers
+
+    def test_malformed_cursor(self, client: TestClient) -> None:
+        assert client.get("/jobs", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+# ---------------------------------------------------------------
+# GET /jobs/{job_id}/events  and  /jobs/{job_id}/ws
+# ---------------------------------------------------------------
+
+
+@pytest.fixture
+def running_job(session: _FakeSession, monkeypatch: pytest.MonkeyPatch) -> uuid.UUID:
+    job_id = uuid.uuid4()
+    session.rows[job_id] = SimpleNamespace(id=job_id, status=SynthesisJobStatus.PROCESSING)
+
+    async def _subscribe(jid: str):
+        yield events.make_event(jid, events.STARTED)
+        yield None
+        yield events.make_event(jid, events.CHUNK, chunk=1, total=1)
+        yield events.make_event(jid, events.COMPLETED, output_storage_key="outputs/x.wav")
+
+    monkeypatch.setattr(events, "subscribe", _subscribe)
+    return job_id
+
+
+class TestEventStreams:
+    def test_sse_relays_events(self, client: TestClient, running_job: uuid.UUID) -> None:
+        resp = client.get(f"/jobs/{running_job}/events")
+
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        frames = resp.text.strip().split("\n\n")
+        assert frames[0].startswith("event: started\ndata: ")
+        assert frames[1] == ": keep-alive"
+        assert frames[2].startswith("event: chunk\n")
+        assert json.loads(frames[3].split("data: ", 1)[1])["output_storage_key"] == "outputs/x.wav"
+
+    def test_finished_job_is_served_from_its_row(
+        self, client: TestClient, session: _FakeSession
+    ) -> None:
+        job_id = uuid.uuid4()
+        session.rows[job_id] = SimpleNamespace(
+            id=job_id,
+            status=SynthesisJobStatus.FAILED,
+            output_storage_key=None,
+            error_message="boom",
+        )
+        resp = client.get(f"/jobs/{job_id}/events")
+
+        frames = resp.text.strip().split("\n\n")
+        assert len(frames) == 1
+        assert frames[0].startswith("event: failed\n")
+
+    def test_sse_unknown_job(self, client: TestClient) -> None:
+        assert client.get(f"/jobs/{uuid.uuid4()}/events").status_code == 404
+
+    def test_websocket_relays_events(self, client: TestClient, running_job: uuid.UUID) -> None:
+        with client.websocket_connect(f"/jobs/{running_job}/ws") as ws:
+            stages = [ws.receive_json()["stage"] for _ in range(3)]
+        assert stages == ["started", "chunk", "completed"]
+
+    def test_websocket_unknown_job(self, client: TestClient) -> None:
+        with pytest.raises(WebSocketDisconnect) as excinfo:
+            with client.websocket_connect(f"/jobs/{uuid.uuid4()}/ws") as ws:
+                ws.receive_json()
+        assert excinfo.value.code == 1008
+
+
+# ---------------------------------------------------------------
+# GET /jobs/{job_id}/audio
+# ---------------------------------------------------------------
+
+
+AUDIO = bytes(range(256)) * 40  # 10 240 bytes
+ETAG = '"0123456789abcdef0123456789abcdef"'
+
+
+@pytest.fixture
+def audio_job(session: _FakeSession, monkeypatch: pytest.MonkeyPatch) -> uuid.UUID:
+    job_id = uuid.uuid4()
+    session.rows[job_id] = SimpleNamespace(id=job_id, output_storage_key=f"outputs/{job_id}.wav")
+
+    def _stat(key: str) -> storage.ObjectInfo:
+        # A blocking HEAD must run in the thread pool, not on the event loop.
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        return storage.ObjectInfo(
+            storage_key=key, size=len(AUDIO), etag=ETAG, content_type="audio/wav"
+        )
+
+    def _iter(key: str, start: int | None = None, end: int | None = None, chunk_size: int = 1024):
+        data = AUDIO[start or 0 : None if end is None else end + 1]
+        for i in range(0, len(data), chunk_size):
+            yield data[i : i + chunk_size]
+
+    monkeypatch.setattr(storage, "stat_object", _stat)
+    monkeypatch.setattr(storage, "iter_object", _iter)
+    return job_id
+
+
+class TestAudioEndpoint:
+    def test_full_body(self, client: TestClient, audio_job: uuid.UUID) -> None:
+        resp = client.get(f"/jobs/{audio_job}/audio")
+        assert resp.status_code == 200
+        assert resp.content == AUDIO
+        assert resp.headers["etag"] == ETAG
+        assert resp.headers["accept-ranges"] == "bytes"
+        assert "max-age" in resp.headers["cache-control"]
+
+    def test_range_request(self, client: TestClient, audio_job: uuid.UUID) -> None:
+        resp = client.get(f"/jobs/{audio_job}/audio", headers={"Range": "bytes=100-199"})
+        assert resp.status_code == 206
+        assert resp.content == AUDIO[100:200]
+        assert resp.headers["content-range"] == f"bytes 100-199/{len(AUDIO)}"
+
+    def test_suffix_range(self, client: TestClient, audio_job: uuid.UUID) -> None:
+        resp = client.get(f"/jobs/{audio_job}/audio", headers={"Range": "bytes=-10"})
+        assert resp.status_code == 206
+        assert resp.content == AUDIO[-10:]
+
+    def test_unsatisfiable_range(self, client: TestClient, audio_job: uuid.UUID) -> None:
+        resp = client.get(f"/jobs/{audio_job}/audio", headers={"Range": "bytes=99999-"})
+        assert resp.status_code == 416
+        assert resp.headers["content-range"] == f"bytes */{len(AUDIO)}"
+
+    def test_if_none_match(self, client: TestClient, audio_job: uuid.UUID) -> None:
+        resp = client.get(f"/jobs/{audio_job}/audio", headers={"If-None-Match": ETAG})
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+    def test_stale_if_range_serves_full_body(self, client: TestClient, audio_job: uuid.UUID) -> None:
+        resp = client.get(
+            f"/jobs/{audio_job}/audio",
+            headers={"Range": "bytes=0-9", "If-Range": '"stale"'},
+        )
+        assert resp.status_code == 200
+        assert resp.content == AUDIO
+
+    def test_unknown_job(self, client: TestClient) -> None:
+        resp = client.get(f"/jobs/{uuid.uuid4()}/audio")
+        assert resp.status_code == 404
+
+    def test_job_without_output(self, client: TestClient, session: _FakeSession) -> None:
+        job_id = uuid.uuid4()
+        session.rows[job_id] = SimpleNamespace(id=job_id, output_storage_key=None)
+        resp = client.get(f"/jobs/{job_id}/audio")
+        assert resp.status_code == 409
+
+
+class TestParseRange:
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("bytes=0-0", (0, 0)),
+            ("bytes=10-", (10, 99)),
+            ("bytes=90-500", (90, 99)),
+            ("bytes=-5", (95, 99)),
+            ("bytes=0-1,5-6", None),
+            ("items=0-1", None),
+            ("bytes=abc", None),
+            ("bytes=5-1", None),
+        ],
+    )
+    def test_parse(self, header: str, expected: tuple[int, int] | None) -> None:
+        assert synthesis._parse_range(header, 100) == expected
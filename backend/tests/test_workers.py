@@ -7,11 +7,14 @@ underlying task functions directly and mock external dependencies.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import wave
+from datetime import date
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -27,6 +30,7 @@ def _use_tmp_model_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None
     model_dir.mkdir(parents=True)
     monkeypatch.setenv("AWAAZTWIN_ENGINE_XTTS_HI_PATH", str(model_dir))
     monkeypatch.setenv("AWAAZTWIN_ENGINE_OPENVOICE_PATH", str(tmp_path / "models" / "openvoice"))
+    monkeypatch.setenv("AWAAZTWIN_OUTPUT_SPOOL_DIR", str(tmp_path / "spool"))
     # Allow local file access for tests
     monkeypatch.setenv("AWAAZTWIN_UPLOAD_BASE_DIR", str(tmp_path))
     # Clear adapter cache so each test gets a fresh adapter
@@ -34,6 +38,101 @@ def _use_tmp_model_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None
     _ADAPTER_CACHE.clear()
 
 
+@pytest.fixture(autouse=True)
+def s3(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the shared S3 client so uploads never leave the process."""
+    from backend import storage
+
+    client = MagicMock()
+    monkeypatch.setattr(storage, "_get_s3_client", lambda: client)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def published(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str, dict]]:
+    """Capture job events instead of publishing them to Redis."""
+    from backend import events
+
+    calls: list[tuple[str, str, dict]] = []
+    monkeypatch.setattr(
+        events, "publish", lambda job_id, stage, **data: calls.append((job_id, stage, data))
+    )
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def cancelled(monkeypatch: pytest.MonkeyPatch) -> set[str]:
+    """Job IDs to treat as cancelled; the Redis flag is never read."""
+    from backend import cancellation
+
+    jobs: set[str] = set()
+    monkeypatch.setattr(cancellation, "is_cancelled", lambda job_id: job_id in jobs)
+    return jobs
+
+
+@pytest.fixture(autouse=True)
+def result_cache(monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """In-memory stand-in for the Redis result cache."""
+    from backend import coalescing
+
+    cache: dict[str, str] = {}
+    monkeypatch.setattr(
+        coalescing, "remember_result", lambda key, output, ttl: cache.__setitem__(key, output)
+    )
+    monkeypatch.setattr(coalescing, "lookup_result", cache.get)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def job_updates(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str, dict]]:
+    """Capture job-row status updates instead of writing to Postgres."""
+    from backend.workers import synthesis_worker
+
+    calls: list[tuple[str, str, dict]] = []
+
+    def _record(job_id: str, status, **values: object) -> bool:  # noqa: ANN001
+        calls.append((job_id, status.value, values))
+        return True
+
+    monkeypatch.setattr(synthesis_worker, "_set_job_status", _record)
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def status_records(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, dict]]:
+    """Capture job status cache writes instead of sending them to Redis."""
+    from backend import job_status
+
+    calls: list[tuple[str, dict]] = []
+    monkeypatch.setattr(job_status, "record", lambda job_id, **state: calls.append((job_id, state)))
+    return calls
+
+
+@pytest.fixture(autouse=True)
+def running(monkeypatch: pytest.MonkeyPatch) -> set[str]:
+    """Jobs heartbeated by another live worker; nothing is sent to Redis."""
+    from backend.workers import heartbeats
+
+    elsewhere: set[str] = set()
+    monkeypatch.setattr(heartbeats, "track", lambda job_id: job_id not in elsewhere)
+    monkeypatch.setattr(heartbeats, "untrack", lambda job_id: None)
+    return elsewhere
+
+
+@pytest.fixture(autouse=True)
+def task_failures(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str, bool]]:
+    """Capture failure-class counters instead of writing them to Redis."""
+    from backend import metrics
+
+    calls: list[tuple[str, str, bool]] = []
+    monkeypatch.setattr(
+        metrics,
+        "record_task_failure",
+        lambda task, cls, *, retried: calls.append((task, cls, retried)),
+    )
+    return calls
+
+
 # ---------------------------------------------------------------
 # voice_prep_worker
 # ---------------------------------------------------------------
@@ -80,6 +179,19 @@ class TestVoicePrepWorker:
         emb = VoiceEmbeddingRef.from_json(result["embedding"])
         assert emb.metadata["sample_count"] == 3
 
+    @pytest.mark.parametrize("uri", ["s3://bucket", "s3://bucket/", "s3://"])
+    def test_s3_uri_without_a_key_is_rejected(self, uri: str) -> None:
+        from backend.workers.voice_prep_worker import _storage_key
+
+        with pytest.raises(ValueError, match="no object key"):
+            _storage_key(uri)
+
+    def test_storage_key_strips_the_bucket(self) -> None:
+        from backend.workers.voice_prep_worker import _storage_key
+
+        assert _storage_key("s3://bucket/samples/a.wav") == "samples/a.wav"
+        assert _storage_key("samples/a.wav") == "samples/a.wav"
+
 
 # ---------------------------------------------------------------
 # synthesis_worker
@@ -140,6 +252,383 @@ class TestSynthesisWorker:
 
         assert result["status"] == "completed"
 
+    def test_small_output_is_uploaded_from_memory(
+        self, tmp_path: Path, s3: MagicMock
+    ) -> None:
+        """Outputs under the memory limit never touch the spool dir."""
+        ref = VoiceEmbeddingRef(
+            engine_name="XTTS_HI",
+            embedding_path=str(tmp_path / "emb.json"),
+        )
+
+        from backend.workers.synthesis_worker import run_synthesis
+
+        result = run_synthesis.apply(
+            args=["job-005", "In memory", ref.to_json()],
+        ).get()
+
+        assert result["output_uri"] == "outputs/job-005.wav"
+        kwargs = s3.put_object.call_args.kwargs
+        assert kwargs["Key"] == "outputs/job-005.wav"
+        assert kwargs["Body"][:4] == b"RIFF"
+        assert kwargs["ContentType"] == "audio/wav"
+        s3.upload_file.assert_not_called()
+        assert not any((tmp_path / "spool").glob("*"))
+
+    def test_large_output_is_spooled_and_cleaned(
+        self, tmp_path: Path, s3: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Outputs over the memory limit are spooled outside model_path,
+        uploaded under ``outputs/<job_id>.wav`` and then removed."""
+        monkeypatch.setenv("AWAAZTWIN_OUTPUT_MEMORY_LIMIT_BYTES", "0")
+        ref = VoiceEmbeddingRef(
+            engine_name="XTTS_HI",
+            embedding_path=str(tmp_path / "emb.json"),
+        )
+
+        from backend.workers.synthesis_worker import run_synthesis
+
+        result = run_synthesis.apply(
+            args=["job-006", "Spool me", ref.to_json()],
+        ).get()
+
+        assert result["output_uri"] == "outputs/job-006.wav"
+        local_path, _, key = s3.upload_file.call_args.args
+        assert key == "outputs/job-006.wav"
+        assert Path(local_path).parent == tmp_path / "spool"
+        assert not Path(local_path).exists()
+        assert not (tmp_path / "models" / "xtts-hindi" / "outputs").exists()
+
+    def test_publishes_stage_events(
+        self, tmp_path: Path, published: list[tuple[str, str, dict]]
+    ) -> None:
+        """Each stage transition is published for event-stream clients."""
+        ref = VoiceEmbeddingRef(
+            engine_name="XTTS_HI",
+            embedding_path=str(tmp_path / "emb.json"),
+        )
+
+        from backend.workers.synthesis_worker import run_synthesis
+
+        run_synthesis.apply(args=["job-008", "Events", ref.to_json()]).get()
+
+        assert [stage for _, stage, _ in published] == [
+            "started",
+            "chunk",
+            "uploaded",
+            "completed",
+        ]
+        assert published[1][2] == {"chunk": 1, "total": 1}
+        assert published[-1][2]["output_storage_key"] == "outputs/job-008.wav"
+
+    def test_engine_mismatch_is_not_retried(
+        self,
+        tmp_path: Path,
+        published: list[tuple[str, str, dict]],
+        task_failures: list[tuple[str, str, bool]],
+    ) -> None:
+        """Deterministic failures fail on the first attempt."""
+        ref = VoiceEmbeddingRef(
+            engine_name="OPENVOICE_V2",
+            embedding_path=str(tmp_path / "emb.json"),
+        )
+
+        from backend.workers.synthesis_worker import run_synthesis
+
+        with pytest.raises(ValueError):
+            run_synthesis.apply(
+                args=["job-009", "Mismatch", ref.to_json(), "XTTS_HI"],
+            ).get()
+
+        assert [stage for _, stage, _ in published] == ["started", "failed"]
+        assert published[-1][2]["failure_class"] == "permanent"
+        assert [(cls, retried) for _, cls, retried in task_failures] == [("permanent", False)]
+
+    def test_transient_failure_is_retried(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        task_failures: list[tuple[str, str, bool]],
+    ) -> None:
+        from backend.workers import synthesis_worker
+
+        real_upload = synthesis_worker._upload_output
+        attempts: list[int] = []
+
+        def _flaky_upload(output, key):  # noqa: ANN001, ANN202
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError("storage unreachable")
+            return real_upload(output, key)
+
+        monkeypatch.setattr(synthesis_worker, "_upload_output", _flaky_upload)
+        ref = VoiceEmbeddingRef(
+            engine_name="XTTS_HI",
+            embedding_path=str(tmp_path / "emb.json"),
+        )
+
+        result = synthesis_worker.run_synthesis.apply(
+            args=["job-010", "Flaky", ref.to_json()],
+        ).get()
+
+        assert result["status"] == "completed"
+        assert len(attempts) == 2
+        assert [(cls, retried) for _, cls, retried in task_failures] == [("transient", True)]
+
+    def test_completion_releases_inflight_marker(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A finished job lets identical submissions start afresh."""
+        from backend import coalescing
+        from backend.workers.synthesis_worker import run_synthesis
+
+        released = MagicMock()
+        monkeypatch.setattr(coalescing, "release", released)
+        ref = VoiceEmbeddingRef(
+            engine_name="XTTS_HI",
+            embedding_path=str(tmp_path / "emb.json"),
+        )
+
+        run_synthesis.apply(
+            args=["job-007", "Coalesced", ref.to_json()],
+            headers={"coalesce_key": "awaaztwin:inflight:abc"},
+        ).get()
+
+        released.assert_called_once_with("awaaztwin:inflight:abc", "job-007")
+
+    def test_retried_long_job_skips_finished_segments(
+        self,
+        tmp_path: Path,
+        s3: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        published: list[tuple[str, str, dict]],
+    ) -> None:
+        """Segments finished before a failure are reused, not re-synthesised."""
+        from backend import storage
+        from backend.config import get_config
+        from backend.engines.xtts_hindi import XTTSHindiEngineAdapter
+        from backend.workers import checkpoints, synthesis_worker
+
+        monkeypatch.setattr(get_config().checkpoint, "min_chars", 10)
+        monkeypatch.setattr(get_config().checkpoint, "segment_max_chars", 20)
+
+        saved: dict[int, str] = {}
+        monkeypatch.setattr(checkpoints.Checkpoint, "load", lambda self: dict(saved))
+        monkeypatch.setattr(
+            checkpoints.Checkpoint, "mark_done", lambda self, i, key: saved.__setitem__(i, key)
+        )
+        monkeypatch.setattr(checkpoints.Checkpoint, "clear", lambda self: saved.clear())
+
+        objects: dict[str, bytes] = {}
+        s3.upload_file.side_effect = lambda path, bucket, key, ExtraArgs=None: objects.__setitem__(
+            key, Path(path).read_bytes()
+        )
+
+        async def _download(key: str, local_path: Path) -> Path:
+            local_path.write_bytes(objects[key])
+            return local_path
+
+        monkeypatch.setattr(storage, "download_file", _download)
+
+        real_synthesize = XTTSHindiEngineAdapter.synthesize_audio
+        rendered: list[str] = []
+
+        def _crash_on_third(self, text, voice_ref, params=None):  # noqa: ANN001, ANN202
+            if text == "Third one." and "Third one." not in rendered:
+                rendered.append(text)
+                raise ConnectionError("worker restarted")
+            rendered.append(text)
+            return real_synthesize(self, text, voice_ref, params)
+
+        monkeypatch.setattr(XTTSHindiEngineAdapter, "synthesize_audio", _crash_on_third)
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path=str(tmp_path / "emb.json"))
+
+        result = synthesis_worker.run_synthesis.apply(
+            args=["job-011", "First one. Second one. Third one.", ref.to_json()],
+        ).get()
+
+        assert result["status"] == "completed"
+        assert rendered == ["First one.", "Second one.", "Third one.", "Third one."]
+        chunks = [data for _, stage, data in published if stage == "chunk"]
+        assert [(c["chunk"], c["resumed"]) for c in chunks] == [
+            (1, False), (2, False), (1, True), (2, True), (3, False),
+        ]  # fmt: skip
+        deleted = s3.delete_objects.call_args.kwargs["Delete"]["Objects"]
+        assert [o["Key"] for o in deleted] == [
+            f"outputs/job-011/segments/{i:04d}.wav" for i in range(3)
+        ]
+        assert saved == {}
+        assert not list((tmp_path / "spool").glob("job-011_*"))
+
+    def test_cancelled_job_is_not_started(
+        self,
+        tmp_path: Path,
+        s3: MagicMock,
+        cancelled: set[str],
+        published: list[tuple[str, str, dict]],
+    ) -> None:
+        from backend.workers.synthesis_worker import run_synthesis
+
+        cancelled.add("job-012")
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path=str(tmp_path / "emb.json"))
+
+        result = run_synthesis.apply(args=["job-012", "Never mind", ref.to_json()]).get()
+
+        assert result == {"job_id": "job-012", "status": "cancelled"}
+        assert published == []
+        s3.put_object.assert_not_called()
+
+    def test_running_job_stops_between_segments(
+        self,
+        tmp_path: Path,
+        s3: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        cancelled: set[str],
+        published: list[tuple[str, str, dict]],
+    ) -> None:
+        """Cancellation is honoured at the next segment; the rest is credited."""
+        from backend import metrics
+        from backend.config import get_config
+        from backend.engines.xtts_hindi import XTTSHindiEngineAdapter
+        from backend.workers import checkpoints, synthesis_worker
+
+        monkeypatch.setattr(get_config().checkpoint, "min_chars", 10)
+        monkeypatch.setattr(get_config().checkpoint, "segment_max_chars", 20)
+        monkeypatch.setattr(checkpoints.Checkpoint, "load", lambda self: {})
+        monkeypatch.setattr(checkpoints.Checkpoint, "mark_done", lambda self, i, key: None)
+        recorded: list[tuple[str, float]] = []
+        monkeypatch.setattr(metrics, "record_cancellation", lambda s, saved: recorded.append((s, saved)))
+
+        real_synthesize = XTTSHindiEngineAdapter.synthesize_audio
+        rendered: list[str] = []
+
+        def _cancel_after_first(self, text, voice_ref, params=None):  # noqa: ANN001, ANN202
+            rendered.append(text)
+            cancelled.add("job-013")
+            return real_synthesize(self, text, voice_ref, params)
+
+        monkeypatch.setattr(XTTSHindiEngineAdapter, "synthesize_audio", _cancel_after_first)
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path=str(tmp_path / "emb.json"))
+        text = "First one. Second one. Third one."
+
+        result = synthesis_worker.run_synthesis.apply(args=["job-013", text, ref.to_json()]).get()
+
+        assert result["status"] == "cancelled"
+        assert rendered == ["First one."]
+        assert published[-1][1] == "cancelled"
+        saved = synthesis_worker.estimate_cost(text, "XTTS_HI") * 2 / 3
+        assert recorded == [("running", pytest.approx(saved))]
+        assert not list((tmp_path / "spool").glob("job-013_*"))
+
+    def test_expired_job_is_dropped_unstarted(
+        self,
+        tmp_path: Path,
+        s3: MagicMock,
+        published: list[tuple[str, str, dict]],
+        job_updates: list[tuple[str, str, dict]],
+    ) -> None:
+        import time
+
+        from backend.workers.synthesis_worker import run_synthesis
+
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path=str(tmp_path / "emb.json"))
+
+        result = run_synthesis.apply(
+            args=["job-014", "Too late", ref.to_json()],
+            headers={"deadline": time.time() - 1},
+        ).get()
+
+        assert result == {"job_id": "job-014", "status": "expired"}
+        assert [stage for _, stage, _ in published] == ["expired"]
+        assert [(job, status) for job, status, _ in job_updates] == [("job-014", "EXPIRED")]
+        s3.put_object.assert_not_called()
+
+    def test_expired_job_is_completed_from_cache(
+        self,
+        tmp_path: Path,
+        result_cache: dict[str, str],
+        published: list[tuple[str, str, dict]],
+        job_updates: list[tuple[str, str, dict]],
+    ) -> None:
+        import time
+
+        from backend.workers.synthesis_worker import run_synthesis
+
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path=str(tmp_path / "emb.json"))
+        headers = {"coalesce_key": "awaaztwin:inflight:abc"}
+        first = run_synthesis.apply(args=["job-015", "Same", ref.to_json()], headers=headers).get()
+
+        result = run_synthesis.apply(
+            args=["job-016", "Same", ref.to_json()],
+            headers={**headers, "deadline": time.time() - 1},
+        ).get()
+
+        from backend.models import SynthesisJobStatus
+
+        assert result["status"] == "completed"
+        assert result["output_uri"] == first["output_uri"] == "outputs/job-015.wav"
+        assert published[-1][1:] == (
+            "completed",
+            {"output_storage_key": "outputs/job-015.wav", "from_cache": True},
+        )
+        assert [u for u in job_updates if u[0] == "job-016"] == [
+            (
+                "job-016",
+                "COMPLETED",
+                {
+                    "expected": (SynthesisJobStatus.PENDING,),
+                    "output_storage_key": "outputs/job-015.wav",
+                },
+            )
+        ]
+
+    def test_job_row_follows_the_task(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        job_updates: list[tuple[str, str, dict]],
+        status_records: list[tuple[str, dict]],
+    ) -> None:
+        """PROCESSING while running, PENDING while a retry waits, then COMPLETED."""
+        from backend.workers import synthesis_worker
+
+        real_upload = synthesis_worker._upload_output
+        attempts: list[int] = []
+
+        def _flaky_upload(output, key):  # noqa: ANN001, ANN202
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError("storage unreachable")
+            return real_upload(output, key)
+
+        monkeypatch.setattr(synthesis_worker, "_upload_output", _flaky_upload)
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path=str(tmp_path / "emb.json"))
+
+        synthesis_worker.run_synthesis.apply(args=["job-017", "Flaky", ref.to_json()]).get()
+
+        assert [status for _, status, _ in job_updates] == [
+            "PROCESSING",
+            "PENDING",
+            "PROCESSING",
+            "COMPLETED",
+        ]
+        assert job_updates[-1][2]["output_storage_key"] == "outputs/job-017.wav"
+        assert ("job-017", {"progress": 1.0}) in status_records
+
+    def test_duplicate_delivery_is_dropped(
+        self, tmp_path: Path, running: set[str], s3: MagicMock
+    ) -> None:
+        """A redelivered job that a live worker is still running is skipped."""
+        from backend.workers.synthesis_worker import run_synthesis
+
+        running.add("job-018")
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path=str(tmp_path / "emb.json"))
+
+        result = run_synthesis.apply(args=["job-018", "Twice", ref.to_json()]).get()
+
+        assert result == {"job_id": "job-018", "status": "duplicate"}
+        s3.put_object.assert_not_called()
+
     def test_synthesis_rejects_engine_mismatch(self, tmp_path: Path) -> None:
         """Synthesis should fail when voice embedding engine doesn't
         match the requested engine."""
@@ -156,6 +645,286 @@ class TestSynthesisWorker:
             ).get()
 
 
+class TestJobRowGuard:
+    """``run_synthesis`` against the real ``_set_job_status``."""
+
+    @pytest.fixture
+    def job_updates(self) -> list:
+        """Overrides the module fixture: job rows go through a fake session."""
+        return []
+
+    @pytest.fixture
+    def row(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        from backend.workers import synthesis_worker
+
+        session = MagicMock()
+        session.execute = AsyncMock()
+        session.scalar = AsyncMock()
+        monkeypatch.setattr(
+            synthesis_worker, "run_in_session", lambda fn: asyncio.run(fn(session))
+        )
+        return session
+
+    def test_finished_job_is_not_run_again(
+        self, tmp_path: Path, row: MagicMock, s3: MagicMock
+    ) -> None:
+        """A redelivered task for a terminal row skips inference and upload."""
+        from backend.models import SynthesisJobStatus
+        from backend.workers import synthesis_worker
+
+        row.scalar.return_value = SynthesisJobStatus.COMPLETED
+        job_id = "00000000-0000-0000-0000-000000000019"
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path=str(tmp_path / "emb.json"))
+
+        with patch.object(synthesis_worker, "_render") as render:
+            result = synthesis_worker.run_synthesis.apply(
+                args=[job_id, "Again", ref.to_json()]
+            ).get()
+
+        assert result == {"job_id": job_id, "status": "skipped"}
+        render.assert_not_called()
+        row.execute.assert_not_called()
+        s3.put_object.assert_not_called()
+
+    @pytest.mark.parametrize("current", ["PROCESSING", "COMPLETED"])
+    def test_expired_redelivery_leaves_the_job_alone(
+        self,
+        tmp_path: Path,
+        row: MagicMock,
+        current: str,
+        result_cache: dict[str, str],
+        published: list[tuple[str, str, dict]],
+    ) -> None:
+        """A late copy of a running or finished job neither expires nor re-completes it."""
+        import time
+
+        from backend import coalescing
+        from backend.models import SynthesisJobStatus
+        from backend.workers import synthesis_worker
+
+        row.scalar.return_value = SynthesisJobStatus(current)
+        result_cache["awaaztwin:inflight:abc"] = "outputs/other.wav"
+        job_id = "00000000-0000-0000-0000-000000000020"
+        ref = VoiceEmbeddingRef(engine_name="XTTS_HI", embedding_path=str(tmp_path / "emb.json"))
+
+        with patch.object(coalescing, "release") as release:
+            for key in (None, "awaaztwin:inflight:abc"):
+                headers = {"deadline": time.time() - 1}
+                if key:
+                    headers["coalesce_key"] = key
+                result = synthesis_worker.run_synthesis.apply(
+                    args=[job_id, "Late", ref.to_json()], headers=headers
+                ).get()
+                assert result == {"job_id": job_id, "status": "skipped"}
+
+        row.execute.assert_not_called()
+        release.assert_not_called()
+        assert published == []
+
+
+# ---------------------------------------------------------------
+# maintenance_worker
+# ---------------------------------------------------------------
+
+
+class TestOutputGarbageCollection:
+    """Tests for spool sweeping and orphaned-object collection."""
+
+    @pytest.fixture(autouse=True)
+    def checkpoint(self, monkeypatch: pytest.MonkeyPatch) -> dict[str, str | None]:
+        """In-memory stand-in for the GC listing checkpoint in Redis."""
+        from backend.workers import maintenance_worker
+
+        state: dict[str, str | None] = {"after": None}
+        monkeypatch.setattr(maintenance_worker, "_gc_checkpoint", lambda: state["after"])
+        monkeypatch.setattr(
+            maintenance_worker, "_save_gc_checkpoint", lambda key: state.update(after=key)
+        )
+        return state
+
+    def test_sweep_removes_only_stale_files(self, tmp_path: Path) -> None:
+        spool = tmp_path / "spool"
+        spool.mkdir()
+        stale = spool / "synth_old.wav"
+        fresh = spool / "synth_new.wav"
+        stale.write_bytes(b"x")
+        fresh.write_bytes(b"x")
+        os.utime(stale, (0, 0))
+
+        from backend.workers.maintenance_worker import sweep_spool_dirs
+
+        assert sweep_spool_dirs(max_age_seconds=3600) == 1
+        assert not stale.exists()
+        assert fresh.exists()
+
+    def test_sweep_keeps_the_segments_of_a_running_job(self, tmp_path: Path) -> None:
+        from backend.workers import checkpoints
+        from backend.workers.maintenance_worker import sweep_spool_dirs
+
+        spool = tmp_path / "spool"
+        running = checkpoints.segment_dir(spool, "job-running")
+        abandoned = checkpoints.segment_dir(spool, "job-abandoned")
+        for part_dir in (running, abandoned):
+            part_dir.mkdir(parents=True)
+            (part_dir / "0000.wav").write_bytes(b"x")
+            os.utime(part_dir / "0000.wav", (0, 0))
+        (running / "0001.wav").write_bytes(b"x")
+        os.utime(abandoned, (0, 0))
+
+        assert sweep_spool_dirs(max_age_seconds=3600) == 1
+        assert (running / "0000.wav").exists()
+        assert not abandoned.exists()
+
+    def test_collect_deletes_unreferenced_objects(
+        self, s3: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from datetime import datetime, timezone
+
+        from backend.workers import maintenance_worker
+
+        old = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        paginator = MagicMock()
+        paginator.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": "outputs/a.wav", "Size": 1, "ETag": '"a"', "LastModified": old},
+                    {"Key": "outputs/b.wav", "Size": 1, "ETag": '"b"', "LastModified": old},
+                ]
+            }
+        ]
+        s3.get_paginator.return_value = paginator
+        s3.delete_objects.return_value = {"Deleted": [{"Key": "outputs/b.wav"}]}
+        monkeypatch.setattr(
+            maintenance_worker,
+            "_unreferenced",
+            lambda keys: [k for k in keys if k != "outputs/a.wav"],
+        )
+
+        result = maintenance_worker.collect_orphaned_outputs.apply().get()
+
+        assert result["objects_scanned"] == 2
+        assert result["objects_deleted"] == 1
+        deleted = s3.delete_objects.call_args.kwargs["Delete"]["Objects"]
+        assert deleted == [{"Key": "outputs/b.wav"}]
+
+    def test_collect_resumes_after_the_checkpoint(
+        self,
+        s3: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        checkpoint: dict[str, str | None],
+    ) -> None:
+        from datetime import datetime, timezone
+
+        from backend.config import get_config
+        from backend.workers import maintenance_worker
+
+        old = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        paginator = MagicMock()
+        paginator.paginate.return_value = [
+            {
+                "Contents": [
+                    {"Key": f"outputs/{name}.wav", "Size": 1, "ETag": '"x"', "LastModified": old}
+                    for name in ("c", "d", "e")
+                ]
+            }
+        ]
+        s3.get_paginator.return_value = paginator
+        monkeypatch.setattr(maintenance_worker, "_unreferenced", lambda keys: [])
+        monkeypatch.setattr(get_config().lifecycle, "gc_max_objects_per_run", 2)
+        checkpoint["after"] = "outputs/b.wav"
+
+        result = maintenance_worker.collect_orphaned_outputs.apply().get()
+
+        assert paginator.paginate.call_args.kwargs["StartAfter"] == "outputs/b.wav"
+        assert result["objects_scanned"] == 2
+        assert checkpoint["after"] == "outputs/d.wav"
+
+        # A run that reaches the end of the listing starts the next one over.
+        monkeypatch.setattr(get_config().lifecycle, "gc_max_objects_per_run", 10)
+        maintenance_worker.collect_orphaned_outputs.apply().get()
+        assert checkpoint["after"] is None
+
+
+class TestStuckJobReaper:
+    """Tests for ``reap_stuck_jobs``."""
+
+    @pytest.fixture
+    def reaper(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Stub heartbeats, the job table and the broker; record what happens."""
+        from backend import counters, metrics
+        from backend.workers import heartbeats, maintenance_worker
+
+        state = MagicMock()
+        state.stale = {"job-a": "host:1"}
+        state.live = {"job-live"}
+        state.silent = ["job-b", "job-live"]
+        state.requeues = {}
+        state.processing = {"job-a", "job-b"}
+        monkeypatch.setattr(heartbeats, "stale_jobs", lambda timeout: state.stale)
+        monkeypatch.setattr(heartbeats, "live_jobs", lambda timeout: state.live)
+        monkeypatch.setattr(heartbeats, "requeues", lambda job_id: state.requeues.get(job_id, 0))
+        monkeypatch.setattr(heartbeats, "count_requeue", state.count_requeue)
+        monkeypatch.setattr(heartbeats, "forget", state.forget)
+        monkeypatch.setattr(
+            maintenance_worker, "_silent_processing_jobs", lambda cutoff: state.silent
+        )
+
+        def _reclaim(job_id: str, *, requeue: bool) -> dict | None:
+            if job_id not in state.processing:
+                return None
+            if not requeue:
+                return {"coalesce_key": None}
+            return {
+                "job_id": job_id,
+                "text": "t",
+                "voice_embedding_json": "{}",
+                "engine_name": "XTTS_HI",
+                "params": None,
+                "coalesce_key": None,
+            }
+
+        monkeypatch.setattr(maintenance_worker, "_reclaim", _reclaim)
+        monkeypatch.setattr(maintenance_worker, "enqueue_synthesis", state.enqueue)
+        monkeypatch.setattr(metrics, "record_reclaimed", state.record_reclaimed)
+        monkeypatch.setattr(counters, "transition", state.transition)
+        return state
+
+    def test_requeues_jobs_of_dead_workers(
+        self, reaper: MagicMock, published: list[tuple[str, str, dict]]
+    ) -> None:
+        from backend.workers.maintenance_worker import reap_stuck_jobs
+
+        result = reap_stuck_jobs.apply().get()
+
+        assert result == {"requeued": 2, "failed": 0}
+        requeued = [c.kwargs["job_id"] for c in reaper.enqueue.call_args_list]
+        assert requeued == ["job-a", "job-b"]  # never the live one
+        assert [(job, stage) for job, stage, _ in published] == [
+            ("job-a", "queued"),
+            ("job-b", "queued"),
+        ]
+
+    def test_fails_jobs_past_max_requeues(
+        self, reaper: MagicMock, published: list[tuple[str, str, dict]]
+    ) -> None:
+        from backend.config import get_config
+        from backend.models import SynthesisJob, SynthesisJobStatus
+        from backend.workers.maintenance_worker import reap_stuck_jobs
+
+        reaper.requeues["job-a"] = get_config().reaper.max_requeues
+        reaper.processing.discard("job-b")  # finished in the meantime
+
+        result = reap_stuck_jobs.apply().get()
+
+        assert result == {"requeued": 0, "failed": 1}
+        reaper.enqueue.assert_not_called()
+        assert published[0][:2] == ("job-a", "failed")
+        reaper.record_reclaimed.assert_called_once_with("failed")
+        reaper.transition.assert_called_once_with(
+            SynthesisJob, SynthesisJobStatus.PROCESSING, SynthesisJobStatus.FAILED
+        )
+
+
 # ---------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------
@@ -171,3 +940,93 @@ def _write_test_wav(path: Path) -> None:
         wf.setsampwidth(2)
         wf.setframerate(sample_rate)
         wf.writeframes(data)
+
+
+class TestCounterReconciliation:
+    def test_resets_counters_from_a_recount(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from backend import counters
+        from backend.workers import maintenance_worker
+
+        resets: dict[str, dict[str, int]] = {}
+        monkeypatch.setattr(
+            maintenance_worker,
+            "_count_by_status",
+            lambda model: {"READY": 2} if model.__tablename__ == "voice_profiles" else {},
+        )
+        monkeypatch.setattr(
+            counters,
+            "reset",
+            lambda model, counts: resets.setdefault(model.__tablename__, counts),
+        )
+
+        result = maintenance_worker.reconcile_counters.apply().get()
+
+        assert resets == {"synthesis_jobs": {}, "voice_profiles": {"READY": 2}}
+        assert result == {"synthesis_jobs": {}, "voice_profiles": {"READY": 2}}
+
+
+class TestJobPartitions:
+    @pytest.fixture
+    def db(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Partition helpers and the archive export, with no database behind them."""
+        from backend import counters, partitions
+        from backend.workers import maintenance_worker
+
+        state = MagicMock()
+        state.expired = {}
+
+        class _Session:
+            async def run_sync(self, fn):  # noqa: ANN001, ANN202
+                return fn(SimpleNamespace(connection=lambda: None))
+
+        monkeypatch.setattr(
+            maintenance_worker, "run_in_session", lambda fn: asyncio.run(fn(_Session()))
+        )
+        monkeypatch.setattr(
+            partitions, "ensure_partitions", lambda conn, table, first, last: ["p_next"]
+        )
+        monkeypatch.setattr(
+            partitions, "expired_partitions", lambda conn, table, now, months: state.expired
+        )
+        monkeypatch.setattr(
+            partitions, "drop_partition", lambda conn, table, name: state.dropped(name)
+        )
+
+        def _archive(name: str, target: Path) -> dict[str, int]:
+            target.write_bytes(b"archive")
+            if state.export_fails:
+                raise OSError("disk full")
+            return {"COMPLETED": 3, "FAILED": 1}
+
+        state.export_fails = False
+        monkeypatch.setattr(maintenance_worker, "_archive_partition", _archive)
+        monkeypatch.setattr(counters, "discard", state.discard)
+        return state
+
+    def test_archives_then_drops_expired_partitions(self, db: MagicMock, s3: MagicMock) -> None:
+        from backend.workers import maintenance_worker
+
+        db.expired = {date(2025, 1, 1): "synthesis_jobs_y2025m01"}
+
+        result = maintenance_worker.manage_job_partitions.apply().get()
+
+        assert result == {
+            "created": ["p_next"],
+            "archived": ["synthesis_jobs_y2025m01"],
+            "rows": 4,
+        }
+        key = s3.upload_file.call_args.args[2]
+        assert key == "archive/synthesis_jobs/synthesis_jobs_y2025m01.jsonl.gz"
+        db.dropped.assert_called_once_with("synthesis_jobs_y2025m01")
+        db.discard.assert_called_once()
+        assert db.discard.call_args.args[1] == {"COMPLETED": 3, "FAILED": 1}
+
+    def test_partition_is_kept_when_the_archive_fails(self, db: MagicMock) -> None:
+        from backend.workers import maintenance_worker
+
+        db.expired = {date(2025, 1, 1): "synthesis_jobs_y2025m01"}
+        db.export_fails = True
+
+        with pytest.raises(OSError):
+            maintenance_worker.manage_job_partitions.apply().get()
+        db.dropped.assert_not_called()
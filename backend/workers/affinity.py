@@ -0,0 +1,254 @@
+"""
+Voice-affinity routing for synthesis jobs.
+
+Each synthesis worker consumes a *personal* queue per latency lane in
+addition to the shared lane queue, e.g. ``synthesis.interactive.<node>``
+ahead of ``synthesis.interactive``.  Workers announce themselves in a
+Redis sorted set per lane (member = node name, score = last heartbeat).
+
+At submission time the API hashes ``voice_profile_id`` onto the live
+members of the job's lane with a consistent-hash ring.  The job goes to
+that worker's personal queue, so the worker's embedding and disk caches
+stay hot for the voices it owns.  When the fleet grows or shrinks, only
+about ``1/N`` of the voices move.  If the target's personal queue is
+already ``max_personal_queue_depth`` deep, the job falls back to the
+shared queue and any worker can take it.
+
+Jobs stranded in the personal queue of a worker that died are moved
+back to the shared lane by ``rehome_orphaned_queues`` (run periodically
+by the maintenance worker).
+"""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import functools
+import hashlib
+import logging
+import threading
+import time
+import uuid
+
+from celery.signals import worker_ready, worker_shutdown
+from redis.exceptions import RedisError
+
+from backend.config import get_config
+from backend.redis_client import KEY_PREFIX, get_async_redis, get_redis
+from backend.workers.routing import SYNTHESIS_QUEUES, Route, priority_queue_keys
+
+logger = logging.getLogger(__name__)
+
+_MEMBERS_KEY = KEY_PREFIX + "affinity:members:{lane}"
+# Every personal queue ever created, so orphans can be found after a crash.
+PERSONAL_QUEUES_KEY = KEY_PREFIX + "affinity:queues"
+
+
+def personal_queue(lane: str, node: str) -> str:
+    """Name of *node*'s personal queue for *lane*."""
+    return f"{lane}.{node}"
+
+
+def _lane_of(queue: str) -> str | None:
+    for lane in SYNTHESIS_QUEUES:
+        if queue.startswith(lane + "."):
+            return lane
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Consistent hashing
+# ---------------------------------------------------------------------------
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent-hash ring with *replicas* virtual points per node."""
+
+    def __init__(self, nodes: tuple[str, ...], replicas: int) -> None:
+        points = sorted((_hash(f"{node}#{i}"), node) for node in nodes for i in range(replicas))
+        self._keys = [p for p, _ in points]
+        self._nodes = [n for _, n in points]
+
+    def node_for(self, key: str) -> str | None:
+        """Return the node owning *key*, or ``None`` for an empty ring."""
+        if not self._keys:
+            return None
+        idx = bisect.bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._nodes[idx]
+
+
+@functools.lru_cache(maxsize=16)
+def _ring(nodes: tuple[str, ...], replicas: int) -> HashRing:
+    return HashRing(nodes, replicas)
+
+
+# ---------------------------------------------------------------------------
+# Submission side (API, asyncio)
+# ---------------------------------------------------------------------------
+
+# lane -> (monotonic expiry, live members); avoids a Redis read per request.
+_members_cache: dict[str, tuple[float, tuple[str, ...]]] = {}
+
+
+async def _live_members(lane: str) -> tuple[str, ...]:
+    cfg = get_config().affinity
+    now = time.monotonic()
+    cached = _members_cache.get(lane)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    members = await get_async_redis().zrangebyscore(
+        _MEMBERS_KEY.format(lane=lane), time.time() - cfg.member_ttl_seconds, "+inf"
+    )
+    result = tuple(sorted(members))
+    _members_cache[lane] = (now + cfg.membership_cache_seconds, result)
+    return result
+
+
+async def assign(route: Route, voice_profile_id: uuid.UUID | str) -> Route:
+    """Redirect *route* to the personal queue of the worker owning the voice.
+
+    Returns *route* unchanged when affinity is disabled, no worker is
+    live in the lane, or the owner's personal queue is overloaded.
+    """
+    cfg = get_config().affinity
+    if not cfg.enabled:
+        return route
+    members = await _live_members(route.lane)
+    node = _ring(members, cfg.virtual_nodes).node_for(str(voice_profile_id))
+    if node is None:
+        return route
+
+    queue = personal_queue(route.lane, node)
+    pipe = get_async_redis().pipeline(transaction=False)
+    for key in priority_queue_keys(queue):
+        pipe.llen(key)
+    if sum(await pipe.execute()) >= cfg.max_personal_queue_depth:
+        return route
+    return dataclasses.replace(route, queue=queue)
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def register(node: str, lanes: list[str]) -> None:
+    """Announce (or refresh) *node* as a live member of *lanes*."""
+    now = time.time()
+    pipe = get_redis().pipeline(transaction=False)
+    for lane in lanes:
+        pipe.zadd(_MEMBERS_KEY.format(lane=lane), {node: now})
+        pipe.sadd(PERSONAL_QUEUES_KEY, personal_queue(lane, node))
+    pipe.execute()
+
+
+def unregister(node: str, lanes: list[str]) -> None:
+    """Withdraw *node* so that no new jobs are routed to it."""
+    pipe = get_redis().pipeline(transaction=False)
+    for lane in lanes:
+        pipe.zrem(_MEMBERS_KEY.format(lane=lane), node)
+    pipe.execute()
+
+
+def personal_queues() -> set[str]:
+    """Every known personal queue (live or orphaned)."""
+    return get_redis().smembers(PERSONAL_QUEUES_KEY)
+
+
+def rehome_orphaned_queues() -> int:
+    """Move jobs out of personal queues whose worker is no longer live.
+
+    Each priority list is moved onto the shared lane's list for the same
+    priority, so a job keeps its place in shortest-job-first order.
+
+    Returns:
+        The number of messages moved.
+    """
+    cfg = get_config().affinity
+    redis = get_redis()
+    cutoff = time.time() - cfg.member_ttl_seconds
+    moved = 0
+    for queue in redis.smembers(PERSONAL_QUEUES_KEY):
+        lane = _lane_of(queue)
+        if lane is None:
+            continue
+        node = queue[len(lane) + 1 :]
+        score = redis.zscore(_MEMBERS_KEY.format(lane=lane), node)
+        if score is not None and score >= cutoff:
+            continue
+        for src, dst in zip(priority_queue_keys(queue), priority_queue_keys(lane)):
+            while redis.rpoplpush(src, dst) is not None:
+                moved += 1
+        redis.zrem(_MEMBERS_KEY.format(lane=lane), node)
+        redis.srem(PERSONAL_QUEUES_KEY, queue)
+    if moved:
+        logger.info("[affinity] Re-homed %d job(s) from dead workers' queues", moved)
+    return moved
+
+
+class _Membership:
+    """Keeps this worker's membership fresh from a daemon thread."""
+
+    def __init__(self, node: str, lanes: list[str]) -> None:
+        self.node = node
+        self.lanes = lanes
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="affinity-heartbeat", daemon=True)
+
+    def start(self) -> None:
+        self._beat()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        try:
+            unregister(self.node, self.lanes)
+        except RedisError:
+            logger.warning("[affinity] Could not unregister %s", self.node, exc_info=True)
+
+    def _run(self) -> None:
+        interval = get_config().affinity.heartbeat_interval_seconds
+        while not self._stop.wait(interval):
+            self._beat()
+
+    def _beat(self) -> None:
+        try:
+            register(self.node, self.lanes)
+        except RedisError:
+            logger.warning("[affinity] Heartbeat failed for %s", self.node, exc_info=True)
+
+
+_membership: _Membership | None = None
+
+
+@worker_ready.connect
+def _join(sender, **_kwargs) -> None:  # noqa: ANN001 – Celery signal
+    """Start consuming personal queues and join the affinity ring.
+
+    Queues are consumed in ``-Q`` order (the ``priority`` strategy), so
+    each lane is re-subscribed as *personal, shared* – a worker serves
+    the voices it owns before picking up anyone's.
+    """
+    global _membership
+    consumer = sender
+    if not get_config().affinity.enabled:
+        return
+    lanes = [q.name for q in consumer.task_consumer.queues if q.name in SYNTHESIS_QUEUES]
+    if not lanes:
+        return
+    for lane in lanes:
+        consumer.cancel_task_queue(lane)
+    for lane in lanes:
+        consumer.add_task_queue(personal_queue(lane, consumer.hostname))
+        consumer.add_task_queue(lane)
+    _membership = _Membership(consumer.hostname, lanes)
+    _membership.start()
+    logger.info("[affinity] %s joined lanes %s", consumer.hostname, ", ".join(lanes))
+
+
+@worker_shutdown.connect
+def _leave(**_kwargs) -> None:
+    if _membership is not None:
+        _membership.stop()
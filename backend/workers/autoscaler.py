@@ -0,0 +1,415 @@
+"""
+Backlog-driven autoscaler for local worker pools.
+
+A supervisor process that keeps one pool of Celery worker processes per
+workload on this host and resizes each pool from its queue backlog:
+
+* ``synthesis`` – consumes the interactive and bulk lanes (and, through
+  affinity routing, the workers' personal queues);
+* ``voice_prep`` – consumes ``voice_prep``.
+
+Every ``interval_seconds`` the supervisor reads, in one pipelined Redis
+round trip, each pool's queue depth and the age of its oldest message.
+It then plans a size:
+
+* enough workers for ``target_backlog_per_worker`` queued jobs each;
+* one more than now while the oldest message keeps getting older faster
+  than ``age_slope_threshold`` seconds per second (the pool is falling
+  behind even if the backlog looks small);
+* scale-down one worker at a time, and only after
+  ``scale_down_stable_intervals`` consecutive plans asked for fewer;
+* always within the pool's min/max bounds, and never growing past
+  ``memory_ceiling_mb`` of total worker RSS.
+
+Retired workers get ``SIGTERM`` (Celery's warm shutdown: finish the
+running task, take no new ones) and are killed only after
+``drain_timeout_seconds``.  Each decision is logged and written to Redis
+for ``GET /admin/autoscaler``.  Planning is kept separate from process
+management (``Planner``), so the same logic can later size container
+replicas instead of local processes.
+
+Run::
+
+    python -m backend.workers.autoscaler            # manage processes
+    python -m backend.workers.autoscaler --dry-run  # only report decisions
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import os
+import signal
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from redis import Redis
+from redis.exceptions import RedisError
+
+from backend.config import AutoscalerConfig, get_config
+from backend.redis_client import KEY_PREFIX, get_async_redis, get_redis
+from backend.schemas import AutoscalerDecision
+from backend.workers import affinity
+from backend.workers.routing import BULK_QUEUE, INTERACTIVE_QUEUE, priority_queue_keys
+
+logger = logging.getLogger(__name__)
+
+_DECISIONS_KEY = KEY_PREFIX + "autoscaler:decisions"
+
+VOICE_PREP_QUEUE = "voice_prep"
+
+
+@dataclass(frozen=True)
+class PoolSpec:
+    """A pool of identical worker processes."""
+
+    name: str
+    queues: tuple[str, ...]  # consumed in this order (``-Q``)
+    min_workers: int
+    max_workers: int
+    include_personal_queues: bool = False
+
+
+def default_pools(cfg: AutoscalerConfig) -> list[PoolSpec]:
+    return [
+        PoolSpec(
+            name="synthesis",
+            queues=(INTERACTIVE_QUEUE, BULK_QUEUE),
+            min_workers=cfg.synthesis_min_workers,
+            max_workers=cfg.synthesis_max_workers,
+            include_personal_queues=True,
+        ),
+        PoolSpec(
+            name="voice_prep",
+            queues=(VOICE_PREP_QUEUE,),
+            min_workers=cfg.voice_prep_min_workers,
+            max_workers=cfg.voice_prep_max_workers,
+        ),
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Observation
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Observation:
+    depth: int
+    oldest_age_seconds: float
+    at: float
+
+
+class QueueObserver:
+    """Reads depth and oldest-message age for every pool at once.
+
+    The oldest message of a Redis-transport list is at its tail.  Its
+    age comes from the ``enqueued_at`` header set by
+    ``routing.enqueue_synthesis``; for messages without one (e.g. voice
+    prep), the age is measured from when the observer first saw that
+    message at the head of the queue.
+    """
+
+    def __init__(self, redis: Redis) -> None:
+        self._redis = redis
+        self._first_seen: dict[str, float] = {}
+
+    def observe(self, pools: list[PoolSpec]) -> dict[str, Observation]:
+        personal: set[str] = set()
+        if any(p.include_personal_queues for p in pools):
+            personal = affinity.personal_queues()
+
+        layout: list[tuple[str, list[str]]] = []
+        for pool in pools:
+            queues = list(pool.queues)
+            if pool.include_personal_queues:
+                queues += sorted(q for q in personal if q.startswith(pool.queues))
+            keys = [k for q in queues for k in priority_queue_keys(q)]
+            layout.append((pool.name, keys))
+
+        pipe = self._redis.pipeline(transaction=False)
+        for _, keys in layout:
+            for key in keys:
+                pipe.llen(key)
+                pipe.lindex(key, -1)
+        results = iter(pipe.execute())
+
+        now = time.time()
+        seen: set[str] = set()
+        observations: dict[str, Observation] = {}
+        for name, keys in layout:
+            depth = 0
+            oldest = now
+            for _ in keys:
+                depth += next(results)
+                raw = next(results)
+                if raw is not None:
+                    oldest = min(oldest, self._enqueued_at(raw, now, seen))
+            observations[name] = Observation(depth=depth, oldest_age_seconds=now - oldest, at=now)
+        # Forget messages that have left the head of their queue.
+        self._first_seen = {k: v for k, v in self._first_seen.items() if k in seen}
+        return observations
+
+    def _enqueued_at(self, raw: str, now: float, seen: set[str]) -> float:
+        try:
+            headers = json.loads(raw).get("headers") or {}
+        except (ValueError, AttributeError):
+            return now
+        if headers.get("enqueued_at") is not None:
+            return float(headers["enqueued_at"])
+        task_id = headers.get("id")
+        if task_id is None:
+            return now
+        seen.add(task_id)
+        return self._first_seen.setdefault(task_id, now)
+
+
+# ---------------------------------------------------------------------------
+# Planning
+# ---------------------------------------------------------------------------
+
+class Planner:
+    """Turns successive observations of one pool into size decisions."""
+
+    def __init__(self, spec: PoolSpec, cfg: AutoscalerConfig) -> None:
+        self.spec = spec
+        self.cfg = cfg
+        self._previous: Observation | None = None
+        self._shrink_streak = 0
+
+    def plan(self, obs: Observation, current: int, can_grow: bool = True) -> AutoscalerDecision:
+        cfg, spec = self.cfg, self.spec
+        slope = 0.0
+        if self._previous is not None and obs.at > self._previous.at:
+            slope = (obs.oldest_age_seconds - self._previous.oldest_age_seconds) / (
+                obs.at - self._previous.at
+            )
+        self._previous = obs
+
+        desired = math.ceil(obs.depth / max(1, cfg.target_backlog_per_worker))
+        reason = "backlog"
+        if obs.depth > 0 and slope > cfg.age_slope_threshold and desired <= current:
+            desired, reason = current + 1, "oldest message aging"
+
+        desired = max(spec.min_workers, min(spec.max_workers, desired))
+        if desired < current:
+            self._shrink_streak += 1
+            if self._shrink_streak < cfg.scale_down_stable_intervals:
+                desired, reason = current, "scale-down cooldown"
+            else:
+                desired, reason = current - 1, "backlog drained"
+                self._shrink_streak = 0
+        else:
+            self._shrink_streak = 0
+
+        if desired > current and not can_grow:
+            desired, reason = current, "memory ceiling"
+        if desired == current and reason == "backlog":
+            reason = "steady"
+
+        return AutoscalerDecision(
+            pool=spec.name,
+            current_workers=current,
+            desired_workers=desired,
+            queue_depth=obs.depth,
+            oldest_age_seconds=round(obs.oldest_age_seconds, 3),
+            age_slope=round(slope, 3),
+            reason=reason,
+            decided_at=obs.at,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Process management
+# ---------------------------------------------------------------------------
+
+def _rss_bytes(pid: int) -> int:
+    """Resident memory of *pid* and its descendants (Linux ``/proc``)."""
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            status = Path(f"/proc/{current}/status").read_text()
+            children = Path(f"/proc/{current}/task/{current}/children").read_text()
+        except OSError:
+            continue
+        for line in status.splitlines():
+            if line.startswith("VmRSS:"):
+                total += int(line.split()[1]) * 1024
+                break
+        stack.extend(int(c) for c in children.split())
+    return total
+
+
+@dataclass
+class WorkerPool:
+    """The worker processes of one pool on this host."""
+
+    spec: PoolSpec
+    drain_timeout_seconds: float
+    active: list[subprocess.Popen] = field(default_factory=list)
+    draining: list[tuple[subprocess.Popen, float]] = field(default_factory=list)
+    _next_index: int = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.active)
+
+    def command(self, index: int) -> list[str]:
+        return [
+            sys.executable, "-m", "celery",
+            "-A", "backend.workers.celery_app",
+            "worker",
+            "-Q", ",".join(self.spec.queues),
+            "-n", f"{self.spec.name}{index}@%h",
+            "-l", "info",
+        ]  # fmt: skip
+
+    def scale_to(self, desired: int) -> None:
+        while self.size < desired:
+            proc = subprocess.Popen(self.command(self._next_index))
+            self._next_index += 1
+            self.active.append(proc)
+            logger.info("[autoscaler] %s: started worker pid=%d", self.spec.name, proc.pid)
+        while self.size > desired:
+            proc = self.active.pop()
+            proc.send_signal(signal.SIGTERM)
+            self.draining.append((proc, time.monotonic() + self.drain_timeout_seconds))
+            logger.info("[autoscaler] %s: draining worker pid=%d", self.spec.name, proc.pid)
+
+    def reap(self) -> None:
+        """Forget exited workers and kill drains that overran their timeout."""
+        for proc in [p for p in self.active if p.poll() is not None]:
+            logger.warning(
+                "[autoscaler] %s: worker pid=%d exited (%s)", self.spec.name, proc.pid, proc.returncode
+            )
+            self.active.remove(proc)
+        still_draining = []
+        for proc, deadline in self.draining:
+            if proc.poll() is not None:
+                continue
+            if time.monotonic() >= deadline:
+                logger.warning("[autoscaler] %s: killing stuck worker pid=%d", self.spec.name, proc.pid)
+                proc.kill()
+                continue
+            still_draining.append((proc, deadline))
+        self.draining = still_draining
+
+    def rss_bytes(self) -> int:
+        return sum(_rss_bytes(p.pid) for p in self.active) + sum(
+            _rss_bytes(p.pid) for p, _ in self.draining
+        )
+
+    def shutdown(self) -> None:
+        self.scale_to(0)
+        for proc, _ in self.draining:
+            try:
+                proc.wait(timeout=self.drain_timeout_seconds)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        self.draining.clear()
+
+
+# ---------------------------------------------------------------------------
+# Supervisor
+# ---------------------------------------------------------------------------
+
+def publish_decisions(decisions: list[AutoscalerDecision]) -> None:
+    try:
+        get_redis().hset(
+            _DECISIONS_KEY, mapping={d.pool: d.model_dump_json() for d in decisions}
+        )
+    except RedisError:
+        logger.warning("[autoscaler] Could not publish decisions", exc_info=True)
+
+
+async def read_decisions() -> list[AutoscalerDecision]:
+    """Latest decision per pool, as published by the supervisor."""
+    raw = await get_async_redis().hgetall(_DECISIONS_KEY)
+    return [AutoscalerDecision.model_validate_json(raw[k]) for k in sorted(raw)]
+
+
+class Autoscaler:
+    def __init__(self, cfg: AutoscalerConfig, *, dry_run: bool = False) -> None:
+        self.cfg = cfg
+        self.dry_run = dry_run
+        self.pools = {
+            spec.name: WorkerPool(spec, cfg.drain_timeout_seconds) for spec in default_pools(cfg)
+        }
+        self.planners = {name: Planner(pool.spec, cfg) for name, pool in self.pools.items()}
+        self.observer = QueueObserver(get_redis())
+        self._assumed: dict[str, int] = {}
+        self._running = True
+
+    def _can_grow(self) -> bool:
+        used = sum(pool.rss_bytes() for pool in self.pools.values())
+        workers = sum(pool.size for pool in self.pools.values())
+        per_worker = used / workers if workers else 0
+        return used + per_worker <= self.cfg.memory_ceiling_mb * 1024 * 1024
+
+    def tick(self) -> list[AutoscalerDecision]:
+        for pool in self.pools.values():
+            pool.reap()
+        observations = self.observer.observe([p.spec for p in self.pools.values()])
+        can_grow = self._can_grow()
+        decisions = []
+        for name, pool in self.pools.items():
+            # A dry run owns no processes; assume its previous plan was applied.
+            current = self._assumed.get(name, pool.spec.min_workers) if self.dry_run else pool.size
+            decision = self.planners[name].plan(observations[name], current, can_grow)
+            self._assumed[name] = decision.desired_workers
+            if decision.desired_workers != decision.current_workers:
+                logger.info(
+                    "[autoscaler] %s: %d -> %d (%s; depth=%d, oldest=%.1fs, slope=%.2f)",
+                    name,
+                    decision.current_workers,
+                    decision.desired_workers,
+                    decision.reason,
+                    decision.queue_depth,
+                    decision.oldest_age_seconds,
+                    decision.age_slope,
+                )
+            if not self.dry_run:
+                pool.scale_to(decision.desired_workers)
+            decisions.append(decision)
+        publish_decisions(decisions)
+        return decisions
+
+    def stop(self, *_args: object) -> None:
+        self._running = False
+
+    def run_forever(self) -> None:
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        try:
+            while self._running:
+                try:
+                    self.tick()
+                except RedisError:
+                    logger.warning("[autoscaler] Redis unavailable; keeping pool sizes", exc_info=True)
+                deadline = time.monotonic() + self.cfg.interval_seconds
+                while self._running and time.monotonic() < deadline:
+                    time.sleep(0.5)
+        finally:
+            logger.info("[autoscaler] Shutting down; draining all workers")
+            for pool in self.pools.values():
+                pool.shutdown()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--dry-run", action="store_true", help="report decisions without managing processes"
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=os.environ.get("AWAAZTWIN_LOG_LEVEL", "INFO"))
+    Autoscaler(get_config().autoscaler, dry_run=args.dry_run).run_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -17,12 +17,21 @@ import os
 
 from celery import Celery
 
+from backend.config import get_config
+
 REDIS_URL = os.environ.get("AWAAZTWIN_REDIS_URL", "redis://localhost:6379/0")
 
 app = Celery(
     "awaaztwin",
     broker=REDIS_URL,
     backend=REDIS_URL,
+    include=[
+        "backend.workers.voice_prep_worker",
+        "backend.workers.synthesis_worker",
+        "backend.workers.maintenance_worker",
+        # Not tasks: counts finished/failed tasks for GET /admin/queues.
+        "backend.workers.queue_stats",
+    ],
 )
 
 app.conf.update(
@@ -31,10 +40,46 @@ app.conf.update(
         "backend.workers.voice_prep_worker.prepare_voice_profile": {
             "queue": "voice_prep",
         },
+        # Submitters pick the lane explicitly (``routing.enqueue_synthesis``);
+        # anything sent without one is treated as bulk work.
         "backend.workers.synthesis_worker.run_synthesis": {
-            "queue": "synthesis",
+            "queue": "synthesis.bulk",
+        },
+        "backend.workers.maintenance_worker.*": {
+            "queue": "maintenance",
+        },
+    },
+    # Periodic housekeeping (requires a ``celery beat`` process)
+    beat_schedule={
+        "collect-orphaned-outputs": {
+            "task": "backend.workers.maintenance_worker.collect_orphaned_outputs",
+            "schedule": get_config().lifecycle.gc_interval_minutes * 60.0,
+        },
+        "rehome-affinity-queues": {
+            "task": "backend.workers.maintenance_worker.rehome_affinity_queues",
+            "schedule": float(get_config().affinity.rehome_interval_seconds),
         },
+        "reap-stuck-jobs": {
+            "task": "backend.workers.maintenance_worker.reap_stuck_jobs",
+            "schedule": get_config().reaper.interval_seconds,
+        },
+        "reconcile-counters": {
+            "task": "backend.workers.maintenance_worker.reconcile_counters",
+            "schedule": get_config().counters.reconcile_interval_seconds,
+        },
+        "manage-job-partitions": {
+            "task": "backend.workers.maintenance_worker.manage_job_partitions",
+            "schedule": get_config().job_retention.interval_seconds,
+        },
+    },
+    # Shortest-job-first within a lane: 10 priority levels (0 = served
+    # first), and workers consuming several queues drain them in the
+    # order given to ``-Q`` so that interactive always goes first.
+    broker_transport_options={
+        "priority_steps": list(range(10)),
+        "queue_order_strategy": "priority",
     },
+    task_default_priority=5,
     # Serialisation
     task_serializer="json",
     result_serializer="json",
@@ -44,7 +89,7 @@ app.conf.update(
     enable_utc=True,
     # Worker
     worker_prefetch_multiplier=1,
-    worker_concurrency=2,
+    worker_concurrency=get_config().limits.max_concurrent_jobs,
     # Retry defaults
     task_acks_late=True,
     task_reject_on_worker_lost=True,
@@ -0,0 +1,150 @@
+"""
+Segment-level checkpoints for long synthesis jobs.
+
+Long texts are split into sentence-aligned segments that are synthesised
+one at a time.  Each finished segment is uploaded to
+``outputs/<job_id>/segments/<n>.wav`` and recorded in the Redis hash
+``awaaztwin:jobs:<job_id>:segments``.  When a job runs again – a Celery
+retry, or a redelivery after the worker died (``task_acks_late``) – the
+segments already recorded are downloaded rather than synthesised again.
+
+The hash also stores a fingerprint of the segmentation.  A checkpoint
+written under a different ``segment_max_chars`` (or for different text)
+is discarded instead of being stitched into the wrong audio.
+
+Segment objects are deleted once the job's final output is uploaded.
+Segments of jobs that never finish are not referenced by any
+``SynthesisJob``, so the output GC (``collect_orphaned_outputs``)
+removes them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import wave
+from pathlib import Path
+
+from botocore.exceptions import BotoCoreError, ClientError
+from redis.exceptions import RedisError
+
+from backend import storage
+from backend.config import get_config
+from backend.redis_client import KEY_PREFIX, get_redis
+
+logger = logging.getLogger(__name__)
+
+_CHECKPOINT_KEY = KEY_PREFIX + "jobs:{job_id}:segments"
+_PLAN_FIELD = "plan"
+
+# Sentence ends in Latin and Devanagari scripts (danda, double danda).
+_SENTENCE_END = re.compile(r"(?<=[.!?\u0964\u0965])\s+")
+
+
+def split_text(text: str, max_chars: int) -> list[str]:
+    """Split *text* into segments of at most *max_chars* characters.
+
+    Whole sentences are packed together greedily.  Sentences longer than
+    *max_chars* are broken at whitespace (or, failing that, hard).
+    """
+    pieces: list[str] = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars + 1)
+            if cut <= 0:
+                cut = max_chars
+            pieces.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            pieces.append(sentence)
+
+    segments: list[str] = []
+    for piece in pieces:
+        if segments and len(segments[-1]) + 1 + len(piece) <= max_chars:
+            segments[-1] = f"{segments[-1]} {piece}"
+        else:
+            segments.append(piece)
+    return segments or [text]
+
+
+def segment_storage_key(job_id: str, index: int) -> str:
+    return f"outputs/{job_id}/segments/{index:04d}.wav"
+
+
+# Suffix of the per-job spool directory holding rendered segments.  The
+# spool sweep only removes such a directory once nothing has been written
+# to it for the whole retention window.
+SEGMENT_DIR_SUFFIX = ".segments"
+
+
+def segment_dir(spool: Path, job_id: str) -> Path:
+    return spool / f"{job_id}{SEGMENT_DIR_SUFFIX}"
+
+
+class Checkpoint:
+    """Completed segments of one job, persisted in Redis.
+
+    Redis errors are logged and swallowed: losing a checkpoint only costs
+    recomputation, never the job.
+    """
+
+    def __init__(self, job_id: str, segments: list[str]) -> None:
+        self.job_id = job_id
+        self.key = _CHECKPOINT_KEY.format(job_id=job_id)
+        self.segment_count = len(segments)
+        self.plan = hashlib.sha256("\x1f".join(segments).encode()).hexdigest()[:16]
+
+    def load(self) -> dict[int, str]:
+        """Return ``{segment index: storage key}`` of finished segments."""
+        try:
+            raw = get_redis().hgetall(self.key)
+        except RedisError:
+            logger.warning("[checkpoint] Could not read checkpoint of job %s", self.job_id, exc_info=True)
+            return {}
+        if not raw:
+            return {}
+        if raw.pop(_PLAN_FIELD, None) != self.plan:
+            logger.info("[checkpoint] Discarding stale checkpoint of job %s", self.job_id)
+            self.clear()
+            return {}
+        return {int(index): key for index, key in raw.items()}
+
+    def mark_done(self, index: int, storage_key: str) -> None:
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            pipe.hset(self.key, mapping={_PLAN_FIELD: self.plan, str(index): storage_key})
+            pipe.expire(self.key, get_config().checkpoint.ttl_seconds)
+            pipe.execute()
+        except RedisError:
+            logger.warning(
+                "[checkpoint] Could not record segment %d of job %s", index, self.job_id, exc_info=True
+            )
+
+    def discard(self) -> None:
+        """Delete the segment objects and the checkpoint (job finished)."""
+        keys = [segment_storage_key(self.job_id, i) for i in range(self.segment_count)]
+        try:
+            storage.delete_objects(keys)
+        except (BotoCoreError, ClientError):
+            logger.warning("[checkpoint] Could not delete segments of job %s", self.job_id, exc_info=True)
+        self.clear()
+
+    def clear(self) -> None:
+        try:
+            get_redis().delete(self.key)
+        except RedisError:
+            logger.warning("[checkpoint] Could not clear checkpoint of job %s", self.job_id, exc_info=True)
+
+
+def concat_wavs(parts: list[Path], target: Path) -> Path:
+    """Concatenate WAV files with identical formats into *target*."""
+    with wave.open(str(target), "wb") as out:
+        for i, part in enumerate(parts):
+            with wave.open(str(part), "rb") as src:
+                if i == 0:
+                    out.setparams(src.getparams())
+                elif src.getparams()[:3] != out.getparams()[:3]:
+                    raise ValueError(f"Segment {part.name} has a different audio format")
+                out.writeframes(src.readframes(src.getnframes()))
+    return target
@@ -0,0 +1,125 @@
+"""
+Failure taxonomy and retry policy for worker tasks.
+
+Every exception escaping a task body is classified as one of:
+
+* **permanent** – retrying cannot help (unknown engine, engine mismatch,
+  malformed embedding JSON, invalid input).  The task fails at once
+  instead of burning its retries.
+* **transient** – network blips, broker/storage timeouts and anything
+  unrecognised.  Retried with exponential backoff and full jitter.
+* **resource-exhausted** – out of memory (host or GPU), disk full,
+  storage throttling.  Retried like transient errors but from a longer
+  base delay, giving the pressure time to subside.
+
+Code that knows better can raise ``PermanentError``, ``TransientError``
+or ``ResourceExhaustedError`` explicitly.  Every retry and final failure
+is counted per task and class (see ``backend.metrics``) and reported by
+``GET /admin/failures``.
+"""
+
+from __future__ import annotations
+
+import enum
+import errno
+import random
+import subprocess
+from dataclasses import dataclass
+
+from botocore.exceptions import ClientError
+
+from backend import metrics
+from backend.config import get_config
+
+
+class FailureClass(str, enum.Enum):
+    PERMANENT = "permanent"
+    TRANSIENT = "transient"
+    RESOURCE_EXHAUSTED = "resource_exhausted"
+
+
+class PermanentError(Exception):
+    """A failure that will recur on every attempt."""
+
+
+class TransientError(Exception):
+    """A failure that is likely to go away on retry."""
+
+
+class ResourceExhaustedError(Exception):
+    """The worker or a dependency ran out of capacity."""
+
+
+# Exception types that signal bad input or configuration.
+_PERMANENT_TYPES: tuple[type[BaseException], ...] = (
+    PermanentError,
+    ValueError,  # includes json.JSONDecodeError and UnicodeDecodeError
+    TypeError,
+    KeyError,
+    NotImplementedError,
+    subprocess.CalledProcessError,  # ffmpeg rejected the input
+)
+
+_EXHAUSTED_ERRNOS = frozenset({errno.ENOSPC, errno.ENOMEM, errno.EMFILE, errno.ENFILE, errno.EDQUOT})
+
+_PERMANENT_S3_CODES = frozenset(
+    {"NoSuchKey", "NoSuchBucket", "AccessDenied", "InvalidAccessKeyId", "404", "403"}
+)
+_THROTTLED_S3_CODES = frozenset({"SlowDown", "Throttling", "RequestLimitExceeded", "503"})
+
+
+def classify(exc: BaseException) -> FailureClass:
+    """Return the failure class of *exc*."""
+    if isinstance(exc, TransientError):
+        return FailureClass.TRANSIENT
+    if isinstance(exc, (ResourceExhaustedError, MemoryError)):
+        return FailureClass.RESOURCE_EXHAUSTED
+    # torch.cuda.OutOfMemoryError, matched by name to avoid importing torch.
+    if type(exc).__name__ == "OutOfMemoryError":
+        return FailureClass.RESOURCE_EXHAUSTED
+    if isinstance(exc, OSError) and exc.errno in _EXHAUSTED_ERRNOS:
+        return FailureClass.RESOURCE_EXHAUSTED
+    if isinstance(exc, ClientError):
+        code = str(exc.response.get("Error", {}).get("Code", ""))
+        if code in _THROTTLED_S3_CODES:
+            return FailureClass.RESOURCE_EXHAUSTED
+        if code in _PERMANENT_S3_CODES:
+            return FailureClass.PERMANENT
+        return FailureClass.TRANSIENT
+    if isinstance(exc, _PERMANENT_TYPES):
+        return FailureClass.PERMANENT
+    return FailureClass.TRANSIENT
+
+
+def backoff_seconds(failure_class: FailureClass, retries: int) -> float:
+    """Delay before retry number ``retries + 1``: exponential, full jitter."""
+    cfg = get_config().retry
+    if failure_class is FailureClass.RESOURCE_EXHAUSTED:
+        base, cap = cfg.exhausted_base_seconds, cfg.exhausted_max_seconds
+    else:
+        base, cap = cfg.transient_base_seconds, cfg.transient_max_seconds
+    return random.uniform(0, min(cap, base * 2**retries))
+
+
+@dataclass(frozen=True)
+class RetryDecision:
+    """What to do about a failed attempt; ``countdown`` is ``None`` to give up."""
+
+    failure_class: FailureClass
+    countdown: float | None
+
+
+def decide(task, exc: BaseException) -> RetryDecision:  # noqa: ANN001 – Celery task
+    """Classify *exc* raised by *task* and decide whether to retry.
+
+    The outcome is recorded in the per-class retry/failure counters.
+    """
+    failure_class = classify(exc)
+    retries = task.request.retries
+    give_up = failure_class is FailureClass.PERMANENT or (
+        task.max_retries is not None and retries >= task.max_retries
+    )
+    metrics.record_task_failure(task.name, failure_class.value, retried=not give_up)
+    if give_up:
+        return RetryDecision(failure_class, None)
+    return RetryDecision(failure_class, backoff_seconds(failure_class, retries))
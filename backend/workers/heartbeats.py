@@ -0,0 +1,152 @@
+"""
+Heartbeats for running synthesis jobs.
+
+Every worker process records the jobs it is running in the Redis sorted
+set ``awaaztwin:workers:running`` (member = job ID, score = last
+heartbeat) and refreshes the scores from a daemon thread.  A job whose
+score stops advancing belongs to a process that died – OOM kill,
+crashed host, lost network – and would otherwise sit in ``PROCESSING``
+forever.  The maintenance worker's ``reap_stuck_jobs`` requeues such
+jobs, or fails them once they have been requeued ``max_requeues``
+times.
+
+Heartbeats run per process (not per worker node), so a prefork child
+that is killed stops beating even though its parent lives on.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+
+from redis.exceptions import RedisError
+
+from backend.config import get_config
+from backend.redis_client import KEY_PREFIX, get_redis
+
+logger = logging.getLogger(__name__)
+
+_RUNNING_KEY = KEY_PREFIX + "workers:running"
+# job ID -> process running it, for logs and duplicate detection.
+_OWNERS_KEY = KEY_PREFIX + "workers:owners"
+# job ID -> times the reaper has requeued it.
+_REQUEUES_KEY = KEY_PREFIX + "reaper:requeues"
+
+
+def process_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class _Heartbeat:
+    """Keeps this process's running jobs fresh from a daemon thread."""
+
+    def __init__(self) -> None:
+        self._jobs: set[str] = set()
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+
+    def track(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.add(job_id)
+            if self._pid != os.getpid():
+                # First job in this process (or we were forked): start beating.
+                self._pid = os.getpid()
+                threading.Thread(target=self._run, name="job-heartbeat", daemon=True).start()
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.zadd(_RUNNING_KEY, {job_id: time.time()})
+        pipe.hset(_OWNERS_KEY, job_id, process_name())
+        pipe.execute()
+
+    def untrack(self, job_id: str) -> None:
+        with self._lock:
+            if job_id not in self._jobs:
+                return  # a duplicate we never tracked; the entry is another process's
+            self._jobs.discard(job_id)
+        forget([job_id])
+
+    def _run(self) -> None:
+        interval = get_config().reaper.heartbeat_interval_seconds
+        while True:
+            time.sleep(interval)
+            with self._lock:
+                jobs = list(self._jobs)
+            if not jobs:
+                continue
+            now = time.time()
+            try:
+                get_redis().zadd(_RUNNING_KEY, {job_id: now for job_id in jobs})
+            except RedisError:
+                logger.warning("[heartbeat] Heartbeat failed", exc_info=True)
+
+
+_heartbeat = _Heartbeat()
+
+
+def track(job_id: str) -> bool:
+    """Start heartbeating *job_id* in this process.
+
+    Returns ``False`` (and tracks nothing) if another live process is
+    already running the job, e.g. for a message redelivered while its
+    first delivery is still being worked on.
+    """
+    timeout = get_config().reaper.heartbeat_timeout_seconds
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.zscore(_RUNNING_KEY, job_id)
+        pipe.hget(_OWNERS_KEY, job_id)
+        last_beat, owner = pipe.execute()
+        if (
+            last_beat is not None
+            and last_beat >= time.time() - timeout
+            and owner not in (None, process_name())
+        ):
+            return False
+        _heartbeat.track(job_id)
+    except RedisError:
+        logger.warning("[heartbeat] Could not track job %s", job_id, exc_info=True)
+    return True
+
+
+def untrack(job_id: str) -> None:
+    """Stop heartbeating *job_id* (it finished, failed or is being retried)."""
+    try:
+        _heartbeat.untrack(job_id)
+    except RedisError:
+        logger.warning("[heartbeat] Could not untrack job %s", job_id, exc_info=True)
+
+
+def stale_jobs(timeout_seconds: float) -> dict[str, str | None]:
+    """Return ``{job ID: owner}`` of jobs without a heartbeat for *timeout_seconds*."""
+    redis = get_redis()
+    jobs = redis.zrangebyscore(_RUNNING_KEY, "-inf", time.time() - timeout_seconds)
+    if not jobs:
+        return {}
+    return dict(zip(jobs, redis.hmget(_OWNERS_KEY, jobs)))
+
+
+def live_jobs(timeout_seconds: float) -> set[str]:
+    """Return the jobs heartbeated within the last *timeout_seconds*."""
+    return set(get_redis().zrangebyscore(_RUNNING_KEY, time.time() - timeout_seconds, "+inf"))
+
+
+def forget(job_ids: list[str]) -> None:
+    pipe = get_redis().pipeline(transaction=False)
+    pipe.zrem(_RUNNING_KEY, *job_ids)
+    pipe.hdel(_OWNERS_KEY, *job_ids)
+    pipe.execute()
+
+
+def requeues(job_id: str) -> int:
+    """How often the reaper has requeued *job_id* so far."""
+    return int(get_redis().hget(_REQUEUES_KEY, job_id) or 0)
+
+
+def count_requeue(job_id: str) -> int:
+    """Count a reaper requeue of *job_id*; returns the new total."""
+    pipe = get_redis().pipeline(transaction=False)
+    pipe.hincrby(_REQUEUES_KEY, job_id, 1)
+    pipe.expire(_REQUEUES_KEY, get_config().reaper.requeue_memory_seconds)
+    return pipe.execute()[0]
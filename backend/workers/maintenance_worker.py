@@ -0,0 +1,443 @@
+"""
+Maintenance worker.
+
+Periodic housekeeping tasks, scheduled by ``celery beat`` (see
+``beat_schedule`` in ``celery_app``):
+
+* ``collect_orphaned_outputs`` – deletes synthesis outputs that nothing
+  references any more: stale files left in the local spool directory
+  (e.g. after a crash between synthesis and upload) and ``outputs/``
+  objects in storage that no ``SynthesisJob`` points at.  Each run lists
+  at most ``gc_max_objects_per_run`` objects and the next one resumes
+  after the last, so the bucket is covered over several runs.
+* ``rehome_affinity_queues`` – moves jobs out of the personal queues of
+  synthesis workers that died, back onto the shared lane queues.
+* ``reap_stuck_jobs`` – reclaims ``PROCESSING`` jobs whose worker stopped
+  heartbeating (see ``heartbeats``): requeues them, or fails them once
+  they have been lost ``max_requeues`` times.
+* ``reconcile_counters`` – recounts rows per status and corrects the
+  incrementally maintained counters (see ``backend.counters``).
+* ``manage_job_partitions`` – creates the coming months' partitions of
+  ``synthesis_jobs`` and archives the expired ones to storage as gzipped
+  JSON lines before dropping them (see ``backend.partitions``).
+
+Run standalone::
+
+    celery -A backend.workers.celery_app worker -Q maintenance -l info
+    celery -A backend.workers.celery_app beat -l info
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import shutil
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from redis.exceptions import RedisError
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from backend import coalescing, counters, events, job_status, metrics, partitions, storage
+from backend.config import get_config
+from backend.database import run_in_session
+from backend.engines.config import load_engine_configs_from_env
+from backend.models import SynthesisJob, SynthesisJobStatus, VoiceProfile
+from backend.redis_client import KEY_PREFIX, get_redis
+from backend.workers import affinity, checkpoints, heartbeats
+from backend.workers.celery_app import app
+from backend.workers.failures import FailureClass
+from backend.workers.routing import enqueue_synthesis, voice_embedding_json
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_PREFIX = "outputs/"
+# Last key listed by the output GC; its next run starts after it.
+_GC_CHECKPOINT_KEY = f"{KEY_PREFIX}gc:outputs:after"
+
+
+def sweep_spool_dirs(max_age_seconds: float) -> int:
+    """Delete spooled output files older than *max_age_seconds*.
+
+    A file only lingers in the spool if its upload never happened, so
+    anything past the retention window is an orphan.  A job's segment
+    directory gains a file per segment, so it is only removed once no
+    segment has been written to it for the whole window.
+
+    Returns:
+        The number of files and segment directories removed.
+    """
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    spool_dirs = {Path(cfg.output_dir) for cfg in load_engine_configs_from_env()}
+    for spool in spool_dirs:
+        if not spool.is_dir():
+            continue
+        for path in spool.iterdir():
+            try:
+                if path.stat().st_mtime >= cutoff:
+                    continue
+                if path.is_file():
+                    path.unlink()
+                    removed += 1
+                elif path.name.endswith(checkpoints.SEGMENT_DIR_SUFFIX):
+                    shutil.rmtree(path, ignore_errors=True)
+                    removed += 1
+            except FileNotFoundError:
+                continue
+    if removed:
+        logger.info("[maintenance] Removed %d orphaned spool file(s)", removed)
+    return removed
+
+
+def _unreferenced(keys: list[str]) -> list[str]:
+    """Return the subset of *keys* that no ``SynthesisJob`` references.
+
+    Served by ``ix_synthesis_jobs_output_storage_key``.  The key does not
+    name the referencing job: a job completed from an identical job's
+    cached result points at the other job's output.
+    """
+
+    async def _query(session: AsyncSession) -> set[str]:
+        rows = await session.scalars(
+            select(SynthesisJob.output_storage_key).where(
+                SynthesisJob.output_storage_key.in_(keys)
+            )
+        )
+        return set(rows)
+
+    referenced = run_in_session(_query)
+    return [k for k in keys if k not in referenced]
+
+
+def _gc_checkpoint() -> str | None:
+    try:
+        return get_redis().get(_GC_CHECKPOINT_KEY)
+    except RedisError:
+        logger.warning("[maintenance] Could not read the GC checkpoint", exc_info=True)
+        return None
+
+
+def _save_gc_checkpoint(last_key: str | None) -> None:
+    try:
+        if last_key is None:
+            get_redis().delete(_GC_CHECKPOINT_KEY)
+        else:
+            get_redis().set(_GC_CHECKPOINT_KEY, last_key)
+    except RedisError:
+        logger.warning("[maintenance] Could not save the GC checkpoint", exc_info=True)
+
+
+@app.task(name="backend.workers.maintenance_worker.collect_orphaned_outputs")
+def collect_orphaned_outputs() -> dict:
+    """Celery task: garbage-collect orphaned synthesis outputs.
+
+    Returns
+    -------
+    dict
+        Counts of removed spool files and deleted storage objects.
+    """
+    cfg = get_config().lifecycle
+    spool_removed = sweep_spool_dirs(cfg.spool_retention_minutes * 60)
+
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=cfg.orphan_retention_hours)
+    scanned = 0
+    objects_deleted = 0
+    batch: list[str] = []
+
+    def _flush() -> int:
+        orphans = _unreferenced(batch)
+        return storage.delete_objects(orphans) if orphans else 0
+
+    last: str | None = None
+    for obj in storage.list_objects(OUTPUT_PREFIX, start_after=_gc_checkpoint()):
+        scanned += 1
+        last = obj.storage_key
+        if obj.last_modified is None or obj.last_modified < cutoff:
+            batch.append(obj.storage_key)
+        if len(batch) >= cfg.gc_batch_size:
+            objects_deleted += _flush()
+            batch.clear()
+        if scanned >= cfg.gc_max_objects_per_run:
+            break
+    else:
+        last = None  # Reached the end: the next run starts over.
+    if batch:
+        objects_deleted += _flush()
+    _save_gc_checkpoint(last)
+
+    logger.info(
+        "[maintenance] Output GC: %d spool file(s) removed, "
+        "%d of %d listed object(s) deleted",
+        spool_removed,
+        objects_deleted,
+        scanned,
+    )
+    return {
+        "spool_files_removed": spool_removed,
+        "objects_scanned": scanned,
+        "objects_deleted": objects_deleted,
+    }
+
+
+@app.task(name="backend.workers.maintenance_worker.rehome_affinity_queues")
+def rehome_affinity_queues() -> dict:
+    """Celery task: re-home jobs stranded on dead workers' personal queues.
+
+    Returns
+    -------
+    dict
+        Number of messages moved back to the shared lane queues.
+    """
+    return {"messages_moved": affinity.rehome_orphaned_queues()}
+
+
+def _silent_processing_jobs(cutoff: datetime) -> list[str]:
+    """Return ``PROCESSING`` jobs last updated before *cutoff*.
+
+    Catches jobs that never got a heartbeat in – the worker died right
+    after marking them, or Redis lost its data.
+    """
+
+    async def _query(session: AsyncSession) -> list[str]:
+        rows = await session.scalars(
+            select(SynthesisJob.id).where(
+                SynthesisJob.status == SynthesisJobStatus.PROCESSING,
+                SynthesisJob.updated_at < cutoff,
+            )
+        )
+        return [str(job_id) for job_id in rows]
+
+    return run_in_session(_query)
+
+
+def _reclaim(job_id: str, *, requeue: bool) -> dict | None:
+    """Take a stuck job back from its dead worker.
+
+    Returns:
+        ``None`` if the job is no longer ``PROCESSING``; otherwise the
+        ``enqueue_synthesis`` arguments to requeue it with (empty when it
+        was failed instead).
+    """
+
+    async def _update(session: AsyncSession) -> dict | None:
+        job = await session.scalar(
+            select(SynthesisJob)
+            .options(selectinload(SynthesisJob.voice_profile))
+            .where(
+                *SynthesisJob.id_criteria(uuid.UUID(job_id)),
+                SynthesisJob.status == SynthesisJobStatus.PROCESSING,
+            )
+            .with_for_update(of=SynthesisJob)
+        )
+        if job is None:
+            return None
+        coalesce_key = None
+        if get_config().coalescing.enabled:
+            coalesce_key = coalescing.coalesce_key(
+                job.engine_name, job.voice_profile_id, job.input_text, job.params_json
+            )
+        if not requeue:
+            job.status = SynthesisJobStatus.FAILED
+            job.error_message = "Worker lost while processing the job"
+            return {"coalesce_key": coalesce_key}
+        job.status = SynthesisJobStatus.PENDING
+        return {
+            "job_id": job_id,
+            "text": job.input_text,
+            "voice_embedding_json": voice_embedding_json(job.voice_profile, job.engine_name),
+            "engine_name": job.engine_name,
+            "params": job.params_json,
+            "coalesce_key": coalesce_key,
+        }
+
+    return run_in_session(_update)
+
+
+@app.task(name="backend.workers.maintenance_worker.reap_stuck_jobs")
+def reap_stuck_jobs() -> dict:
+    """Celery task: reclaim jobs whose worker stopped heartbeating.
+
+    A job is stuck once its heartbeat is older than
+    ``heartbeat_timeout_seconds``, or – if it has none – once its row
+    sat in ``PROCESSING`` that long.  Each reclaim requeues the job until
+    it has been requeued ``max_requeues`` times; after that it is failed,
+    as it most likely takes its workers down with it.
+
+    Returns
+    -------
+    dict
+        Numbers of jobs requeued and failed.
+    """
+    cfg = get_config().reaper
+    stale = heartbeats.stale_jobs(cfg.heartbeat_timeout_seconds)
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=cfg.heartbeat_timeout_seconds)
+    live = heartbeats.live_jobs(cfg.heartbeat_timeout_seconds)
+    silent = [job_id for job_id in _silent_processing_jobs(cutoff) if job_id not in live]
+
+    requeued = failed = 0
+    for job_id in dict.fromkeys([*stale, *silent]):
+        requeue = heartbeats.requeues(job_id) < cfg.max_requeues
+        request = _reclaim(job_id, requeue=requeue)
+        heartbeats.forget([job_id])
+        if request is None:
+            continue
+        status = SynthesisJobStatus.PENDING if requeue else SynthesisJobStatus.FAILED
+        counters.transition(SynthesisJob, SynthesisJobStatus.PROCESSING, status)
+        if requeue:
+            job_status.record(job_id, status=status, progress=0.0)
+        else:
+            job_status.record(
+                job_id, status=status, error_message="Worker lost while processing the job"
+            )
+        logger.warning(
+            "[maintenance] Job %s lost its worker (%s); %s",
+            job_id,
+            stale.get(job_id) or "no heartbeat",
+            "requeueing" if requeue else "failing it",
+        )
+        if requeue:
+            heartbeats.count_requeue(job_id)
+            enqueue_synthesis(**request)
+            events.publish(job_id, events.QUEUED, reclaimed=True)
+            metrics.record_reclaimed("requeued")
+            requeued += 1
+            continue
+        if request["coalesce_key"]:
+            try:
+                coalescing.release(request["coalesce_key"], job_id)
+            except RedisError:
+                logger.warning("[maintenance] Could not release in-flight marker", exc_info=True)
+        events.publish(
+            job_id,
+            events.FAILED,
+            error="Worker lost while processing the job",
+            # A job that keeps killing its workers is most likely out of memory.
+            failure_class=FailureClass.RESOURCE_EXHAUSTED.value,
+        )
+        metrics.record_reclaimed("failed")
+        failed += 1
+
+    if requeued or failed:
+        logger.info("[maintenance] Reaper: %d job(s) requeued, %d failed", requeued, failed)
+    return {"requeued": requeued, "failed": failed}
+
+
+def _count_by_status(model) -> dict[str, int]:  # noqa: ANN001 – a model class
+    async def _query(session: AsyncSession) -> dict[str, int]:
+        rows = await session.execute(
+            select(model.status, func.count()).group_by(model.status)
+        )
+        return {status.value: count for status, count in rows.all()}
+
+    return run_in_session(_query)
+
+
+@app.task(name="backend.workers.maintenance_worker.reconcile_counters")
+def reconcile_counters() -> dict:
+    """Celery task: recount rows per status and reset the counters.
+
+    Transitions committed while the recount runs may be counted twice or
+    not at all; the next run corrects them.
+
+    Returns
+    -------
+    dict
+        Corrected drift (counted - stored) per table and status.
+    """
+    drift: dict[str, dict[str, int]] = {}
+    for model in (SynthesisJob, VoiceProfile):
+        corrected = counters.reset(model, _count_by_status(model))
+        if corrected:
+            logger.warning(
+                "[maintenance] Corrected %s counter drift: %s", model.__tablename__, corrected
+            )
+        drift[model.__tablename__] = corrected
+    return drift
+
+
+def _archive_partition(name: str, target: Path) -> dict[str, int]:
+    """Write partition *name*'s rows to *target* as gzipped JSON lines.
+
+    Returns:
+        The number of rows archived per status.
+    """
+
+    async def _export(session: AsyncSession) -> dict[str, int]:
+        by_status: dict[str, int] = {}
+        result = await session.stream(text(f"SELECT * FROM {name} ORDER BY created_at, id"))
+        with gzip.open(target, "wt", encoding="utf-8") as out:
+            async for row in result.mappings():
+                out.write(json.dumps(dict(row), default=str, ensure_ascii=False) + "\n")
+                by_status[row["status"]] = by_status.get(row["status"], 0) + 1
+        return by_status
+
+    return run_in_session(_export)
+
+
+@app.task(name="backend.workers.maintenance_worker.manage_job_partitions")
+def manage_job_partitions() -> dict:
+    """Celery task: maintain the monthly partitions of ``synthesis_jobs``.
+
+    Creates the partitions of the current and the next
+    ``partitions_ahead_months`` months, then archives every partition
+    past ``retention_months`` to ``<archive_prefix><partition>.jsonl.gz``
+    and drops it.  A partition is only dropped once its archive is
+    uploaded, so a failed run leaves it for the next one.
+
+    Returns
+    -------
+    dict
+        Partitions created and archived, and the rows archived.
+    """
+    cfg = get_config().job_retention
+    table = SynthesisJob.__tablename__
+    now = datetime.now(timezone.utc)
+    current = partitions.month_of(now)
+    last = partitions.add_months(current, cfg.partitions_ahead_months)
+
+    created = run_in_session(
+        lambda session: session.run_sync(
+            lambda s: partitions.ensure_partitions(s.connection(), table, current, last)
+        )
+    )
+    if created:
+        logger.info("[maintenance] Created partition(s) %s", ", ".join(created))
+    expired: dict[date, str] = run_in_session(
+        lambda session: session.run_sync(
+            lambda s: partitions.expired_partitions(
+                s.connection(), table, now, cfg.retention_months
+            )
+        )
+    )
+
+    archived: list[str] = []
+    rows = 0
+    for name in expired.values():
+        key = f"{cfg.archive_prefix}{name}.jsonl.gz"
+        with tempfile.TemporaryDirectory() as tmp:
+            target = Path(tmp) / f"{name}.jsonl.gz"
+            by_status = _archive_partition(name, target)
+            asyncio.run(storage.upload_file(target, key, "application/gzip"))
+        run_in_session(
+            lambda session, name=name: session.run_sync(
+                lambda s: partitions.drop_partition(s.connection(), table, name)
+            )
+        )
+        counters.discard(SynthesisJob, by_status)
+        archived.append(name)
+        count = sum(by_status.values())
+        rows += count
+        logger.info("[maintenance] Archived %d job(s) of %s to %s and dropped it", count, name, key)
+    return {"created": created, "archived": archived, "rows": rows}
+
+
+if __name__ == "__main__":
+    app.worker_main(["worker", "-Q", "maintenance", "-l", "info"])
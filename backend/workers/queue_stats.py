@@ -0,0 +1,209 @@
+"""
+Queue statistics for ``GET /admin/queues``.
+
+Two job families – ``voice_prep`` and ``synthesis`` – can each be served
+by the Celery workers in ``backend.workers`` and by the RQ workers in
+``workers/``, so their statistics add up both layouts:
+
+===========  ============================================  ==========================
+             Celery (kombu Redis transport)                 RQ
+===========  ============================================  ==========================
+queued       ``LLEN`` of every priority list of each queue  ``LLEN rq:queue:<name>``
+started      delivered, unacknowledged messages             ``ZCARD rq:wip:<name>``
+             (the transport's ``unacked`` hash)
+finished     counted by ``task_postrun`` below              ``ZCARD rq:finished:<name>``
+failed       counted by ``task_postrun`` below              ``ZCARD rq:failed:<name>``
+===========  ============================================  ==========================
+
+RQ's registries only keep jobs for their result TTL, so its finished
+and failed counts are recent ones.  The age of the oldest Celery message
+comes from its ``enqueued_at`` header (set by ``routing``; messages
+without one are not aged) and that of the oldest RQ job from its
+``enqueued_at`` field.
+
+Everything is read in one pipelined round trip, and the result is
+cached for ``CACHE_TTL_SECONDS`` so that dashboards polling the
+endpoint add no broker load.  Affinity routing's personal queues are
+discovered by the same round trip and included from the next read on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime, timezone
+
+from celery.signals import task_postrun
+from redis.exceptions import RedisError
+
+from backend.redis_client import KEY_PREFIX, get_async_redis, get_redis
+from backend.schemas import QueueStats
+from backend.workers import affinity
+from backend.workers.autoscaler import VOICE_PREP_QUEUE
+from backend.workers.routing import SYNTHESIS_QUEUES, priority_queue_keys
+
+logger = logging.getLogger(__name__)
+
+#: How long one read of the statistics is served to every caller.
+CACHE_TTL_SECONDS = 1.0
+
+#: Celery queues per family; synthesis also has the personal queues.
+CELERY_QUEUES = {
+    "voice_prep": (VOICE_PREP_QUEUE,),
+    "synthesis": SYNTHESIS_QUEUES,
+}
+#: RQ queue per family (see ``workers/``).
+RQ_QUEUES = {
+    "voice_prep": "voice-prep",
+    "synthesis": "synthesis",
+}
+
+# Kombu's Redis transport: delivery tag -> [message, exchange, routing key].
+_UNACKED_KEY = "unacked"
+# Hash per family: "finished" / "failed" -> Celery tasks.
+_RESULTS_KEY = KEY_PREFIX + "metrics:task_results:{family}"
+
+# enqueued_at of the job at the head of an RQ queue, in the same round trip.
+_RQ_OLDEST_SCRIPT = """
+local job_id = redis.call('LINDEX', KEYS[1], 0)
+if not job_id then return false end
+return redis.call('HGET', 'rq:job:' .. job_id, 'enqueued_at')
+"""
+
+_cache: tuple[float, list[QueueStats]] | None = None
+_lock = asyncio.Lock()
+# Personal queues seen by the previous read.
+_personal_queues: set[str] = set()
+
+
+def family_of(queue: str) -> str | None:
+    """Return the family whose Celery queues include *queue*."""
+    for family, queues in CELERY_QUEUES.items():
+        if queue in queues or any(queue.startswith(q + ".") for q in queues):
+            return family
+    return None
+
+
+@task_postrun.connect
+def _count_result(task=None, state=None, **_kwargs) -> None:  # noqa: ANN001 – Celery signal
+    """Count finished and failed tasks per family (retries are neither)."""
+    if state not in ("SUCCESS", "FAILURE"):
+        return
+    delivery_info = getattr(task.request, "delivery_info", None) or {}
+    family = family_of(delivery_info.get("routing_key") or "")
+    if family is None:
+        return
+    outcome = "finished" if state == "SUCCESS" else "failed"
+    try:
+        get_redis().hincrby(_RESULTS_KEY.format(family=family), outcome, 1)
+    except RedisError:
+        logger.warning("Could not count task result for %s", family, exc_info=True)
+
+
+async def read_queue_stats() -> list[QueueStats]:
+    """Return the statistics of every family, at most ``CACHE_TTL_SECONDS`` old."""
+    global _cache
+    if _cache is not None and time.monotonic() - _cache[0] < CACHE_TTL_SECONDS:
+        return _cache[1]
+    async with _lock:
+        # Callers that queued behind the refresh share its result.
+        if _cache is not None and time.monotonic() - _cache[0] < CACHE_TTL_SECONDS:
+            return _cache[1]
+        stats = await _collect()
+        _cache = (time.monotonic(), stats)
+    return stats
+
+
+def _celery_keys(family: str) -> list[str]:
+    queues = list(CELERY_QUEUES[family])
+    if family == "synthesis":
+        queues += sorted(_personal_queues)
+    return [key for queue in queues for key in priority_queue_keys(queue)]
+
+
+async def _collect() -> list[QueueStats]:
+    global _personal_queues
+    layout = {family: _celery_keys(family) for family in CELERY_QUEUES}
+
+    pipe = get_async_redis().pipeline(transaction=False)
+    pipe.smembers(affinity.PERSONAL_QUEUES_KEY)
+    pipe.hvals(_UNACKED_KEY)
+    for family, keys in layout.items():
+        for key in keys:
+            pipe.llen(key)
+            pipe.lindex(key, -1)
+        pipe.hgetall(_RESULTS_KEY.format(family=family))
+        rq_queue = RQ_QUEUES[family]
+        pipe.llen(f"rq:queue:{rq_queue}")
+        pipe.zcard(f"rq:wip:{rq_queue}")
+        pipe.zcard(f"rq:finished:{rq_queue}")
+        pipe.zcard(f"rq:failed:{rq_queue}")
+        pipe.eval(_RQ_OLDEST_SCRIPT, 1, f"rq:queue:{rq_queue}")
+    results = iter(await pipe.execute())
+
+    _personal_queues = set(next(results))
+    started = _unacked_by_family(next(results))
+    now = time.time()
+    stats: list[QueueStats] = []
+    for family, keys in layout.items():
+        queued = 0
+        enqueued: list[float] = []
+        for _ in keys:
+            queued += next(results)
+            oldest = _celery_enqueued_at(next(results))
+            if oldest is not None:
+                enqueued.append(oldest)
+        celery_results = next(results)
+        rq_queued, rq_started, rq_finished, rq_failed = (next(results) for _ in range(4))
+        rq_oldest = _rq_enqueued_at(next(results))
+        if rq_oldest is not None:
+            enqueued.append(rq_oldest)
+        age = round(max(0.0, now - min(enqueued)), 3) if enqueued else None
+        stats.append(
+            QueueStats(
+                name=family,
+                queued=queued + rq_queued,
+                started=started.get(family, 0) + rq_started,
+                finished=int(celery_results.get("finished", 0)) + rq_finished,
+                failed=int(celery_results.get("failed", 0)) + rq_failed,
+                oldest_age_seconds=age,
+            )
+        )
+    return stats
+
+
+def _unacked_by_family(entries: list[str]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for raw in entries:
+        try:
+            _, _, routing_key = json.loads(raw)
+        except (ValueError, TypeError):
+            continue
+        family = family_of(routing_key or "")
+        if family is not None:
+            counts[family] = counts.get(family, 0) + 1
+    return counts
+
+
+def _celery_enqueued_at(raw: str | None) -> float | None:
+    if raw is None:
+        return None
+    try:
+        enqueued_at = (json.loads(raw).get("headers") or {}).get("enqueued_at")
+        return float(enqueued_at) if enqueued_at is not None else None
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _rq_enqueued_at(raw: str | None) -> float | None:
+    if not raw:
+        return None
+    try:
+        enqueued_at = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    if enqueued_at.tzinfo is None:  # RQ writes UTC
+        enqueued_at = enqueued_at.replace(tzinfo=timezone.utc)
+    return enqueued_at.timestamp()
@@ -0,0 +1,189 @@
+"""
+Latency-class routing for synthesis jobs.
+
+Every synthesis job is routed at submission time, from its estimated
+cost, to one of two lanes:
+
+* ``synthesis.interactive`` – short UI previews and prompts.
+* ``synthesis.bulk`` – long-form and batch work.
+
+Within each lane, jobs are ordered shortest-job-first by mapping the
+estimated cost onto a Redis-transport message priority (``0`` is served
+first).
+
+Capacity is reserved for the interactive lane by deployment. Some
+workers consume *only* the interactive queue. The rest consume bulk
+*and* interactive, and the ``priority`` queue-order strategy drains
+interactive first::
+
+    python -m backend.workers.synthesis_worker interactive
+    python -m backend.workers.synthesis_worker bulk
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from kombu import Producer
+
+from backend.config import get_config
+from backend.engines.base import VoiceEmbeddingRef
+from backend.models import VoiceProfile
+from backend.workers.celery_app import app
+
+RUN_SYNTHESIS_TASK = "backend.workers.synthesis_worker.run_synthesis"
+
+INTERACTIVE_QUEUE = "synthesis.interactive"
+BULK_QUEUE = "synthesis.bulk"
+SYNTHESIS_QUEUES = (INTERACTIVE_QUEUE, BULK_QUEUE)
+
+#: Priorities available on the Redis transport (see ``celery_app``).
+MAX_PRIORITY = 9
+
+# Kombu's Redis transport keeps one list per priority step: the bare
+# queue name for priority 0 and ``<queue>\x06\x16<n>`` for the others.
+_PRIORITY_SEP = "\x06\x16"
+
+
+@dataclass(frozen=True)
+class Route:
+    """Where (and how urgently) a synthesis job is enqueued.
+
+    ``lane`` is the latency class; ``queue`` is the physical queue, which
+    is the lane itself unless affinity routing picked a worker's personal
+    queue within it.
+    """
+
+    lane: str
+    queue: str
+    priority: int
+    estimated_cost_seconds: float
+
+
+def priority_queue_keys(queue: str) -> list[str]:
+    """Return the Redis list keys that together hold *queue*'s messages."""
+    return [queue] + [f"{queue}{_PRIORITY_SEP}{p}" for p in range(1, MAX_PRIORITY + 1)]
+
+
+def estimate_cost(text: str, engine_name: str) -> float:
+    """Estimate the worker time, in seconds, needed to synthesise *text*."""
+    cfg = get_config().routing
+    per_char = cfg.engine_seconds_per_char.get(engine_name, cfg.default_seconds_per_char)
+    return cfg.base_cost_seconds + len(text) * per_char
+
+
+def route_synthesis(text: str, engine_name: str) -> Route:
+    """Pick the lane and shortest-job-first priority for a job."""
+    cfg = get_config().routing
+    cost = estimate_cost(text, engine_name)
+    if cost <= cfg.interactive_max_cost_seconds:
+        queue, cap = INTERACTIVE_QUEUE, cfg.interactive_max_cost_seconds
+    else:
+        queue, cap = BULK_QUEUE, cfg.bulk_cost_cap_seconds
+    return Route(
+        lane=queue, queue=queue, priority=_priority(cost, cap), estimated_cost_seconds=cost
+    )
+
+
+def _priority(cost: float, cap: float) -> int:
+    """Map *cost* onto ``0..MAX_PRIORITY`` on a log scale up to *cap*."""
+    if cap <= 0:
+        return MAX_PRIORITY
+    scaled = math.log1p(max(cost, 0.0)) / math.log1p(cap)
+    return min(MAX_PRIORITY, int(scaled * MAX_PRIORITY))
+
+
+def voice_embedding_json(profile: VoiceProfile, engine_name: str) -> str:
+    """Serialise *profile*'s embedding reference for a ``run_synthesis`` task."""
+    return VoiceEmbeddingRef(
+        engine_name=profile.engine_name or engine_name,
+        embedding_path=profile.embedding_path,
+        metadata=profile.metadata_json or {},
+    ).to_json()
+
+
+def enqueue_synthesis(
+    *,
+    job_id: str,
+    text: str,
+    voice_embedding_json: str,
+    engine_name: str,
+    params: dict[str, Any] | None = None,
+    coalesce_key: str | None = None,
+    deadline: float | None = None,
+    route: Route | None = None,
+    producer: Producer | None = None,
+) -> Route:
+    """Route and publish a ``run_synthesis`` task for *job_id*.
+
+    The Celery task ID is the job ID, so the task can later be looked up
+    (or revoked) from the job alone.  ``enqueued_at`` and ``lane`` travel
+    as message headers so that workers can report per-lane wait times
+    and queue inspectors can age the oldest message without decoding
+    the body.  ``coalesce_key`` (see ``backend.coalescing``) tells the
+    worker which in-flight marker to release once the job is done.
+    ``deadline`` (unix time) makes the worker drop the job unstarted once
+    it has passed.
+    Pass *route* to reuse a routing decision already made by the caller,
+    and *producer* to publish over an already acquired connection.
+    """
+    if route is None:
+        route = route_synthesis(text, engine_name)
+    app.send_task(
+        RUN_SYNTHESIS_TASK,
+        kwargs={
+            "job_id": job_id,
+            "text": text,
+            "voice_embedding_json": voice_embedding_json,
+            "engine_name": engine_name,
+            "params": params,
+        },
+        task_id=job_id,
+        queue=route.queue,
+        priority=route.priority,
+        producer=producer,
+        headers={
+            "enqueued_at": time.time(),
+            "lane": route.lane,
+            "coalesce_key": coalesce_key,
+            "deadline": deadline,
+        },
+    )
+    return route
+
+
+class PartialEnqueueError(Exception):
+    """Publishing a batch failed after ``published`` tasks went out."""
+
+    def __init__(self, published: int) -> None:
+        super().__init__(f"enqueue failed after {published} task(s)")
+        self.published = published
+
+
+def enqueue_synthesis_many(requests: list[dict[str, Any]]) -> list[Route]:
+    """Publish several ``run_synthesis`` tasks over one broker connection.
+
+    Each element of *requests* holds the keyword arguments of
+    ``enqueue_synthesis``.  Tasks are published in order; if publishing
+    fails part-way, ``PartialEnqueueError`` reports how many went out.
+    """
+    routes: list[Route] = []
+    try:
+        with app.producer_or_acquire() as producer:
+            for request in requests:
+                routes.append(enqueue_synthesis(**request, producer=producer))
+    except Exception as exc:
+        raise PartialEnqueueError(len(routes)) from exc
+    return routes
+
+
+def revoke_synthesis(job_id: str) -> None:
+    """Tell workers to drop *job_id*'s task if they have not started it.
+
+    Running tasks are not terminated; they stop cooperatively (see
+    ``backend.cancellation``).
+    """
+    app.control.revoke(job_id)
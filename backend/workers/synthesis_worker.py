@@ -6,39 +6,339 @@ configured TTS / voice-cloning engine.
 
 Pipeline:
   1. Load the correct ``EngineAdapter`` from ``EngineConfig``.
-  2. Call ``synthesize()`` with text + voice reference.
-  3. Upload the generated WAV to object storage.
+  2. Call ``synthesize_audio()`` with text + voice reference.  Long
+     texts are rendered segment by segment with checkpoints, so that a
+     retried or redelivered job skips the segments it already finished
+     (see ``checkpoints``).
+  3. Upload the generated WAV to object storage – straight from memory,
+     or from the spool directory for outputs above the memory limit
+     (the spooled copy is deleted afterwards).
   4. Update the ``SynthesisJob`` with status, duration, and output URI.
 
-Run standalone::
+Every stage transition is published as a job event (``backend.events``)
+so that clients following ``GET /jobs/{id}/events`` see progress live.
 
-    celery -A backend.workers.celery_app worker -Q synthesis -l info
+A job whose client ``deadline`` passed while it was queued is not run:
+it is completed from an identical job's cached output if there is one
+(see ``coalescing``), and marked ``EXPIRED`` otherwise.
+
+While a job runs, its worker process heartbeats it (see ``heartbeats``)
+so that the maintenance worker can reclaim jobs whose worker died.
+
+A job cancelled through ``DELETE /jobs/{id}`` is skipped if it has not
+started, and otherwise stops at the next cancellation check: before
+each segment, before the upload, and wherever the engine adapter calls
+``cancellation.raise_if_cancelled()``.
+
+Run standalone (see ``routing`` for the latency lanes)::
+
+    celery -A backend.workers.celery_app worker -Q synthesis.interactive -l info
+    celery -A backend.workers.celery_app worker \
+        -Q synthesis.interactive,synthesis.bulk -l info
 """
 
 from __future__ import annotations
 
+import asyncio
+import dataclasses
 import logging
+import shutil
+import sys
 import time
+import uuid
 from pathlib import Path
 
-from backend.engines.base import VoiceEmbeddingRef
+from botocore.exceptions import ClientError
+from celery.signals import task_postrun, task_prerun
+from redis.exceptions import RedisError
+from sqlalchemy import select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend import cancellation, coalescing, counters, events, job_status, metrics, storage
+from backend.config import get_config
+from backend.database import run_in_session
+from backend.engines.base import EngineAdapter, SynthesisOutput, VoiceEmbeddingRef
 from backend.engines.config import EngineConfig, load_engine_configs_from_env
 from backend.engines.factory import get_engine_adapter
+from backend.models import SynthesisJob, SynthesisJobStatus
+from backend.workers import affinity  # noqa: F401 – joins the affinity ring on start-up
+from backend.workers import checkpoints, failures, heartbeats
 from backend.workers.celery_app import app
+from backend.workers.maintenance_worker import sweep_spool_dirs
+from backend.workers.routing import BULK_QUEUE, INTERACTIVE_QUEUE, estimate_cost
 
 logger = logging.getLogger(__name__)
 
+# Monotonic timestamp of this process's last spool sweep.
+_last_spool_sweep = 0.0
+
 
-def _upload_file(local_path: Path, dest_uri: str) -> str:
-    """Upload a local file to object storage.
+def _upload_output(output: SynthesisOutput, storage_key: str) -> str:
+    """Upload a synthesis result to object storage.
 
-    TODO: integrate with a real storage helper (boto3 / MinIO client).
-    For now this is a stub that returns the local path as the URI.
+    In-memory results are uploaded directly.  Spooled results are removed
+    from local disk only once the upload has succeeded; if it fails the
+    file stays behind and is reclaimed by the spool sweep.
     """
-    logger.info(
-        "[synthesis] Would upload %s → %s (stub)", local_path, dest_uri
+    if output.data is not None:
+        return asyncio.run(
+            storage.upload_bytes(output.data, storage_key, output.content_type)
+        )
+    assert output.path is not None
+    asyncio.run(storage.upload_file(output.path, storage_key, output.content_type))
+    output.path.unlink(missing_ok=True)
+    return storage_key
+
+
+def _maybe_sweep_spool() -> None:
+    """Sweep this host's spool directory at most once per interval.
+
+    Spool directories are host-local, so every worker process cleans up
+    after its own host instead of relying on the shared GC task.
+    """
+    global _last_spool_sweep
+    cfg = get_config().lifecycle
+    now = time.monotonic()
+    if now - _last_spool_sweep < cfg.spool_sweep_interval_seconds:
+        return
+    _last_spool_sweep = now
+    try:
+        sweep_spool_dirs(cfg.spool_retention_minutes * 60)
+    except OSError:
+        logger.warning("[synthesis] Spool sweep failed", exc_info=True)
+
+
+def _localise_embedding(voice_ref: VoiceEmbeddingRef) -> VoiceEmbeddingRef:
+    """Ensure the embedding referenced by *voice_ref* is on local disk.
+
+    Absolute paths are used as-is.  Anything else is treated as an
+    object-storage key and resolved through the worker-local disk cache,
+    so repeat jobs for the same voice skip the download.
+    """
+    if Path(voice_ref.embedding_path).is_absolute():
+        return voice_ref
+    local = asyncio.run(storage.get_cached_path(voice_ref.embedding_path))
+    return dataclasses.replace(voice_ref, embedding_path=str(local))
+
+
+def _request_header(request, name: str):  # noqa: ANN001, ANN202 – Celery request
+    """Read a custom message header from a task request.
+
+    Workers expose protocol-2 headers as request attributes; eagerly
+    applied tasks only carry them in ``request.headers``.
+    """
+    value = getattr(request, name, None)
+    if value is None:
+        value = (getattr(request, "headers", None) or {}).get(name)
+    return value
+
+
+def _release_inflight(request, job_id: str) -> None:  # noqa: ANN001 – Celery request
+    """Let identical submissions start a fresh job from now on.
+
+    Called once the job is finished for good; while Celery is still
+    retrying, duplicates keep attaching to this job.
+    """
+    key = _request_header(request, "coalesce_key")
+    if not key:
+        return
+    try:
+        coalescing.release(key, job_id)
+    except RedisError:
+        logger.warning("[synthesis] Could not release in-flight marker", exc_info=True)
+
+
+def _set_job_status(
+    job_id: str,
+    status: SynthesisJobStatus,
+    *,
+    expected: tuple[SynthesisJobStatus, ...] | None = None,
+    **values: object,
+) -> bool:
+    """Record *status* on the job's row (best-effort).
+
+    With *expected*, the row is only updated while its status is one of
+    those, so that e.g. a job cancelled meanwhile is not revived.  The
+    status counters (``backend.counters``) and the polled status
+    (``backend.job_status``) follow the transition.
+
+    Returns ``False`` when the row is missing or was not in an *expected*
+    status.  A database error is logged and returns ``True``: the caller
+    carries on as if the update had applied.
+    """
+
+    async def _update(session: AsyncSession) -> SynthesisJobStatus | None:
+        row_id = uuid.UUID(job_id)
+        previous = await session.scalar(
+            select(SynthesisJob.status).where(*SynthesisJob.id_criteria(row_id)).with_for_update()
+        )
+        if previous is None or (expected is not None and previous not in expected):
+            return None
+        await session.execute(
+            update(SynthesisJob)
+            .where(*SynthesisJob.id_criteria(row_id))
+            .values(status=status, **values)
+        )
+        return previous
+
+    try:
+        previous = run_in_session(_update)
+    except (SQLAlchemyError, OSError, ValueError):
+        logger.warning("[synthesis] Could not mark job %s %s", job_id, status.value, exc_info=True)
+        return True
+    if previous is None:
+        return False
+    counters.transition(SynthesisJob, previous, status)
+    job_status.record(
+        job_id,
+        status=status,
+        output_storage_key=values.get("output_storage_key"),
+        error_message=values.get("error_message"),
     )
-    return str(local_path)
+    return True
+
+
+def _remember_result(request, output_uri: str) -> None:  # noqa: ANN001 – Celery request
+    """Cache *output_uri* for identical jobs that expire before they run."""
+    key = _request_header(request, "coalesce_key")
+    if not key:
+        return
+    try:
+        coalescing.remember_result(key, output_uri, get_config().coalescing.result_ttl_seconds)
+    except RedisError:
+        logger.warning("[synthesis] Could not cache result", exc_info=True)
+
+
+def _expire(request, job_id: str) -> dict:  # noqa: ANN001 – Celery request
+    """Finish a job whose deadline passed before it could start.
+
+    No inference is run: the job is completed from an identical job's
+    cached output when there is one, and marked ``EXPIRED`` otherwise.
+    Either only applies to a ``PENDING`` row: a late redelivery of a job
+    that another worker runs or has finished leaves it alone.
+    """
+    key = _request_header(request, "coalesce_key")
+    cached = None
+    if key:
+        try:
+            cached = coalescing.lookup_result(key)
+        except RedisError:
+            logger.warning("[synthesis] Result cache unavailable", exc_info=True)
+
+    if cached is not None:
+        if not _set_job_status(
+            job_id,
+            SynthesisJobStatus.COMPLETED,
+            expected=(SynthesisJobStatus.PENDING,),
+            output_storage_key=cached,
+        ):
+            logger.info("[synthesis] Job %s is no longer pending; skipping", job_id)
+            return {"job_id": job_id, "status": "skipped"}
+        logger.info("[synthesis] Job %s expired; completed from cached %s", job_id, cached)
+        _release_inflight(request, job_id)
+        events.publish(job_id, events.COMPLETED, output_storage_key=cached, from_cache=True)
+        return {"job_id": job_id, "status": "completed", "output_uri": cached}
+
+    if not _set_job_status(
+        job_id,
+        SynthesisJobStatus.EXPIRED,
+        expected=(SynthesisJobStatus.PENDING,),
+        error_message="Deadline passed before start",
+    ):
+        logger.info("[synthesis] Job %s is no longer pending; skipping", job_id)
+        return {"job_id": job_id, "status": "skipped"}
+    logger.info("[synthesis] Job %s expired before it started", job_id)
+    _release_inflight(request, job_id)
+    events.publish(job_id, events.EXPIRED)
+    return {"job_id": job_id, "status": "expired"}
+
+
+def _write_output(output: SynthesisOutput, target: Path) -> Path:
+    """Materialise *output* at *target* on local disk."""
+    if output.data is not None:
+        target.write_bytes(output.data)
+    else:
+        assert output.path is not None
+        output.path.replace(target)
+    return target
+
+
+def _fetch_segment(storage_key: str, target: Path) -> bool:
+    """Download a checkpointed segment; ``False`` if it is gone."""
+    try:
+        asyncio.run(storage.download_file(storage_key, target))
+    except ClientError:
+        logger.warning("[synthesis] Checkpointed segment %s is unavailable", storage_key)
+        return False
+    return True
+
+
+def _render(
+    job_id: str,
+    text: str,
+    adapter: EngineAdapter,
+    voice_ref: VoiceEmbeddingRef,
+    params: dict,
+    config: EngineConfig,
+) -> tuple[SynthesisOutput, checkpoints.Checkpoint | None]:
+    """Synthesise *text*, in checkpointed segments when it is long.
+
+    Returns the output and, for segmented jobs, the checkpoint to
+    discard once the output is safely uploaded.
+    """
+    cfg = get_config().checkpoint
+    if not cfg.enabled or len(text) <= cfg.min_chars:
+        cancellation.raise_if_cancelled(force=True)
+        output = adapter.synthesize_audio(text, voice_ref, params)
+        events.publish(job_id, events.CHUNK, chunk=1, total=1)
+        job_status.record(job_id, progress=1.0)
+        return output, None
+
+    segments = checkpoints.split_text(text, cfg.segment_max_chars)
+    checkpoint = checkpoints.Checkpoint(job_id, segments)
+    done = checkpoint.load()
+    if done:
+        logger.info(
+            "[synthesis] Job %s resuming with %d of %d segment(s) done",
+            job_id,
+            len(done),
+            len(segments),
+        )
+
+    spool = Path(config.output_dir)
+    # Parts live in their own directory: the spool sweep would otherwise
+    # delete the early parts of a job that runs past the retention window.
+    part_dir = checkpoints.segment_dir(spool, job_id)
+    part_dir.mkdir(parents=True, exist_ok=True)
+    parts: list[Path] = []
+    try:
+        for index, segment in enumerate(segments):
+            part = part_dir / f"{index:04d}.wav"
+            parts.append(part)
+            resumed = index in done and _fetch_segment(done[index], part)
+            if not resumed:
+                cancellation.raise_if_cancelled(index / len(segments), force=True)
+                try:
+                    output = adapter.synthesize_audio(segment, voice_ref, params)
+                except cancellation.JobCancelled as exc:
+                    # Rescale the adapter's progress within this segment to the job.
+                    exc.remaining_fraction = (
+                        len(segments) - index - 1 + exc.remaining_fraction
+                    ) / len(segments)
+                    raise
+                _write_output(output, part)
+                key = checkpoints.segment_storage_key(job_id, index)
+                asyncio.run(storage.upload_file(part, key, "audio/wav"))
+                checkpoint.mark_done(index, key)
+            events.publish(
+                job_id, events.CHUNK, chunk=index + 1, total=len(segments), resumed=resumed
+            )
+            job_status.record(job_id, progress=(index + 1) / len(segments))
+        target = checkpoints.concat_wavs(parts, spool / f"synth_{job_id}.wav")
+    finally:
+        shutil.rmtree(part_dir, ignore_errors=True)
+    return SynthesisOutput(path=target), checkpoint
 
 
 def _find_engine_config(engine_name: str) -> EngineConfig:
@@ -60,7 +360,6 @@ def _find_engine_config(engine_name: str) -> EngineConfig:
     bind=True,
     name="backend.workers.synthesis_worker.run_synthesis",
     max_retries=3,
-    default_retry_delay=30,
 )
 def run_synthesis(
     self,  # noqa: ANN001 – Celery bound task
@@ -99,13 +398,38 @@ def run_synthesis(
         text[:80],
     )
 
+    if cancellation.is_cancelled(job_id):
+        logger.info("[synthesis] Job %s was cancelled before it started", job_id)
+        _release_inflight(self.request, job_id)
+        return {"job_id": job_id, "status": "cancelled"}
+
+    if not heartbeats.track(job_id):
+        logger.info("[synthesis] Job %s is already running elsewhere; dropping duplicate", job_id)
+        return {"job_id": job_id, "status": "duplicate"}
+
+    deadline = _request_header(self.request, "deadline")
+    if deadline is not None and time.time() > float(deadline):
+        return _expire(self.request, job_id)
+    if not _set_job_status(
+        job_id,
+        SynthesisJobStatus.PROCESSING,
+        expected=(SynthesisJobStatus.PENDING, SynthesisJobStatus.PROCESSING),
+    ):
+        # Redelivered or requeued after the job finished, was cancelled or expired.
+        logger.info("[synthesis] Job %s is no longer runnable; skipping", job_id)
+        return {"job_id": job_id, "status": "skipped"}
+
     start = time.monotonic()
+    cancellation.watch(job_id)
+    events.publish(job_id, events.STARTED, attempt=self.request.retries + 1)
 
     try:
         config = _find_engine_config(engine_name)
         adapter = get_engine_adapter(config)
 
-        voice_ref = VoiceEmbeddingRef.from_json(voice_embedding_json)
+        voice_ref = _localise_embedding(
+            VoiceEmbeddingRef.from_json(voice_embedding_json)
+        )
 
         # Validate that the voice embedding matches the selected engine.
         if voice_ref.engine_name != config.name:
@@ -115,22 +439,41 @@ def run_synthesis(
                 f"with engine '{config.name}'. These must match."
             )
 
-        output_path = adapter.synthesize(text, voice_ref, params or {})
+        output, checkpoint = _render(
+            job_id, text, adapter, voice_ref, params or {}, config
+        )
+        cancellation.raise_if_cancelled(1.0, force=True)
 
         duration_sec = round(time.monotonic() - start, 3)
 
         # Upload to object storage
-        output_uri = _upload_file(
-            output_path, f"outputs/{job_id}.wav"
+        output_uri = _upload_output(output, f"outputs/{job_id}.wav")
+        events.publish(job_id, events.UPLOADED, output_storage_key=output_uri)
+        if checkpoint is not None:
+            checkpoint.discard()
+
+        _maybe_sweep_spool()
+        _remember_result(self.request, output_uri)
+        _release_inflight(self.request, job_id)
+        _set_job_status(
+            job_id,
+            SynthesisJobStatus.COMPLETED,
+            expected=(SynthesisJobStatus.PROCESSING,),
+            output_storage_key=output_uri,
         )
 
-        # TODO: update SynthesisJob in DB with status, duration, output_uri.
         logger.info(
             "[synthesis] Job %s completed in %.3fs – output at %s",
             job_id,
             duration_sec,
             output_uri,
         )
+        events.publish(
+            job_id,
+            events.COMPLETED,
+            duration_sec=duration_sec,
+            output_storage_key=output_uri,
+        )
 
         return {
             "job_id": job_id,
@@ -139,12 +482,81 @@ def run_synthesis(
             "output_uri": output_uri,
         }
 
+    except cancellation.JobCancelled as exc:
+        saved = estimate_cost(text, engine_name) * exc.remaining_fraction
+        logger.info("[synthesis] Job %s cancelled; ~%.1fs of compute saved", job_id, saved)
+        metrics.record_cancellation("running", saved)
+        _release_inflight(self.request, job_id)
+        events.publish(job_id, events.CANCELLED, compute_seconds_saved=round(saved, 3))
+        return {"job_id": job_id, "status": "cancelled"}
+
     except Exception as exc:
-        logger.exception("[synthesis] Job %s failed", job_id)
-        raise self.retry(exc=exc)
+        decision = failures.decide(self, exc)
+        logger.exception(
+            "[synthesis] Job %s failed (%s)", job_id, decision.failure_class.value
+        )
+        if decision.countdown is None:
+            _release_inflight(self.request, job_id)
+            _set_job_status(
+                job_id,
+                SynthesisJobStatus.FAILED,
+                expected=(SynthesisJobStatus.PROCESSING,),
+                error_message=str(exc),
+            )
+            events.publish(
+                job_id,
+                events.FAILED,
+                error=str(exc),
+                failure_class=decision.failure_class.value,
+            )
+            raise
+        # Back to PENDING while the retry waits out its countdown, so the
+        # reaper does not take the job for one whose worker died.
+        _set_job_status(
+            job_id, SynthesisJobStatus.PENDING, expected=(SynthesisJobStatus.PROCESSING,)
+        )
+        events.publish(job_id, events.QUEUED, retry=self.request.retries + 1)
+        raise self.retry(exc=exc, countdown=decision.countdown)
+
+
+@task_prerun.connect(sender=run_synthesis)
+def _record_queue_wait(task, **_kwargs) -> None:  # noqa: ANN001 – Celery signal
+    """Report how long the task waited in its lane before starting."""
+    enqueued_at = _request_header(task.request, "enqueued_at")
+    lane = _request_header(task.request, "lane")
+    if enqueued_at is None or lane is None:
+        return
+    metrics.record_queue_wait(lane, max(0.0, time.time() - float(enqueued_at)))
+
+
+@task_postrun.connect(sender=run_synthesis)
+def _record_completion(task, state=None, **_kwargs) -> None:  # noqa: ANN001 – Celery signal
+    """Count finished tasks per lane; admission control uses the rate."""
+    lane = _request_header(task.request, "lane")
+    if lane is None or state not in ("SUCCESS", "FAILURE"):
+        return
+    metrics.record_completion(lane)
+
+
+@task_postrun.connect(sender=run_synthesis)
+def _stop_heartbeat(task_id=None, **_kwargs) -> None:  # noqa: ANN001 – Celery signal
+    """Stop heartbeating the job once its task returns, fails or retries."""
+    if task_id is not None:
+        heartbeats.untrack(task_id)
+
+
+# Lanes a standalone worker consumes, in drain order.
+_WORKER_LANES = {
+    "interactive": [INTERACTIVE_QUEUE],
+    "bulk": [INTERACTIVE_QUEUE, BULK_QUEUE],
+}
 
 
 if __name__ == "__main__":
     # Allow running as a standalone worker:
-    #   python -m backend.workers.synthesis_worker
-    app.worker_main(["worker", "-Q", "synthesis", "-l", "info"])
+    #   python -m backend.workers.synthesis_worker [interactive|bulk]
+    # "interactive" workers are capacity reserved for short jobs; "bulk"
+    # workers (the default) also help with interactive work first.
+    lane = sys.argv[1] if len(sys.argv) > 1 else "bulk"
+    queues = ",".join(_WORKER_LANES[lane])
+    app.worker_main(["worker", "-Q", queues, "-l", "info"])
@@ -18,14 +18,17 @@ Run standalone::
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import subprocess
 import tempfile
 from pathlib import Path
 
+from backend import storage
 from backend.engines.config import EngineConfig, load_engine_configs_from_env
 from backend.engines.factory import get_engine_adapter
+from backend.workers import failures
 from backend.workers.celery_app import app
 
 logger = logging.getLogger(__name__)
@@ -34,7 +37,9 @@ logger = logging.getLogger(__name__)
 def _download_file(uri: str, dest: Path) -> Path:
     """Download a file from object storage to *dest*.
 
-    TODO: integrate with a real storage helper (boto3 / MinIO client).
+    Object-storage keys (optionally written as ``s3://<bucket>/<key>``)
+    are fetched through ``backend.storage.download_file`` and therefore
+    served from the worker-local disk cache when possible.
 
     Local filesystem paths are only accepted when
     ``AWAAZTWIN_UPLOAD_BASE_DIR`` is configured, and the resolved path
@@ -62,10 +67,17 @@ def _download_file(uri: str, dest: Path) -> Path:
             f"AWAAZTWIN_UPLOAD_BASE_DIR being configured: {uri!r}"
         )
 
-    logger.info("[voice-prep] Would download %s → %s (stub)", uri, dest)
-    # Create a tiny placeholder so downstream code does not crash
-    dest.write_bytes(b"")
-    return dest
+    return asyncio.run(storage.download_file(_storage_key(uri), dest))
+
+
+def _storage_key(uri: str) -> str:
+    """Strip an optional ``s3://<bucket>/`` prefix from *uri*."""
+    if uri.startswith("s3://"):
+        _, _, key = uri[len("s3://"):].partition("/")
+        if not key:
+            raise ValueError(f"S3 URI has no object key: {uri!r}")
+        return key
+    return uri
 
 
 def _convert_to_wav(source: Path, output_dir: Path) -> Path:
@@ -155,7 +167,6 @@ def _find_engine_config_by_name(engine_name: str | None) -> EngineConfig:
     bind=True,
     name="backend.workers.voice_prep_worker.prepare_voice_profile",
     max_retries=3,
-    default_retry_delay=30,
 )
 def prepare_voice_profile(
     self,  # noqa: ANN001 – Celery bound task
@@ -217,10 +228,15 @@ def prepare_voice_profile(
         }
 
     except Exception as exc:
+        decision = failures.decide(self, exc)
         logger.exception(
-            "[voice-prep] Failed to prepare profile %s", voice_profile_id
+            "[voice-prep] Failed to prepare profile %s (%s)",
+            voice_profile_id,
+            decision.failure_class.value,
         )
-        raise self.retry(exc=exc)
+        if decision.countdown is None:
+            raise
+        raise self.retry(exc=exc, countdown=decision.countdown)
 
 
 if __name__ == "__main__":
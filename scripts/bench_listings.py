@@ -0,0 +1,180 @@
+"""Benchmark keyset vs. OFFSET pagination of the job and voice listings.
+
+Seeds a throw-away schema in the configured Postgres database (see
+``database.url``) with a large ``synthesis_jobs`` table, then times a
+page deep into the listing both ways and prints the plan of each
+keyset query, so a missing index shows up as a ``Seq Scan``::
+
+    python scripts/bench_listings.py --jobs 2000000 --voices 2000
+
+The schema is dropped afterwards unless ``--keep`` is given (re-runs
+with ``--keep`` and ``--reuse`` skip the seeding).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from backend import partitions
+from backend.config import get_config
+from backend.models import Base, SynthesisJob, SynthesisJobStatus, VoiceProfile
+from backend.pagination import encode_cursor, keyset_page
+
+SCHEMA = "bench_listings"
+PAGE_SIZE = 50
+
+
+async def _seed(conn: AsyncConnection, jobs: int, voices: int) -> None:
+    await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    await conn.run_sync(Base.metadata.create_all)
+    # Jobs are dated one second apart going back from now.
+    now = datetime.now(timezone.utc)
+    await conn.run_sync(
+        lambda sync_conn: partitions.ensure_partitions(
+            sync_conn,
+            SynthesisJob.__tablename__,
+            partitions.month_of(now - timedelta(seconds=jobs)),
+            partitions.month_of(now),
+        )
+    )
+    org, user_ids = uuid.uuid4(), [uuid.uuid4() for _ in range(max(1, voices // 20))]
+    await conn.execute(text("INSERT INTO orgs (id, name) VALUES (:id, 'bench')"), {"id": org})
+    await conn.execute(
+        text("INSERT INTO users (id, org_id, email, display_name) VALUES (:id, :org, :email, 'b')"),
+        [{"id": u, "org": org, "email": f"{u}@bench"} for u in user_ids],
+    )
+    await conn.execute(
+        text(
+            "INSERT INTO voice_profiles (id, user_id, label, status, created_at, updated_at) "
+            "SELECT gen_random_uuid(), u.id, 'voice ' || g, 'READY', "
+            "       now() - g * interval '1 minute', now() "
+            "FROM generate_series(1, :voices) AS g "
+            "JOIN (SELECT id, row_number() OVER () - 1 AS n FROM users) AS u "
+            "  ON u.n = g % (SELECT count(*) FROM users)"
+        ),
+        {"voices": voices},
+    )
+    statuses = [s.value for s in SynthesisJobStatus]
+    await conn.execute(
+        text(
+            "INSERT INTO synthesis_jobs "
+            "  (id, voice_profile_id, engine_name, input_text, status, created_at, updated_at) "
+            "SELECT gen_random_uuid(), v.id, 'xtts-hindi', 'namaste', "
+            "       (CAST(:statuses AS text[]))[1 + g % :n_statuses]::synthesisjobstatus, "
+            "       now() - g * interval '1 second', now() "
+            "FROM generate_series(1, :jobs) AS g "
+            "JOIN (SELECT id, row_number() OVER () - 1 AS n FROM voice_profiles) AS v "
+            "  ON v.n = g % :voices"
+        ),
+        {"statuses": statuses, "n_statuses": len(statuses), "jobs": jobs, "voices": voices},
+    )
+    await conn.execute(text("ANALYZE"))
+
+
+async def _time(conn: AsyncConnection, stmt, repeat: int) -> float:  # noqa: ANN001
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        (await conn.execute(stmt)).all()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+async def _bench(  # noqa: ANN001
+    conn: AsyncConnection, name: str, model, base, depth: int, repeat: int
+) -> None:
+    """Time the page after *depth* pages of *base*, via OFFSET and via a cursor."""
+    offset_stmt = (
+        base.order_by(model.created_at.desc(), model.id.desc())
+        .offset(depth * PAGE_SIZE)
+        .limit(PAGE_SIZE)
+    )
+    boundary = (
+        await conn.execute(
+            base.with_only_columns(model.created_at, model.id)
+            .order_by(model.created_at.desc(), model.id.desc())
+            .offset(depth * PAGE_SIZE - 1)
+            .limit(1)
+        )
+    ).first()
+    if boundary is None:
+        print(f"{name:<16} fewer than {depth} pages, skipped")
+        return
+    keyset_stmt = keyset_page(base, model, encode_cursor(*boundary), PAGE_SIZE)
+
+    offset_ms = await _time(conn, offset_stmt, repeat)
+    keyset_ms = await _time(conn, keyset_stmt, repeat)
+    print(
+        f"{name:<16} page {depth + 1:>6}: "
+        f"OFFSET {offset_ms:9.2f} ms   keyset {keyset_ms:7.2f} ms"
+    )
+    compiled = keyset_stmt.compile(dialect=conn.dialect)
+    params = tuple(compiled.params[key] for key in compiled.positiontup)
+    plan = (await conn.exec_driver_sql(f"EXPLAIN {compiled}", params)).scalars().all()
+    print("    " + "\n    ".join(plan[:4]))
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(
+        get_config().database.url,
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    try:
+        async with engine.begin() as conn:
+            if not args.reuse:
+                print(f"Seeding {args.jobs} jobs over {args.voices} voices ...")
+                start = time.perf_counter()
+                await _seed(conn, args.jobs, args.voices)
+                print(f"  done in {time.perf_counter() - start:.1f}s")
+
+        async with engine.connect() as conn:
+            voice_id, user_id = (
+                await conn.execute(select(VoiceProfile.id, VoiceProfile.user_id).limit(1))
+            ).one()
+            cases = [
+                ("jobs (all)", SynthesisJob, select(SynthesisJob)),
+                (
+                    "jobs by status",
+                    SynthesisJob,
+                    select(SynthesisJob).where(
+                        SynthesisJob.status == SynthesisJobStatus.COMPLETED
+                    ),
+                ),
+                (
+                    "jobs by voice",
+                    SynthesisJob,
+                    select(SynthesisJob).where(SynthesisJob.voice_profile_id == voice_id),
+                ),
+                (
+                    "voices by user",
+                    VoiceProfile,
+                    select(VoiceProfile).where(VoiceProfile.user_id == user_id),
+                ),
+            ]
+            for name, model, base in cases:
+                for depth in (1, 100, args.depth):
+                    await _bench(conn, name, model, base, depth, args.repeat)
+    finally:
+        if not args.keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=1_000_000)
+    parser.add_argument("--voices", type=int, default=1_000)
+    parser.add_argument("--depth", type=int, default=5_000, help="deepest page to fetch")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded schema")
+    parser.add_argument("--reuse", action="store_true", help="skip seeding (after --keep)")
+    asyncio.run(main(parser.parse_args()))
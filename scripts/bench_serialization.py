@@ -0,0 +1,110 @@
+"""Benchmark the JSON serialisation cost of a ``GET /jobs`` page.
+
+Serialises one page of jobs with maximum-length (5000 character) Hindi
+input text, both as full ``SynthesisJobResponse`` objects (the listing
+before it was summarised) and as ``SynthesisJobSummary`` objects, three
+ways:
+
+* ``JSONResponse``   – ``jsonable_encoder`` + ``json.dumps``, what FastAPI
+  does for a route without a response model;
+* ``ORJSONResponse`` – ``jsonable_encoder`` + ``orjson`` (if installed),
+  what a custom ``default_response_class`` would do;
+* ``pydantic``       – ``TypeAdapter.dump_json``, FastAPI's default for a
+  route with a response model (see ``backend/main.py``)::
+
+    python scripts/bench_serialization.py --page-size 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter
+
+from backend.models import SynthesisJobStatus
+from backend.schemas import SynthesisJobResponse, SynthesisJobSummary
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+TEXT = ("नमस्ते, आज मौसम बहुत अच्छा है। " * 200)[:5000]
+
+
+def _jobs(n: int) -> list[SynthesisJobResponse]:
+    now = datetime.now(timezone.utc)
+    return [
+        SynthesisJobResponse(
+            id=uuid.uuid4(),
+            voice_profile_id=uuid.uuid4(),
+            engine_name="xtts-hindi",
+            input_text=TEXT,
+            params_json={"speed": 1.0, "temperature": 0.7, "language": "hi"},
+            status=SynthesisJobStatus.COMPLETED,
+            output_storage_key=f"outputs/{uuid.uuid4()}.wav",
+            created_at=now,
+            updated_at=now,
+        )
+        for _ in range(n)
+    ]
+
+
+def _summaries(jobs: list[SynthesisJobResponse]) -> list[SynthesisJobSummary]:
+    return [
+        SynthesisJobSummary(**job.model_dump(), input_preview=job.input_text[:80])
+        for job in jobs
+    ]
+
+
+def _serialisers(model: type[BaseModel]) -> dict[str, Callable[[list], bytes]]:
+    adapter = TypeAdapter(list[model])
+    serialisers = {
+        "JSONResponse": lambda items: json.dumps(
+            jsonable_encoder(items), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8"),
+        "pydantic": adapter.dump_json,
+    }
+    if orjson is not None:
+        serialisers["ORJSONResponse"] = lambda items: orjson.dumps(
+            jsonable_encoder(items), option=orjson.OPT_NON_STR_KEYS
+        )
+    return serialisers
+
+
+def _time(fn: Callable[[], bytes], repeat: int, number: int) -> float:
+    """Best-of-*repeat* time of one call, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best * 1e6
+
+
+def main(args: argparse.Namespace) -> None:
+    jobs = _jobs(args.page_size)
+    pages = {"full": jobs, "summary": _summaries(jobs)}
+    models = {"full": SynthesisJobResponse, "summary": SynthesisJobSummary}
+    print(f"One page of {args.page_size} jobs:")
+    print(f"{'projection':<10} {'serialiser':<15} {'µs/request':>12} {'KiB':>9}")
+    for projection, items in pages.items():
+        for name, serialise in _serialisers(models[projection]).items():
+            size = len(serialise(items)) / 1024
+            cost = _time(lambda: serialise(items), args.repeat, args.number)
+            print(f"{projection:<10} {name:<15} {cost:>12.1f} {size:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=50, help="calls per timing")
+    main(parser.parse_args())
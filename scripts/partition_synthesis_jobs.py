@@ -0,0 +1,88 @@
+"""Convert an existing, unpartitioned ``synthesis_jobs`` table to monthly partitions.
+
+Databases created before ``synthesis_jobs`` was partitioned (see
+``backend.partitions``) keep a plain table, which Postgres cannot
+partition in place.  This script, in one transaction, renames the old
+table, creates the partitioned one with a partition for every month
+that has jobs, copies the rows over and drops the old table::
+
+    python scripts/partition_synthesis_jobs.py            # dry run
+    python scripts/partition_synthesis_jobs.py --apply
+
+The copy takes an exclusive lock on the old table for its duration, so
+stop the API and workers first.  ``--keep-old`` keeps the old table as
+``synthesis_jobs_unpartitioned``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+
+from sqlalchemy import Connection, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend import partitions
+from backend.config import get_config
+from backend.models import SynthesisJob
+
+TABLE = SynthesisJob.__tablename__
+OLD = f"{TABLE}_unpartitioned"
+
+
+def _convert(conn: Connection, keep_old: bool) -> int:
+    is_partitioned = conn.execute(
+        text("SELECT relkind = 'p' FROM pg_class WHERE oid = CAST(:t AS regclass)"), {"t": TABLE}
+    ).scalar()
+    if is_partitioned:
+        print(f"{TABLE} is already partitioned")
+        return 0
+
+    conn.execute(text(f"LOCK TABLE {TABLE} IN ACCESS EXCLUSIVE MODE"))
+    oldest = conn.execute(text(f"SELECT min(created_at) FROM {TABLE}")).scalar()
+    conn.execute(text(f"ALTER TABLE {TABLE} RENAME TO {OLD}"))
+    conn.execute(text(f"ALTER TABLE {OLD} RENAME CONSTRAINT {TABLE}_pkey TO {OLD}_pkey"))
+    # The partitioned table's indexes take over the names.
+    for index in SynthesisJob.__table__.indexes:
+        conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+    # Also creates the upcoming partitions; checkfirst skips the existing enum type.
+    SynthesisJob.__table__.create(conn, checkfirst=True)
+    now = datetime.now(timezone.utc)
+    if oldest is not None:
+        created = partitions.ensure_partitions(
+            conn, TABLE, partitions.month_of(oldest), partitions.month_of(now)
+        )
+        print(f"Created {len(created)} partition(s) for past months")
+
+    columns = ", ".join(c.name for c in SynthesisJob.__table__.columns)
+    copied = conn.execute(
+        text(f"INSERT INTO {TABLE} ({columns}) SELECT {columns} FROM {OLD}")
+    ).rowcount
+    if not keep_old:
+        conn.execute(text(f"DROP TABLE {OLD}"))
+    return copied
+
+
+async def main(args: argparse.Namespace) -> None:
+    engine = create_async_engine(get_config().database.url)
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            copied = await conn.run_sync(_convert, args.keep_old)
+            if args.apply:
+                await transaction.commit()
+                print(f"Partitioned {TABLE}: {copied} row(s) copied")
+            else:
+                await transaction.rollback()
+                print(f"Dry run: {copied} row(s) would be copied (use --apply)")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apply", action="store_true", help="commit the conversion")
+    parser.add_argument("--keep-old", action="store_true", help=f"keep {OLD}")
+    asyncio.run(main(parser.parse_args()))
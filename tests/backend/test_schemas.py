@@ -1,7 +1,7 @@
 """Tests for Pydantic schemas."""
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -64,6 +64,17 @@ class TestSynthesisJobCreate:
         with pytest.raises(Exception):
             SynthesisJobCreate(voice_profile_id=uuid.uuid4(), text="")
 
+    def test_earlier_deadline_applies(self) -> None:
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        body = SynthesisJobCreate(
+            voice_profile_id=uuid.uuid4(),
+            text="Hi",
+            deadline=datetime(2026, 1, 1, 0, 0, 10),  # naive: read as UTC
+            max_wait_ms=5000,
+        )
+        assert body.deadline_at(now) == now + timedelta(seconds=5)
+        assert SynthesisJobCreate(voice_profile_id=uuid.uuid4(), text="Hi").deadline_at(now) is None
+
 
 class TestSynthesisJobResponse:
     def test_from_dict(self) -> None:
@@ -39,14 +39,17 @@ def prepare_voice(voice_profile_id: str, engine_name: str, sample_keys: list[str
 
     # TODO: Update VoiceProfile.status → PROCESSING in DB.
 
+    import asyncio
+
+    from backend.storage import download_file
+
     wav_paths: list[Path] = []
     for key in sample_keys:
-        # TODO: Download from object storage using backend.storage.download_file.
         logger.info("  downloading sample %s", key)
         fd, tmp = tempfile.mkstemp(suffix=".raw", prefix="vp_")
-        raw_path = Path(tmp)
-        raw_path.write_bytes(b"\x00" * 100)  # placeholder
         os.close(fd)
+        # Served from the worker-local disk cache when the sample was seen before.
+        raw_path = asyncio.run(download_file(key, Path(tmp)))
 
         # Convert to WAV via ffmpeg
         wav_path = raw_path.with_suffix(".wav")
@@ -76,8 +79,6 @@ def prepare_voice(voice_profile_id: str, engine_name: str, sample_keys: list[str
 
     adapter = get_engine_adapter(engine_name)
     # NOTE: EngineAdapter.prepare_voice is async; run it synchronously in the worker.
-    import asyncio
-
     embedding_ref = asyncio.run(
         adapter.prepare_voice(wav_paths)
     )